@@ -1,85 +1,145 @@
 """Application settings loaded from environment variables"""
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
-
-@dataclass
+# Snapshot the environment once at import; defaults below read from this
+_ENV = dict(os.environ)
+
+_MONGODB_URL = _ENV.get("MONGODB_URL", "mongodb://localhost:27017")
+_MONGODB_DB_NAME = _ENV.get("MONGODB_DB_NAME", "news_aggregator")
+_MONGODB_MAX_POOL_SIZE = int(_ENV.get("MONGODB_MAX_POOL_SIZE", "50"))
+_MONGODB_MIN_POOL_SIZE = int(_ENV.get("MONGODB_MIN_POOL_SIZE", "10"))
+_REDIS_URL = _ENV.get("REDIS_URL", "redis://localhost:6379/0")
+_REDIS_MAX_CONNECTIONS = int(_ENV.get("REDIS_MAX_CONNECTIONS", "20"))
+_NEWSAPI_KEY = _ENV.get("NEWSAPI_KEY", "")
+_FETCH_INTERVAL = int(_ENV.get("FETCH_INTERVAL", "15"))
+_SUMMARIZER_MODEL = _ENV.get("SUMMARIZER_MODEL", "t5-small")
+_USE_GPU = _ENV.get("USE_GPU", "false").lower() == "true"
+_SUMMARIZER_QUANTIZE = _ENV.get("SUMMARIZER_QUANTIZE", "true").lower() == "true"
+_SUMMARIZER_COMPILE = _ENV.get("SUMMARIZER_COMPILE", "false").lower() == "true"
+_EMBEDDING_MODEL = _ENV.get("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+_EMBEDDING_BACKEND = _ENV.get("EMBEDDING_BACKEND", "onnx")
+_USE_STATIC_EMBEDDINGS = _ENV.get("USE_STATIC_EMBEDDINGS", "true").lower() == "true"
+_STATIC_EMBEDDING_MODEL = _ENV.get("STATIC_EMBEDDING_MODEL", "minishlab/potion-base-8M")
+_API_HOST = _ENV.get("API_HOST", "0.0.0.0")
+_API_PORT = int(_ENV.get("API_PORT", "8000"))
+_CORS_ORIGINS = tuple(_ENV.get(
+    "CORS_ORIGINS", "http://localhost:3000,http://localhost:5173,http://localhost"
+).split(","))
+_RATE_LIMIT = _ENV.get("RATE_LIMIT", "100/minute")
+_LOG_LEVEL = _ENV.get("LOG_LEVEL", "INFO")
+_COMPRESSION_DICT_PATH = _ENV.get("COMPRESSION_DICT_PATH", "")
+_SEEN_FILTER_PATH = _ENV.get("SEEN_FILTER_PATH", "")
+
+_RSS_FEEDS = (
+    "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
+    "https://feeds.bbci.co.uk/news/rss.xml",
+    "https://rss.cnn.com/rss/edition.rss",
+    "https://www.theguardian.com/world/rss",
+    "https://feeds.reuters.com/reuters/topNews",
+)
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class DatabaseSettings:
-    url: str = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-    db_name: str = os.getenv("MONGODB_DB_NAME", "news_aggregator")
+    url: str = _MONGODB_URL
+    db_name: str = _MONGODB_DB_NAME
+    max_pool_size: int = _MONGODB_MAX_POOL_SIZE
+    min_pool_size: int = _MONGODB_MIN_POOL_SIZE
+    server_selection_timeout_ms: int = 3000
+    wait_queue_timeout_ms: int = 2000   # fail fast when every pooled connection is busy
+    socket_timeout_ms: int = 10000
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class RedisSettings:
-    url: str = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-    max_connections: int = int(os.getenv("REDIS_MAX_CONNECTIONS", "20"))
+    url: str = _REDIS_URL
+    max_connections: int = _REDIS_MAX_CONNECTIONS
     article_ttl: int = 3600       # 1 hour
     summary_ttl: int = 3600       # 1 hour
     cluster_ttl: int = 1800       # 30 minutes
     query_ttl: int = 900          # 15 minutes
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class FetcherSettings:
-    newsapi_key: str = os.getenv("NEWSAPI_KEY", "")
-    rss_feeds: List[str] = field(default_factory=lambda: [
-        "https://rss.nytimes.com/services/xml/rss/nyt/World.xml",
-        "https://feeds.bbci.co.uk/news/rss.xml",
-        "https://rss.cnn.com/rss/edition.rss",
-        "https://www.theguardian.com/world/rss",
-        "https://feeds.reuters.com/reuters/topNews",
-    ])
+    newsapi_key: str = _NEWSAPI_KEY
+    rss_feeds: List[str] = field(default_factory=lambda: list(_RSS_FEEDS))
     rate_limit: int = 10           # requests per second per source
     timeout: int = 10              # seconds
     max_retries: int = 3
     min_content_words: int = 100   # filter out short articles
-    fetch_interval_minutes: int = int(os.getenv("FETCH_INTERVAL", "15"))
+    fetch_interval_minutes: int = _FETCH_INTERVAL
+    seen_filter_path: str = _SEEN_FILTER_PATH   # persisted seen-URL Bloom filter, empty = in-memory
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class SummarizerSettings:
-    model_name: str = os.getenv("SUMMARIZER_MODEL", "t5-small")
+    model_name: str = _SUMMARIZER_MODEL
     max_summary_words: int = 150
     max_input_tokens: int = 512
     num_beams: int = 4
     batch_size: int = 8
-    use_gpu: bool = os.getenv("USE_GPU", "false").lower() == "true"
+    use_gpu: bool = _USE_GPU
+    quantize: bool = _SUMMARIZER_QUANTIZE   # INT8 dynamic quantization on CPU
+    compile: bool = _SUMMARIZER_COMPILE     # torch.compile the model forward (warmed at startup)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class ClustererSettings:
-    embedding_model: str = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    embedding_model: str = _EMBEDDING_MODEL
+    embedding_backend: str = _EMBEDDING_BACKEND   # "onnx" (INT8) or "torch" (FP32)
+    use_static_embeddings: bool = _USE_STATIC_EMBEDDINGS   # model2vec lookup instead of a transformer
+    static_embedding_model: str = _STATIC_EMBEDDING_MODEL
     min_cluster_size: int = 5
     min_samples: int = 3
     max_cluster_articles: int = 50
     similarity_threshold: float = 0.7
     recluster_interval_minutes: int = 60
+    use_gpu: bool = _USE_GPU
+
+
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
+class CompressorSettings:
+    level: int = 3
+    dict_path: str = _COMPRESSION_DICT_PATH   # trained zstd dictionary, empty = none
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False, match_args=False)
 class APISettings:
-    host: str = os.getenv("API_HOST", "0.0.0.0")
-    port: int = int(os.getenv("API_PORT", "8000"))
-    cors_origins: List[str] = field(default_factory=lambda: os.getenv(
-        "CORS_ORIGINS", "http://localhost:3000,http://localhost:5173,http://localhost"
-    ).split(","))
-    rate_limit: str = os.getenv("RATE_LIMIT", "100/minute")
-    log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    host: str = _API_HOST
+    port: int = _API_PORT
+    cors_origins: List[str] = field(default_factory=lambda: list(_CORS_ORIGINS))
+    rate_limit: str = _RATE_LIMIT
+    log_level: str = _LOG_LEVEL
 
 
-@dataclass
-class Settings:
-    database: DatabaseSettings = field(default_factory=DatabaseSettings)
-    redis: RedisSettings = field(default_factory=RedisSettings)
-    fetcher: FetcherSettings = field(default_factory=FetcherSettings)
-    summarizer: SummarizerSettings = field(default_factory=SummarizerSettings)
-    clusterer: ClustererSettings = field(default_factory=ClustererSettings)
-    api: APISettings = field(default_factory=APISettings)
+class Settings(NamedTuple):
+    database: DatabaseSettings = DatabaseSettings()
+    redis: RedisSettings = RedisSettings()
+    fetcher: FetcherSettings = FetcherSettings()
+    summarizer: SummarizerSettings = SummarizerSettings()
+    clusterer: ClustererSettings = ClustererSettings()
+    compressor: CompressorSettings = CompressorSettings()
+    api: APISettings = APISettings()
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings singleton"""
+    return Settings()
 
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
+
+# Cache TTLs hoisted for the hot API paths
+REDIS_ARTICLE_TTL = settings.redis.article_ttl
+REDIS_SUMMARY_TTL = settings.redis.summary_ttl
+REDIS_CLUSTER_TTL = settings.redis.cluster_ttl
+REDIS_QUERY_TTL = settings.redis.query_ttl
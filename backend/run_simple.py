@@ -8,16 +8,14 @@ import os
 # Ensure config is importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
-import logging
+from fastapi.responses import ORJSONResponse
 
 from src.api.routes import router
-from src.api.responses import ErrorResponse
+from src.api.compression import CompressionMiddleware
 from src.core.logger import setup_logger
-from src.core.exceptions import NewsAggregatorException
+from src.api.common import add_exception_handlers, root
 
 # Setup logger
 logger = setup_logger(name="news_aggregator", level="INFO")
@@ -40,93 +38,40 @@ app = FastAPI(
     title="News Article Aggregator API",
     description="API for news article aggregation, summarization, and clustering",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
-from config.settings import settings
+from config.settings import get_settings
+
+settings = get_settings()
+
+# Middleware parameters resolved once at import
+_CORS_ORIGINS = list(settings.api.cors_origins)
+_CORS_METHODS = ("GET", "POST")  # the only methods the API routes expose
+_COMPRESSION_MINIMUM_SIZE = 4096
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Allow all origins for development
+    allow_origins=_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_CORS_METHODS,
+    allow_headers=("*",),
 )
 
-# Add Gzip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add response compression middleware (zstd when accepted, gzip otherwise)
+app.add_middleware(CompressionMiddleware, minimum_size=_COMPRESSION_MINIMUM_SIZE)
 
 
 # Global exception handlers
-@app.exception_handler(NewsAggregatorException)
-async def application_exception_handler(request: Request, exc: NewsAggregatorException):
-    """Handle application-specific exceptions"""
-    logger.error(f"Application error: {str(exc)}", exc_info=True)
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/application-error",
-        title="Application Error",
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=str(exc),
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.dict()
-    )
-
-
-@app.exception_handler(ValueError)
-async def validation_exception_handler(request: Request, exc: ValueError):
-    """Handle validation errors"""
-    logger.warning(f"Validation error: {str(exc)}")
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/validation-error",
-        title="Validation Error",
-        status=status.HTTP_400_BAD_REQUEST,
-        detail=str(exc),
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.dict()
-    )
-
-
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """Handle unexpected exceptions"""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/internal-error",
-        title="Internal Server Error",
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="An unexpected error occurred",
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.dict()
-    )
+add_exception_handlers(app)
 
 
 # Include API routes
 app.include_router(router, prefix="/api/v1", tags=["articles"])
 
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "message": "News Article Aggregator API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
+app.get("/")(root)
 
 
 @app.on_event("startup")
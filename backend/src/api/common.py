@@ -0,0 +1,77 @@
+"""Error handlers and root endpoint shared by the full and simple app entry points"""
+import logging
+from datetime import datetime
+
+import orjson
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import ORJSONResponse
+
+from ..core.exceptions import NewsAggregatorException
+from ..core.logger import setup_logger
+
+logger = setup_logger(name="news_aggregator", level="INFO")
+
+# Immutable RFC 7807 fields per exception type: (type, title, status, log level, public detail)
+ERROR_TEMPLATES = {
+    NewsAggregatorException: (
+        "https://api.newsaggregator.com/errors/application-error",
+        "Application Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        logging.ERROR,
+        None,
+    ),
+    ValueError: (
+        "https://api.newsaggregator.com/errors/validation-error",
+        "Validation Error",
+        status.HTTP_400_BAD_REQUEST,
+        logging.WARNING,
+        None,
+    ),
+    Exception: (
+        "https://api.newsaggregator.com/errors/internal-error",
+        "Internal Server Error",
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        logging.ERROR,
+        "An unexpected error occurred",
+    ),
+}
+
+
+async def exception_handler(request: Request, exc: Exception):
+    """Handle application, validation and unexpected errors with a single dispatch"""
+    template = next(
+        ERROR_TEMPLATES[cls] for cls in type(exc).__mro__ if cls in ERROR_TEMPLATES
+    )
+    error_type, title, status_code, log_level, public_detail = template
+    logger.log(log_level, f"{title}: {str(exc)}", exc_info=log_level >= logging.ERROR)
+
+    return ORJSONResponse(
+        status_code=status_code,
+        content={
+            "type": error_type,
+            "title": title,
+            "status": status_code,
+            "detail": public_detail or str(exc),
+            "instance": str(request.url),
+            "timestamp": datetime.utcnow(),
+        },
+    )
+
+
+def add_exception_handlers(app: FastAPI) -> None:
+    """Register exception_handler for every exception type in ERROR_TEMPLATES"""
+    for exc_type in ERROR_TEMPLATES:
+        app.add_exception_handler(exc_type, exception_handler)
+
+
+# Root payload never changes, so it is serialized once at import
+ROOT_BYTES = orjson.dumps({
+    "message": "News Article Aggregator API",
+    "version": "1.0.0",
+    "docs": "/docs",
+})
+
+
+async def root():
+    """Root endpoint"""
+    return Response(content=ROOT_BYTES, media_type="application/json")
@@ -1,8 +1,7 @@
 """Standardized API response classes"""
 from typing import Any, Optional, Dict, List
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-import math
 
 
 class APIResponse(BaseModel):
@@ -10,44 +9,32 @@ class APIResponse(BaseModel):
     success: bool = True
     data: Optional[Any] = None
     message: Optional[str] = None
-    timestamp: datetime = None
-
-    def __init__(self, **data):
-        if 'timestamp' not in data or data['timestamp'] is None:
-            data['timestamp'] = datetime.utcnow()
-        super().__init__(**data)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
 
 class PaginatedResponse(BaseModel):
     """Paginated API response"""
     success: bool = True
     data: List[Any]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
     total_pages: int = 0
+    has_more: Optional[bool] = None
+    next_cursor: Optional[str] = None
     message: Optional[str] = None
-    timestamp: datetime = None
-
-    def __init__(self, **data):
-        if 'timestamp' not in data or data['timestamp'] is None:
-            data['timestamp'] = datetime.utcnow()
-        # Auto-calculate total_pages
-        total = data.get('total', 0)
-        page_size = data.get('page_size', 20)
-        if 'total_pages' not in data or data['total_pages'] == 0:
-            data['total_pages'] = max(1, math.ceil(total / page_size)) if page_size > 0 else 1
-        super().__init__(**data)
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    @model_validator(mode="after")
+    def _compute_total_pages(self) -> "PaginatedResponse":
+        """Auto-calculate total_pages and has_more when not supplied (needs total)"""
+        if self.total is None:
+            return self
+        if not self.total_pages:
+            self.total_pages = 1 if self.page_size <= 0 else max(1, (self.total + self.page_size - 1) // self.page_size)
+        if self.has_more is None:
+            self.has_more = self.page * self.page_size < self.total
+        return self
 
 
 class ErrorResponse(BaseModel):
@@ -57,14 +44,4 @@ class ErrorResponse(BaseModel):
     status: int
     detail: str
     instance: str
-    timestamp: datetime = None
-
-    def __init__(self, **data):
-        if 'timestamp' not in data or data['timestamp'] is None:
-            data['timestamp'] = datetime.utcnow()
-        super().__init__(**data)
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
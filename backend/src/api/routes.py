@@ -1,128 +1,293 @@
 """API routes with async handlers and caching"""
-from fastapi import APIRouter, HTTPException, Query, Path
-from typing import Optional
+from fastapi import APIRouter, Header, HTTPException, Query, Path, Response
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
 from datetime import datetime
+from functools import lru_cache
+import asyncio
+import base64
+import binascii
 import logging
+import operator
+
+import orjson
+
+from config.settings import (
+    REDIS_ARTICLE_TTL, REDIS_SUMMARY_TTL, REDIS_CLUSTER_TTL, REDIS_QUERY_TTL,
+)
 
 from .responses import APIResponse, PaginatedResponse, ErrorResponse
-from ..models.article import QueryFilters
+from ..models.article import QueryFilters, content_digest
 from ..core.exceptions import ArticleNotFoundError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Cache key builders, bound once to their format templates
+_QUERY_KEY = "query:%s:%s:%s:%s:%s:%d:%d:%d:%s".__mod__
+_ARTICLE_KEY = "article:%s".__mod__
+_SUMMARY_KEY = "summary:%s".__mod__
+_CLUSTER_ARTICLES_KEY = "cluster:%d:articles:%d:%d".__mod__
+
+
+# Static parts of the /health envelope
+_HEALTH_PREFIX = b'{"success":true,"data":{"status":"healthy","stats":'
+_HEALTH_SUFFIX = b'},"message":"News Article Aggregator API is running","timestamp":'
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 query date; repeated dashboard windows hit the cache"""
+    return datetime.fromisoformat(value)
+
+
+def _encode_cursor(row: dict) -> str:
+    """Opaque keyset cursor for the page after the given (last) list row"""
+    raw = f"{row['published_date'].isoformat()}|{row['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """(published_date, id) from _encode_cursor; ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValueError(str(e)) from e
+    date_part, sep, article_id = raw.partition("|")
+    if not sep:
+        raise ValueError("missing article id")
+    return datetime.fromisoformat(date_part), article_id
+
+
+def _json_response(payload: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response without re-encoding"""
+    return Response(content=payload, media_type="application/json")
+
+
+def _etag(payload: bytes) -> str:
+    """Strong ETag for a serialized response body"""
+    return '"%s"' % content_digest(payload)[:16]
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match check: "*" or any listed tag, compared weakly (a W/ prefix
+    is ignored), as RFC 9110 specifies for conditional GETs
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _cached_response(payload: bytes, etag: str, if_none_match: Optional[str]) -> Response:
+    """Serve cached JSON with its ETag, or 304 when the client already holds it"""
+    headers = {"ETag": etag}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+
+_ARTICLE_LIST_FIELDS = (
+    "id", "title", "summary", "source", "author", "published_date", "url", "cluster_id",
+)
+_get_article_list_fields = operator.attrgetter(*_ARTICLE_LIST_FIELDS)
+
+
+def _articles_to_payload(articles) -> list:
+    """Convert articles to list-endpoint rows; datetimes are left for orjson to encode"""
+    rows = [dict(zip(_ARTICLE_LIST_FIELDS, _get_article_list_fields(a))) for a in articles]
+    return _list_rows(rows)
+
+
+def _list_rows(rows: list) -> list:
+    """Normalize list-endpoint rows in place (a missing summary renders as empty)"""
+    for row in rows:
+        if row["summary"] is None:
+            row["summary"] = ""
+    return rows
+
+
+# Cache keys whose miss is currently being computed, so concurrent requests share it
+_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+_T = TypeVar("_T")
+
+
+class _LeaderCancelled(Exception):
+    """The request computing a coalesced result was cancelled before finishing"""
+
+
+async def _coalesce(cache_key: str, build: Callable[[], Awaitable[_T]]) -> _T:
+    """Run build() once per cache key; concurrent misses await the same result"""
+    while (future := _INFLIGHT.get(cache_key)) is not None:
+        try:
+            return await asyncio.shield(future)
+        except _LeaderCancelled:
+            continue  # compute it ourselves, or join whichever waiter got there first
+
+    future = asyncio.get_running_loop().create_future()
+    _INFLIGHT[cache_key] = future
+    try:
+        payload = await build()
+    except asyncio.CancelledError:
+        # Not future.cancel(): that would cancel every waiter along with this request
+        future.set_exception(_LeaderCancelled(cache_key))
+        future.exception()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        future.exception()  # mark retrieved when nobody else is waiting
+        raise
+    else:
+        future.set_result(payload)
+        return payload
+    finally:
+        _INFLIGHT.pop(cache_key, None)
+
+
+# Resolved on first use; ..main imports this module so it cannot be bound at import
+_pipeline_getter = None
+
 
 def _get_pipeline():
     """Get the global pipeline instance"""
-    from ..main import get_pipeline
-    return get_pipeline()
+    global _pipeline_getter
+    if _pipeline_getter is None:
+        from ..main import get_pipeline
+        _pipeline_getter = get_pipeline
+    return _pipeline_getter()
 
 
 # Health check endpoint
-@router.get("/health")
+@router.get("/health", response_model=APIResponse)
 async def health_check():
     """Health check endpoint"""
     pipeline = _get_pipeline()
     stats = await pipeline.get_stats()
 
-    return APIResponse(
-        data={
-            "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
-            "stats": stats,
-        },
-        message="News Article Aggregator API is running"
-    ).dict()
+    # Only the stats and timestamps vary; the rest of the envelope is static bytes
+    return _json_response(b"".join((
+        _HEALTH_PREFIX,
+        orjson.dumps(stats),
+        b',"timestamp":',
+        orjson.dumps(datetime.now().isoformat()),
+        _HEALTH_SUFFIX,
+        orjson.dumps(datetime.utcnow()),
+        b"}",
+    )))
 
 
 # Get articles with filtering and pagination
-@router.get("/articles")
+@router.get("/articles", response_model=PaginatedResponse)
 async def get_articles(
     source: Optional[str] = Query(None, description="Filter by source"),
     date_from: Optional[str] = Query(None, description="Filter from date (ISO format)"),
     date_to: Optional[str] = Query(None, description="Filter to date (ISO format)"),
-    search: Optional[str] = Query(None, description="Search text in titles"),
+    search: Optional[str] = Query(
+        None, description="Words to search for in titles and summaries (any word matches)"
+    ),
     cluster_id: Optional[int] = Query(None, description="Filter by cluster"),
     page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(20, ge=1, le=100, description="Items per page")
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    include_total: bool = Query(True, description="Count all matches; false returns only has_more"),
+    after: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
 ):
     """
     Get articles with filtering and pagination.
     Async handler with caching and proper error handling.
+    With include_total=false the match count is skipped and only has_more is set.
+    Passing a previous page's next_cursor as after continues from there without
+    skipping over earlier matches (page then counts from the cursor, no total).
     """
     pipeline = _get_pipeline()
 
     try:
         # Build cache key
-        cache_key = f"query:{source}:{date_from}:{date_to}:{search}:{cluster_id}:{page}:{page_size}"
+        cache_key = _QUERY_KEY((source, date_from, date_to, search, cluster_id, page, page_size, include_total, after))
 
         # Try cache first
-        cached = await pipeline.cache.get(cache_key)
+        cached = await pipeline.cache.get_bytes(cache_key)
         if cached:
-            return cached
-
-        # Parse dates
-        parsed_date_from = None
-        parsed_date_to = None
-
-        if date_from:
-            try:
-                parsed_date_from = datetime.fromisoformat(date_from)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid date_from format: {date_from}. Use ISO 8601 format."
+            return _cached_response(*cached, if_none_match)
+
+        async def _build() -> Tuple[bytes, str]:
+            # Parse dates
+            parsed_date_from = None
+            parsed_date_to = None
+
+            if date_from:
+                try:
+                    parsed_date_from = _parse_iso(date_from)
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid date_from format: {date_from}. Use ISO 8601 format."
+                    )
+
+            if date_to:
+                try:
+                    parsed_date_to = _parse_iso(date_to)
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid date_to format: {date_to}. Use ISO 8601 format."
+                    )
+
+            after_date = after_id = None
+            if after:
+                try:
+                    after_date, after_id = _decode_cursor(after)
+                except ValueError:
+                    raise HTTPException(status_code=400, detail=f"Invalid cursor: {after}")
+
+            # Build filters
+            filters = QueryFilters(
+                source=source,
+                date_from=parsed_date_from,
+                date_to=parsed_date_to,
+                cluster_id=cluster_id,
+                search_text=search,
+            )
+
+            # Query articles; infinite-scroll clients skip the count over all matches
+            if include_total and not after:
+                rows, total = await pipeline.store.query_article_rows(
+                    filters, page, page_size, fields=_ARTICLE_LIST_FIELDS
                 )
-
-        if date_to:
-            try:
-                parsed_date_to = datetime.fromisoformat(date_to)
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid date_to format: {date_to}. Use ISO 8601 format."
+                articles_data = _list_rows(rows)
+                has_more = page * page_size < total
+                message = f"Found {total} articles"
+            else:
+                articles, has_more = await pipeline.store.query_articles_page(
+                    filters, page, page_size, after_date=after_date, after_id=after_id
                 )
-
-        # Build filters
-        filters = QueryFilters(
-            source=source,
-            date_from=parsed_date_from,
-            date_to=parsed_date_to,
-            cluster_id=cluster_id,
-            search_text=search,
-        )
-
-        # Query articles
-        articles, total = await pipeline.store.query_articles(filters, page, page_size)
-
-        # Format response
-        articles_data = [
-            {
-                "id": a.id,
-                "title": a.title,
-                "summary": a.summary or "",
-                "source": a.source,
-                "author": a.author,
-                "published_date": a.published_date.isoformat() if a.published_date else None,
-                "url": a.url,
-                "cluster_id": a.cluster_id,
-            }
-            for a in articles
-        ]
-
-        response = PaginatedResponse(
-            data=articles_data,
-            total=total,
-            page=page,
-            page_size=page_size,
-            message=f"Found {total} articles"
-        ).dict()
-
-        # Cache response for 15 minutes
-        await pipeline.cache.set(cache_key, response, ttl=900)
-
-        return response
+                articles_data = _articles_to_payload(articles)
+                total = None
+                message = f"Returned {len(articles)} articles"
+
+            response = PaginatedResponse(
+                data=articles_data,
+                total=total,
+                page=page,
+                page_size=page_size,
+                has_more=has_more,
+                next_cursor=_encode_cursor(articles_data[-1]) if has_more and articles_data else None,
+                message=message,
+            )
+
+            # Cache response for 15 minutes
+            payload = orjson.dumps(response.model_dump())
+            etag = _etag(payload)
+            await pipeline.cache.set_bytes(cache_key, payload, etag, ttl=REDIS_QUERY_TTL)
+            return payload, etag
+
+        payload, etag = await _coalesce(cache_key, _build)
+        return _cached_response(payload, etag, if_none_match)
 
     except HTTPException:
         raise
@@ -134,50 +299,57 @@ async def get_articles(
 
 
 # Get a specific article by ID
-@router.get("/articles/{article_id}")
+@router.get("/articles/{article_id}", response_model=APIResponse)
 async def get_article(
-    article_id: str = Path(..., description="Article ID")
+    article_id: str = Path(..., description="Article ID"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
 ):
     """Get a specific article by ID"""
     pipeline = _get_pipeline()
 
     try:
         # Try cache
-        cache_key = f"article:{article_id}"
-        cached = await pipeline.cache.get(cache_key)
+        cache_key = _ARTICLE_KEY(article_id)
+        cached = await pipeline.cache.get_bytes(cache_key)
         if cached:
-            return cached
+            return _cached_response(*cached, if_none_match)
 
-        article = await pipeline.store.get_article(article_id)
+        async def _build() -> Tuple[bytes, str]:
+            article = await pipeline.store.get_article(article_id)
 
-        # Decompress content
-        content = ""
-        try:
-            content = pipeline.compressor.decompress(article.compressed_content)
-        except Exception:
-            content = "(Content unavailable)"
-
-        article_data = {
-            "id": article.id,
-            "title": article.title,
-            "content": content,
-            "summary": article.summary or "",
-            "source": article.source,
-            "author": article.author,
-            "published_date": article.published_date.isoformat() if article.published_date else None,
-            "fetched_date": article.fetched_date.isoformat() if article.fetched_date else None,
-            "url": article.url,
-            "cluster_id": article.cluster_id,
-        }
-
-        response = APIResponse(
-            data=article_data,
-            message="Article retrieved successfully"
-        ).dict()
-
-        # Cache for 1 hour
-        await pipeline.cache.set(cache_key, response, ttl=3600)
-        return response
+            # Decompress content
+            content = ""
+            try:
+                content = pipeline.compressor.decompress(article.compressed_content)
+            except Exception:
+                content = "(Content unavailable)"
+
+            article_data = {
+                "id": article.id,
+                "title": article.title,
+                "content": content,
+                "summary": article.summary or "",
+                "source": article.source,
+                "author": article.author,
+                "published_date": article.published_date,
+                "fetched_date": article.fetched_date,
+                "url": article.url,
+                "cluster_id": article.cluster_id,
+            }
+
+            response = APIResponse(
+                data=article_data,
+                message="Article retrieved successfully"
+            )
+
+            # Cache for 1 hour
+            payload = orjson.dumps(response.model_dump())
+            etag = _etag(payload)
+            await pipeline.cache.set_bytes(cache_key, payload, etag, ttl=REDIS_ARTICLE_TTL)
+            return payload, etag
+
+        payload, etag = await _coalesce(cache_key, _build)
+        return _cached_response(payload, etag, if_none_match)
 
     except ArticleNotFoundError:
         raise HTTPException(status_code=404, detail=f"Article {article_id} not found")
@@ -187,46 +359,53 @@ async def get_article(
 
 
 # Get article summary
-@router.get("/articles/{article_id}/summary")
+@router.get("/articles/{article_id}/summary", response_model=APIResponse)
 async def get_article_summary(
-    article_id: str = Path(..., description="Article ID")
+    article_id: str = Path(..., description="Article ID"),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
 ):
     """Get article summary - generates on-demand if not cached"""
     pipeline = _get_pipeline()
 
     try:
         # Try cache
-        cache_key = f"summary:{article_id}"
-        cached = await pipeline.cache.get(cache_key)
+        cache_key = _SUMMARY_KEY(article_id)
+        cached = await pipeline.cache.get_bytes(cache_key)
         if cached:
-            return cached
-
-        article = await pipeline.store.get_article(article_id)
-
-        # If no summary, generate one on the fly
-        summary = article.summary
-        if not summary:
-            try:
-                content = pipeline.compressor.decompress(article.compressed_content)
-                summary = pipeline.summarizer.summarize(content)
-                article.summary = summary
-                await pipeline.store.save_article(article)
-            except Exception as e:
-                logger.warning(f"On-demand summarization failed: {e}")
-                summary = "(Summary unavailable)"
-
-        response = APIResponse(
-            data={
-                "article_id": article.id,
-                "title": article.title,
-                "summary": summary,
-            },
-            message="Summary retrieved successfully"
-        ).dict()
-
-        # Cache for 1 hour
-        await pipeline.cache.set(cache_key, response, ttl=3600)
-        return response
+            return _cached_response(*cached, if_none_match)
+
+        async def _build() -> Tuple[bytes, str]:
+            article = await pipeline.store.get_article(article_id)
+
+            # If no summary, generate one on the fly
+            summary = article.summary
+            if not summary:
+                try:
+                    content = pipeline.compressor.decompress(article.compressed_content)
+                    summary = await pipeline.summarizer.asummarize(content)
+                    article.summary = summary
+                    await pipeline.store.save_article(article)
+                except Exception as e:
+                    logger.warning(f"On-demand summarization failed: {e}")
+                    summary = "(Summary unavailable)"
+
+            response = APIResponse(
+                data={
+                    "article_id": article.id,
+                    "title": article.title,
+                    "summary": summary,
+                },
+                message="Summary retrieved successfully"
+            )
+
+            # Cache for 1 hour
+            payload = orjson.dumps(response.model_dump())
+            etag = _etag(payload)
+            await pipeline.cache.set_bytes(cache_key, payload, etag, ttl=REDIS_SUMMARY_TTL)
+            return payload, etag
+
+        payload, etag = await _coalesce(cache_key, _build)
+        return _cached_response(payload, etag, if_none_match)
 
     except ArticleNotFoundError:
         raise HTTPException(status_code=404, detail=f"Article {article_id} not found")
@@ -236,39 +415,47 @@ async def get_article_summary(
 
 
 # Get all topic clusters
-@router.get("/clusters")
-async def get_clusters():
+@router.get("/clusters", response_model=APIResponse)
+async def get_clusters(
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
+):
     """Get all topic clusters"""
     pipeline = _get_pipeline()
 
     try:
         # Try cache
         cache_key = "clusters:all"
-        cached = await pipeline.cache.get(cache_key)
+        cached = await pipeline.cache.get_bytes(cache_key)
         if cached:
-            return cached
-
-        clusters = pipeline.clusterer.get_all_clusters()
-
-        clusters_data = [
-            {
-                "id": c.id,
-                "label": c.label,
-                "article_count": c.article_count,
-                "created_at": c.created_at.isoformat() if c.created_at else None,
-                "updated_at": c.updated_at.isoformat() if c.updated_at else None,
-            }
-            for c in clusters
-        ]
-
-        response = APIResponse(
-            data=clusters_data,
-            message=f"Found {len(clusters_data)} clusters"
-        ).dict()
-
-        # Cache for 30 minutes
-        await pipeline.cache.set(cache_key, response, ttl=1800)
-        return response
+            return _cached_response(*cached, if_none_match)
+
+        async def _build() -> Tuple[bytes, str]:
+            clusters = pipeline.clusterer.get_all_clusters()
+
+            clusters_data = [
+                {
+                    "id": c.id,
+                    "label": c.label,
+                    "article_count": c.article_count,
+                    "created_at": c.created_at,
+                    "updated_at": c.updated_at,
+                }
+                for c in clusters
+            ]
+
+            response = APIResponse(
+                data=clusters_data,
+                message=f"Found {len(clusters_data)} clusters"
+            )
+
+            # Cache for 30 minutes
+            payload = orjson.dumps(response.model_dump())
+            etag = _etag(payload)
+            await pipeline.cache.set_bytes(cache_key, payload, etag, ttl=REDIS_CLUSTER_TTL)
+            return payload, etag
+
+        payload, etag = await _coalesce(cache_key, _build)
+        return _cached_response(payload, etag, if_none_match)
 
     except Exception as e:
         logger.error(f"Error fetching clusters: {str(e)}", exc_info=True)
@@ -276,56 +463,52 @@ async def get_clusters():
 
 
 # Get articles in a specific cluster
-@router.get("/clusters/{cluster_id}/articles")
+@router.get("/clusters/{cluster_id}/articles", response_model=PaginatedResponse)
 async def get_cluster_articles(
     cluster_id: int = Path(..., description="Cluster ID"),
     page: int = Query(1, ge=1),
-    page_size: int = Query(20, ge=1, le=100)
+    page_size: int = Query(20, ge=1, le=100),
+    if_none_match: Optional[str] = Header(None, include_in_schema=False),
 ):
     """Get articles in a specific cluster"""
     pipeline = _get_pipeline()
 
     try:
         # Try cache
-        cache_key = f"cluster:{cluster_id}:articles:{page}:{page_size}"
-        cached = await pipeline.cache.get(cache_key)
+        cache_key = _CLUSTER_ARTICLES_KEY((cluster_id, page, page_size))
+        cached = await pipeline.cache.get_bytes(cache_key)
         if cached:
-            return cached
-
-        # Check cluster exists
-        cluster = pipeline.clusterer.get_cluster(cluster_id)
-        if not cluster:
-            raise HTTPException(status_code=404, detail=f"Cluster {cluster_id} not found")
-
-        # Get articles using filters
-        filters = QueryFilters(cluster_id=cluster_id)
-        articles, total = await pipeline.store.query_articles(filters, page, page_size)
-
-        articles_data = [
-            {
-                "id": a.id,
-                "title": a.title,
-                "summary": a.summary or "",
-                "source": a.source,
-                "author": a.author,
-                "published_date": a.published_date.isoformat() if a.published_date else None,
-                "url": a.url,
-                "cluster_id": a.cluster_id,
-            }
-            for a in articles
-        ]
-
-        response = PaginatedResponse(
-            data=articles_data,
-            total=total,
-            page=page,
-            page_size=page_size,
-            message=f"Found {total} articles in cluster '{cluster.label}'"
-        ).dict()
-
-        # Cache for 30 minutes
-        await pipeline.cache.set(cache_key, response, ttl=1800)
-        return response
+            return _cached_response(*cached, if_none_match)
+
+        async def _build() -> Tuple[bytes, str]:
+            # Check cluster exists
+            cluster = pipeline.clusterer.get_cluster(cluster_id)
+            if not cluster:
+                raise HTTPException(status_code=404, detail=f"Cluster {cluster_id} not found")
+
+            # Get articles using filters
+            filters = QueryFilters(cluster_id=cluster_id)
+            rows, total = await pipeline.store.query_article_rows(
+                filters, page, page_size, fields=_ARTICLE_LIST_FIELDS
+            )
+            articles_data = _list_rows(rows)
+
+            response = PaginatedResponse(
+                data=articles_data,
+                total=total,
+                page=page,
+                page_size=page_size,
+                message=f"Found {total} articles in cluster '{cluster.label}'"
+            )
+
+            # Cache for 30 minutes
+            payload = orjson.dumps(response.model_dump())
+            etag = _etag(payload)
+            await pipeline.cache.set_bytes(cache_key, payload, etag, ttl=REDIS_CLUSTER_TTL)
+            return payload, etag
+
+        payload, etag = await _coalesce(cache_key, _build)
+        return _cached_response(payload, etag, if_none_match)
 
     except HTTPException:
         raise
@@ -335,7 +518,7 @@ async def get_cluster_articles(
 
 
 # Trigger manual article fetch (admin endpoint)
-@router.post("/articles/fetch")
+@router.post("/articles/fetch", response_model=APIResponse)
 async def trigger_fetch(
     count: int = Query(20, ge=1, le=100, description="Number of articles to fetch")
 ):
@@ -352,7 +535,7 @@ async def trigger_fetch(
         return APIResponse(
             data=results,
             message=f"Fetch complete: {results['stored']} articles processed"
-        ).dict()
+        )
 
     except Exception as e:
         logger.error(f"Manual fetch failed: {str(e)}", exc_info=True)
@@ -363,7 +546,7 @@ async def trigger_fetch(
 
 
 # Get system stats
-@router.get("/stats")
+@router.get("/stats", response_model=APIResponse)
 async def get_stats():
     """Get system statistics"""
     pipeline = _get_pipeline()
@@ -373,7 +556,7 @@ async def get_stats():
         return APIResponse(
             data=stats,
             message="System statistics"
-        ).dict()
+        )
     except Exception as e:
         logger.error(f"Error getting stats: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,6 +1,7 @@
 """Global error handling utilities"""
 import functools
 import asyncio
+import os
 import time
 import logging
 from typing import Callable, Any
@@ -8,6 +9,9 @@ from .exceptions import NewsAggregatorException
 
 logger = logging.getLogger(__name__)
 
+# Read once at import; set NEWSAGG_ERROR_WRAP=0 to leave handle_errors targets unwrapped
+_HANDLE_ERRORS_ENABLED = os.environ.get("NEWSAGG_ERROR_WRAP", "1") != "0"
+
 
 def retry_with_backoff(
     max_retries: int = 3,
@@ -24,60 +28,64 @@ def retry_with_backoff(
         backoff_factor: Multiplier for delay after each retry
         exceptions: Tuple of exceptions to catch and retry
     """
+    attempts = range(max_retries + 1)
+
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs) -> Any:
-            delay = initial_delay
-            last_exception = None
+        name = func.__name__
 
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {str(e)}. "
-                            f"Retrying in {delay}s..."
-                        )
-                        await asyncio.sleep(delay)  # Non-blocking async sleep
-                        delay *= backoff_factor
-                    else:
-                        logger.error(
-                            f"All {max_retries} retry attempts failed for {func.__name__}: {str(e)}"
-                        )
+        # Only build the wrapper matching the function type
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                delay = initial_delay
+                last_exception = None
 
-            raise last_exception
+                for attempt in attempts:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        last_exception = e
+                        if attempt < max_retries:
+                            logger.warning(
+                                f"Attempt {attempt + 1}/{max_retries} failed for {name}: {str(e)}. "
+                                f"Retrying in {delay}s..."
+                            )
+                            await asyncio.sleep(delay)  # Non-blocking async sleep
+                            delay *= backoff_factor
+                        else:
+                            logger.error(
+                                f"All {max_retries} retry attempts failed for {name}: {str(e)}"
+                            )
+
+                raise last_exception
+
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs) -> Any:
             delay = initial_delay
             last_exception = None
 
-            for attempt in range(max_retries + 1):
+            for attempt in attempts:
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
                     if attempt < max_retries:
                         logger.warning(
-                            f"Attempt {attempt + 1}/{max_retries} failed for {func.__name__}: {str(e)}. "
+                            f"Attempt {attempt + 1}/{max_retries} failed for {name}: {str(e)}. "
                             f"Retrying in {delay}s..."
                         )
                         time.sleep(delay)
                         delay *= backoff_factor
                     else:
                         logger.error(
-                            f"All {max_retries} retry attempts failed for {func.__name__}: {str(e)}"
+                            f"All {max_retries} retry attempts failed for {name}: {str(e)}"
                         )
 
             raise last_exception
 
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -86,30 +94,37 @@ def handle_errors(func: Callable) -> Callable:
     """
     Decorator for standardized error handling and logging.
     Supports both sync and async functions.
+    Returns the function unchanged when NEWSAGG_ERROR_WRAP=0.
     """
-    @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs) -> Any:
-        try:
-            return await func(*args, **kwargs)
-        except NewsAggregatorException as e:
-            logger.error(f"Application error in {func.__name__}: {str(e)}", exc_info=True)
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}", exc_info=True)
-            raise
+    if not _HANDLE_ERRORS_ENABLED:
+        return func
+
+    name = func.__name__
+
+    # Only build the wrapper matching the function type
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs) -> Any:
+            try:
+                return await func(*args, **kwargs)
+            except NewsAggregatorException as e:
+                logger.error(f"Application error in {name}: {str(e)}", exc_info=True)
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error in {name}: {str(e)}", exc_info=True)
+                raise
+
+        return async_wrapper
 
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs) -> Any:
         try:
             return func(*args, **kwargs)
         except NewsAggregatorException as e:
-            logger.error(f"Application error in {func.__name__}: {str(e)}", exc_info=True)
+            logger.error(f"Application error in {name}: {str(e)}", exc_info=True)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error in {func.__name__}: {str(e)}", exc_info=True)
+            logger.error(f"Unexpected error in {name}: {str(e)}", exc_info=True)
             raise
 
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
-    else:
-        return sync_wrapper
+    return sync_wrapper
@@ -1,21 +1,25 @@
 """Structured logging configuration"""
 import logging
-import json
 import sys
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict
 from pathlib import Path
 
+import orjson
+
+_JSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging"""
     
     def format(self, record: logging.LogRecord) -> str:
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
             "level": record.levelname,
             "logger": record.name,
-            "message": record.getMessage(),
+            "message": record.getMessage() if record.args else str(record.msg),
             "module": record.module,
             "function": record.funcName,
             "line": record.lineno,
@@ -29,16 +33,18 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
         
-        return json.dumps(log_data)
+        return orjson.dumps(log_data, default=str, option=_JSON_OPTIONS).decode()
 
 
+@lru_cache(maxsize=None)
 def setup_logger(
     name: str = "news_aggregator",
     level: str = "INFO",
     log_file: str = None
 ) -> logging.Logger:
     """
-    Set up structured logger with JSON formatting
+    Set up structured logger with JSON formatting.
+    Cached per (name, level, log_file) so repeat calls don't rebuild handlers.
     
     Args:
         name: Logger name
@@ -71,27 +77,22 @@ def setup_logger(
     return logger
 
 
-class LogContext:
-    """Context manager for adding extra fields to logs"""
+class LogContext(logging.LoggerAdapter):
+    """Context manager for adding extra fields to logs emitted through it"""
     
     def __init__(self, logger: logging.Logger, **kwargs):
-        self.logger = logger
+        super().__init__(logger, kwargs)
         self.extra_fields = kwargs
-        self.old_factory = None
+    
+    def process(self, msg, kwargs):
+        kwargs.setdefault("extra", {})["extra_fields"] = self.extra_fields
+        return msg, kwargs
     
     def __enter__(self):
-        self.old_factory = logging.getLogRecordFactory()
-        
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            record.extra_fields = self.extra_fields
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        logging.setLogRecordFactory(self.old_factory)
+        return None
 
 
 # Default logger instance
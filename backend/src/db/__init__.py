@@ -12,11 +12,18 @@ _database = None
 
 
 async def get_client():
-    """Get or create the async MongoDB client"""
+    """Get or create the process-wide async MongoDB client (shared connection pool)"""
     global _client
     if _client is None:
         from motor.motor_asyncio import AsyncIOMotorClient
-        _client = AsyncIOMotorClient(settings.database.url)
+        _client = AsyncIOMotorClient(
+            settings.database.url,
+            maxPoolSize=settings.database.max_pool_size,
+            minPoolSize=settings.database.min_pool_size,
+            serverSelectionTimeoutMS=settings.database.server_selection_timeout_ms,
+            waitQueueTimeoutMS=settings.database.wait_queue_timeout_ms,
+            socketTimeoutMS=settings.database.socket_timeout_ms,
+        )
         logger.info("MongoDB client created")
     return _client
 
@@ -35,17 +42,33 @@ async def init_db():
     """Initialize database - create indexes for articles and clusters collections"""
     db = await get_db()
 
-    # Create articles collection indexes
+    from pymongo import IndexModel, ASCENDING, DESCENDING, TEXT
+
+    # Create articles collection indexes in a single round-trip
     articles = db["articles"]
-    await articles.create_index("url", unique=True)
-    await articles.create_index("content_hash", unique=True)
-    await articles.create_index("published_date")
-    await articles.create_index("source")
-    await articles.create_index("cluster_id")
+    await articles.create_indexes([
+        IndexModel([("url", ASCENDING)], unique=True),
+        IndexModel([("content_hash", ASCENDING)], unique=True),
+        IndexModel([("published_date", ASCENDING)]),
+        # Newest-first keyset pagination with the id tiebreak
+        IndexModel([("published_date", DESCENDING), ("id", ASCENDING)]),
+        # Compound indexes match the QueryFilters shapes and the newest-first sort;
+        # their prefixes also serve plain source / cluster_id lookups
+        IndexModel([("source", ASCENDING), ("published_date", DESCENDING)]),
+        IndexModel([("cluster_id", ASCENDING), ("published_date", DESCENDING)]),
+        # Text index backing QueryFilters.search_text
+        IndexModel(
+            [("title", TEXT), ("summary", TEXT)],
+            name="text_search",
+            weights={"title": 10, "summary": 3},
+        ),
+    ])
 
     # Create clusters collection indexes
     clusters = db["clusters"]
-    await clusters.create_index("label")
+    await clusters.create_indexes([
+        IndexModel([("label", ASCENDING)]),
+    ])
 
     logger.info("MongoDB indexes created successfully")
 
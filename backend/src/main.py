@@ -5,64 +5,101 @@ import os
 # Ensure config is importable
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
-import logging
+import asyncio
+import concurrent.futures
+import contextlib
+import importlib
+import threading
 
 from .api.routes import router
-from .api.responses import ErrorResponse
+from .api.compression import CompressionMiddleware
 from .core.logger import setup_logger
-from .core.exceptions import NewsAggregatorException
+from .api.common import add_exception_handlers, root
 
 # Setup logger
 logger = setup_logger(name="news_aggregator", level="INFO")
 
 # Global pipeline instance
 _pipeline = None
+_pipeline_lock = threading.Lock()
 
 
 def get_pipeline():
     """Get or create the global pipeline instance"""
     global _pipeline
     if _pipeline is None:
-        from .services.pipeline import Pipeline
-        _pipeline = Pipeline()
+        with _pipeline_lock:
+            if _pipeline is None:
+                from .services.pipeline import Pipeline
+                _pipeline = Pipeline()
     return _pipeline
 
 
+# Modules whose first import is slow (the ML stack behind the pipeline)
+_WARM_IMPORTS = (".services.pipeline", "torch", "transformers", "sentence_transformers")
+
+
+def _warm_import(name: str) -> None:
+    """Import a module ahead of first use; optional ones that fail are skipped"""
+    try:
+        importlib.import_module(name, __package__)
+    except Exception as e:
+        logger.debug(f"Skipped warming {name}: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # ---- STARTUP ----
     logger.info("Starting News Article Aggregator API")
 
-    # Initialize database
-    try:
-        from .db import init_db
-        await init_db()
-        logger.info("Database initialized")
-    except Exception as e:
-        logger.warning(f"Database initialization failed (will use in-memory): {e}")
+    # Initialize database (also opens the shared MongoDB pool before any traffic)
+    async def init_database():
+        try:
+            from .db import init_db
+            await init_db()
+            logger.info("Database initialized")
+        except Exception as e:
+            logger.warning(f"Database initialization failed (will use in-memory): {e}")
+
+    # Warm slow imports in threads while the database connects
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=len(_WARM_IMPORTS), thread_name_prefix="warm-import"
+    ) as executor:
+        await asyncio.gather(
+            init_database(),
+            *(loop.run_in_executor(executor, _warm_import, name) for name in _WARM_IMPORTS),
+        )
 
     # Initialize pipeline (lazy-loads ML models on first use)
     pipeline = get_pipeline()
+    with contextlib.suppress(Exception):
+        await pipeline.store.ensure_collection()
     logger.info("Pipeline initialized")
 
     # Run initial article fetch in background
-    import asyncio
-
     async def initial_fetch():
         try:
             await asyncio.sleep(2)  # Give the server time to start
+            # One-time rewrites of legacy embeddings, dates and content hashes; no-ops once done
+            await pipeline.store.migrate_embeddings()
+            await pipeline.store.migrate_dates()
+            await pipeline.store.migrate_content_hashes(pipeline.compressor.decompress_bytes)
+            if pipeline.summarizer.compile_model:
+                # Compile off the event loop before the first batch needs the model
+                await asyncio.to_thread(pipeline.summarizer.warm_up)
             results = await pipeline.process_articles(count=20)
             logger.info(f"Initial fetch complete: {results}")
         except Exception as e:
             logger.warning(f"Initial fetch failed: {e}")
 
-    asyncio.create_task(initial_fetch())
+    # Keep a reference so the task isn't garbage collected and shutdown can await it
+    app.state.initial_fetch_task = asyncio.create_task(initial_fetch(), name="initial_fetch")
 
     logger.info("Application startup complete")
 
@@ -71,6 +108,13 @@ async def lifespan(app: FastAPI):
     # ---- SHUTDOWN ----
     logger.info("Shutting down News Article Aggregator API")
 
+    # Stop the initial fetch before its DB and cache connections are closed
+    task = app.state.initial_fetch_task
+    if not task.done():
+        task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await task
+
     # Close database connections
     try:
         from .db import close_db
@@ -93,11 +137,14 @@ app = FastAPI(
     title="News Article Aggregator API",
     description="API for news article aggregation, summarization, and clustering",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
 # Add CORS middleware
-from config.settings import settings
+from config.settings import get_settings
+
+settings = get_settings()
 
 app.add_middleware(
     CORSMiddleware,
@@ -107,8 +154,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add Gzip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add response compression middleware (zstd when accepted, gzip otherwise)
+app.add_middleware(CompressionMiddleware, minimum_size=4096)
 
 # Rate limiting
 try:
@@ -125,75 +172,14 @@ except ImportError:
 
 
 # Global exception handlers
-@app.exception_handler(NewsAggregatorException)
-async def application_exception_handler(request: Request, exc: NewsAggregatorException):
-    """Handle application-specific exceptions"""
-    logger.error(f"Application error: {str(exc)}", exc_info=True)
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/application-error",
-        title="Application Error",
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=str(exc),
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.dict()
-    )
-
-
-@app.exception_handler(ValueError)
-async def validation_exception_handler(request: Request, exc: ValueError):
-    """Handle validation errors"""
-    logger.warning(f"Validation error: {str(exc)}")
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/validation-error",
-        title="Validation Error",
-        status=status.HTTP_400_BAD_REQUEST,
-        detail=str(exc),
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_400_BAD_REQUEST,
-        content=error_response.dict()
-    )
-
-
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """Handle unexpected exceptions"""
-    logger.error(f"Unexpected error: {str(exc)}", exc_info=True)
-
-    error_response = ErrorResponse(
-        type="https://api.newsaggregator.com/errors/internal-error",
-        title="Internal Server Error",
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail="An unexpected error occurred",
-        instance=str(request.url)
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error_response.dict()
-    )
+add_exception_handlers(app)
 
 
 # Include API routes
 app.include_router(router, prefix="/api/v1", tags=["articles"])
 
 
-@app.get("/")
-async def root():
-    """Root endpoint"""
-    return {
-        "message": "News Article Aggregator API",
-        "version": "1.0.0",
-        "docs": "/docs",
-    }
+app.get("/")(root)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,19 @@ from typing import Optional
 import hashlib
 import numpy as np
 
+# BLAKE3 is much faster than SHA-256 for dedup hashing; both yield 64 hex chars
+try:
+    from blake3 import blake3 as _content_hasher
+    CONTENT_HASH_ALGORITHM = "blake3"
+except ImportError:
+    _content_hasher = hashlib.sha256
+    CONTENT_HASH_ALGORITHM = "sha256"
+
+
+def content_digest(data: bytes) -> str:
+    """Hex digest used for content hashes and response ETags"""
+    return _content_hasher(data).hexdigest()
+
 
 @dataclass
 class RawArticle:
@@ -15,13 +28,16 @@ class RawArticle:
     source: str
     published_date: datetime
     author: Optional[str] = None
+    # Hex digest from content_digest (see CONTENT_HASH_ALGORITHM); dedup only compares it
     content_hash: str = field(init=False)
+    # UTF-8 encoding of content, kept so hashing and compression share one encode
+    content_bytes: Optional[bytes] = field(default=None, repr=False)
     
     def __post_init__(self):
         """Generate content hash after initialization"""
-        self.content_hash = hashlib.sha256(
-            self.content.encode('utf-8')
-        ).hexdigest()
+        if self.content_bytes is None:
+            self.content_bytes = self.content.encode('utf-8')
+        self.content_hash = content_digest(self.content_bytes)
 
 
 @dataclass
@@ -39,6 +55,8 @@ class Article:
     cluster_id: Optional[int]
     embedding: Optional[np.ndarray] = None
     content_hash: Optional[str] = None
+    # Keyword-fallback topic, computed once from the title at ingest
+    keyword_category: Optional[int] = None
     
     def get_content(self, decompressor) -> str:
         """
@@ -53,6 +71,26 @@ class Article:
         return decompressor.decompress(self.compressed_content)
 
 
+@dataclass
+class EmbeddingStore:
+    """
+    Embeddings for a batch of articles in one contiguous float16 matrix (row i
+    belongs to ids[i]), so similarity math runs as a single BLAS call instead of
+    gathering per-article arrays.
+    """
+    ids: list[str]
+    matrix: np.ndarray  # shape (N, D), dtype float16
+
+    @classmethod
+    def from_embeddings(cls, ids: list[str], embeddings: np.ndarray) -> "EmbeddingStore":
+        """Build a store, casting embeddings to a contiguous float16 matrix"""
+        return cls(ids=list(ids), matrix=np.ascontiguousarray(embeddings, dtype=np.float16))
+
+    def row(self, index: int) -> np.ndarray:
+        """Embedding view for the article at index (no copy)"""
+        return self.matrix[index]
+
+
 @dataclass
 class QueryFilters:
     """Filters for querying articles"""
@@ -60,6 +98,9 @@ class QueryFilters:
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
     cluster_id: Optional[int] = None
+    # Matches articles with any of its words in the title or summary. MongoDB's
+    # text index also stems words ("rates" finds "rate"); the in-memory fallback
+    # compares whole words only
     search_text: Optional[str] = None
 
 
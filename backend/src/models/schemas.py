@@ -12,8 +12,8 @@ class ArticleResponse(BaseModel):
     content: str = ""
     source: str
     author: Optional[str] = None
-    published_date: Optional[str] = None
-    fetched_date: Optional[str] = None
+    published_date: Optional[datetime] = None
+    fetched_date: Optional[datetime] = None
     url: str
     cluster_id: Optional[int] = None
 
@@ -23,8 +23,8 @@ class ClusterResponse(BaseModel):
     id: int
     label: str
     article_count: int = 0
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
 class FetchRequest(BaseModel):
@@ -1,9 +1,13 @@
 """Real cache management service using Redis"""
+import asyncio
 import logging
-import json
 import pickle
-from typing import Any, Optional, Callable
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional
+
+import orjson
+
 from ..core.exceptions import CacheError
 from ..core.error_handler import handle_errors
 
@@ -11,35 +15,84 @@ logger = logging.getLogger(__name__)
 
 # Lazy-loaded Redis client
 _redis_client = None
+_redis_lock = asyncio.Lock()
+
+# How long to stay on the in-memory fallback before retrying Redis
+_REDIS_RETRY_SECONDS = 60
+
+# Bound on in-memory fallback entries; least recently used keys are evicted first
+_MEMORY_CACHE_MAX_ENTRIES = 10_000
 
 
 async def _get_redis_client():
     """Get or create async Redis client"""
     global _redis_client
 
+    # No per-call PING: redis-py health checks the pooled connections itself
     if _redis_client is not None:
+        return _redis_client
+
+    # Serialize creation so concurrent callers don't each build a client
+    async with _redis_lock:
+        if _redis_client is not None:
+            return _redis_client
+
         try:
-            await _redis_client.ping()
+            import redis.asyncio as aioredis
+            from config.settings import settings
+
+            client = aioredis.from_url(
+                settings.redis.url,
+                max_connections=settings.redis.max_connections,
+                decode_responses=False,
+                health_check_interval=30,
+                retry_on_timeout=True,
+            )
+            await client.ping()
+            _redis_client = client
+            logger.info("Redis connection established")
             return _redis_client
-        except Exception:
-            _redis_client = None
 
+        except Exception as e:
+            logger.warning(f"Redis not available, using in-memory fallback: {e}")
+            return None
+
+
+# Redis values carry a one-byte format tag so reads dispatch without try/except
+_TAG_JSON = b"J"
+_TAG_PICKLE = b"P"
+_JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize a cache value with orjson, falling back to pickle for unsupported types"""
     try:
-        import redis.asyncio as aioredis
-        from config.settings import settings
-
-        _redis_client = aioredis.from_url(
-            settings.redis.url,
-            max_connections=settings.redis.max_connections,
-            decode_responses=False,
-        )
-        await _redis_client.ping()
-        logger.info("Redis connection established")
-        return _redis_client
+        return _TAG_JSON + orjson.dumps(value, option=_JSON_OPTIONS)
+    except TypeError:
+        return _TAG_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode(data: bytes) -> Optional[Any]:
+    """Deserialize a tagged cache value; unknown formats are treated as a miss"""
+    tag = data[:1]
+    if tag == _TAG_JSON:
+        return orjson.loads(memoryview(data)[1:])
+    if tag == _TAG_PICKLE:
+        return pickle.loads(memoryview(data)[1:])
+    return None
 
-    except Exception as e:
-        logger.warning(f"Redis not available, using in-memory fallback: {e}")
-        return None
+
+def as_async(fn: Callable[[], Any]) -> Callable[[], Awaitable[Any]]:
+    """Wrap a sync zero-argument callable for use with get_or_compute"""
+    async def wrapper():
+        return fn()
+    return wrapper
+
+
+def _reset_redis_client():
+    """Drop the shared client so the next call reconnects"""
+    global _redis_client
+    _redis_client = None
 
 
 async def close_redis():
@@ -59,18 +112,62 @@ class CacheManager:
 
     def __init__(self):
         """Initialize cache"""
-        self._memory_cache: dict[str, tuple[Any, datetime]] = {}
+        # key -> (value, time.monotonic() deadline), ordered least to most recently used
+        self._memory_cache: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._redis = None
         self._redis_available = None
+        self._redis_retry_at: Optional[float] = None
         logger.info("CacheManager initialized")
 
     async def _get_redis(self):
         """Get Redis client if available"""
+        if self._redis is not None:
+            return self._redis
         if self._redis_available is False:
-            return None
+            if self._redis_retry_at is None or time.monotonic() < self._redis_retry_at:
+                return None
         client = await _get_redis_client()
+        self._redis = client
         self._redis_available = client is not None
+        if client is None:
+            self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
         return client
 
+    def _handle_redis_error(self, error: Exception) -> None:
+        """On connection failures, drop the client and back off to the in-memory cache"""
+        try:
+            from redis.exceptions import ConnectionError as RedisConnectionError
+            from redis.exceptions import TimeoutError as RedisTimeoutError
+        except ImportError:
+            return
+        if isinstance(error, (RedisConnectionError, RedisTimeoutError)):
+            _reset_redis_client()
+            self._redis = None
+            self._redis_available = False
+            self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+    def _memory_get(self, key: str) -> Optional[Any]:
+        """Look up the in-memory fallback, dropping the entry lazily if expired"""
+        entry = self._memory_cache.get(key)
+        if entry is None:
+            return None
+        value, deadline = entry
+        if time.monotonic() > deadline:
+            # No await between lookup and removal, so coroutines can't interleave here
+            self._memory_cache.pop(key, None)
+            logger.debug(f"Memory cache expired: {key}")
+            return None
+        self._memory_cache.move_to_end(key)
+        return value
+
+    def _memory_set(self, key: str, value: Any, ttl: int) -> None:
+        """Store in the in-memory fallback, evicting the least recently used entry when full"""
+        self._memory_cache[key] = (value, time.monotonic() + ttl)
+        self._memory_cache.move_to_end(key)
+        if len(self._memory_cache) > _MEMORY_CACHE_MAX_ENTRIES:
+            self._memory_cache.popitem(last=False)
+        logger.debug(f"Memory cache set: {key} (TTL: {ttl}s)")
+
     @handle_errors
     async def get(self, key: str) -> Optional[Any]:
         """
@@ -89,22 +186,16 @@ class CacheManager:
                 data = await redis.get(key)
                 if data is not None:
                     logger.debug(f"Redis cache hit: {key}")
-                    try:
-                        return json.loads(data)
-                    except (json.JSONDecodeError, TypeError):
-                        return pickle.loads(data)
+                    return _decode(data)
                 logger.debug(f"Redis cache miss: {key}")
                 return None
             except Exception as e:
                 logger.debug(f"Redis get failed: {e}")
+                self._handle_redis_error(e)
 
         # In-memory fallback
-        if key in self._memory_cache:
-            value, expiry = self._memory_cache[key]
-            if datetime.now() > expiry:
-                del self._memory_cache[key]
-                logger.debug(f"Memory cache expired: {key}")
-                return None
+        value = self._memory_get(key)
+        if value is not None:
             logger.debug(f"Memory cache hit: {key}")
             return value
 
@@ -125,20 +216,69 @@ class CacheManager:
 
         if redis:
             try:
-                try:
-                    data = json.dumps(value)
-                except (TypeError, ValueError):
-                    data = pickle.dumps(value)
-                await redis.setex(key, ttl, data)
+                await redis.setex(key, ttl, _encode(value))
                 logger.debug(f"Redis cache set: {key} (TTL: {ttl}s)")
                 return
             except Exception as e:
                 logger.debug(f"Redis set failed: {e}")
+                self._handle_redis_error(e)
 
         # In-memory fallback
-        expiry = datetime.now() + timedelta(seconds=ttl)
-        self._memory_cache[key] = (value, expiry)
-        logger.debug(f"Memory cache set: {key} (TTL: {ttl}s)")
+        self._memory_set(key, value, ttl)
+
+    @handle_errors
+    async def get_bytes(self, key: str) -> Optional[tuple[bytes, str]]:
+        """
+        Get a pre-serialized response and its ETag without decoding.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            (payload, etag) or None if not found/expired
+        """
+        redis = await self._get_redis()
+
+        if redis:
+            try:
+                data, etag = await redis.hmget(key, "data", "etag")
+                if data is None or etag is None:
+                    return None
+                return data, etag.decode()
+            except Exception as e:
+                logger.debug(f"Redis get failed: {e}")
+                self._handle_redis_error(e)
+
+        # In-memory fallback
+        value = self._memory_get(key)
+        return value if isinstance(value, tuple) else None
+
+    @handle_errors
+    async def set_bytes(self, key: str, data: bytes, etag: str, ttl: int = 3600) -> None:
+        """
+        Store a pre-serialized response with its ETag, as a Redis hash.
+
+        Args:
+            key: Cache key
+            data: Serialized payload
+            etag: Entity tag for conditional requests
+            ttl: Time to live in seconds (default 1 hour)
+        """
+        redis = await self._get_redis()
+
+        if redis:
+            try:
+                async with redis.pipeline(transaction=True) as pipe:
+                    pipe.hset(key, mapping={"data": data, "etag": etag})
+                    pipe.expire(key, ttl)
+                    await pipe.execute()
+                logger.debug(f"Redis cache set: {key} (TTL: {ttl}s)")
+                return
+            except Exception as e:
+                logger.debug(f"Redis set failed: {e}")
+                self._handle_redis_error(e)
+
+        self._memory_set(key, (data, etag), ttl)
 
     @handle_errors
     async def delete(self, key: str) -> None:
@@ -154,16 +294,16 @@ class CacheManager:
                 await redis.delete(key)
             except Exception as e:
                 logger.debug(f"Redis delete failed: {e}")
+                self._handle_redis_error(e)
 
-        if key in self._memory_cache:
-            del self._memory_cache[key]
+        if self._memory_cache.pop(key, None) is not None:
             logger.debug(f"Cache deleted: {key}")
 
     @handle_errors
     async def get_or_compute(
         self,
         key: str,
-        compute_fn: Callable,
+        compute_fn: Callable[[], Awaitable[Any]],
         ttl: int = 3600
     ) -> Any:
         """
@@ -171,7 +311,8 @@ class CacheManager:
 
         Args:
             key: Cache key
-            compute_fn: Function to compute value if not cached (can be async)
+            compute_fn: Async function to compute value if not cached
+                (wrap sync functions with as_async)
             ttl: Time to live in seconds
 
         Returns:
@@ -183,11 +324,7 @@ class CacheManager:
 
         # Compute value
         logger.debug(f"Computing value for key: {key}")
-        import asyncio
-        if asyncio.iscoroutinefunction(compute_fn):
-            value = await compute_fn()
-        else:
-            value = compute_fn()
+        value = await compute_fn()
 
         # Cache it
         await self.set(key, value, ttl)
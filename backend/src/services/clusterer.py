@@ -1,9 +1,12 @@
 """Real topic clustering service using sentence-transformers and HDBSCAN"""
+import atexit
 import logging
-import json
+import re
+from itertools import islice
 from typing import List, Dict, Optional
 from datetime import datetime
-from ..models.article import Article, Cluster
+from ..models.article import Article, Cluster, EmbeddingStore
+from ..services.compressor import decompress_head_cached
 from ..core.exceptions import ClusteringError
 from ..core.error_handler import handle_errors
 
@@ -17,12 +20,27 @@ except ImportError:
     NUMPY_AVAILABLE = False
     logger.warning("numpy not available - advanced clustering disabled")
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Lazy loading of ML models
 _embedding_model = None
+_static_model = None
+_encode_pool = None
+
+# Batches larger than this are spread over a multi-process encode pool
+MULTI_PROCESS_MIN_TEXTS = 256
+
 
+# Dynamically quantized INT8 export shipped with the sentence-transformers hub models
+_ONNX_INT8_FILE = "onnx/model_qint8_avx512_vnni.onnx"
 
-def _load_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
-    """Lazy-load the sentence transformer model"""
+
+def _load_embedding_model(model_name: str = "all-MiniLM-L6-v2", backend: str = "onnx"):
+    """Lazy-load the sentence transformer model, preferring the INT8 ONNX backend"""
     global _embedding_model
 
     if _embedding_model is not None:
@@ -31,6 +49,18 @@ def _load_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
     try:
         from sentence_transformers import SentenceTransformer
 
+        if backend == "onnx":
+            try:
+                logger.info(f"Loading embedding model: {model_name} (ONNX INT8)")
+                _embedding_model = SentenceTransformer(
+                    model_name, backend="onnx", model_kwargs={"file_name": _ONNX_INT8_FILE}
+                )
+                logger.info(f"Embedding model {model_name} loaded successfully")
+                return _embedding_model
+            except Exception as e:
+                # Older sentence-transformers or no onnxruntime: use FP32 torch
+                logger.warning(f"ONNX embedding backend unavailable, using FP32: {e}")
+
         logger.info(f"Loading embedding model: {model_name}")
         _embedding_model = SentenceTransformer(model_name)
         logger.info(f"Embedding model {model_name} loaded successfully")
@@ -41,6 +71,128 @@ def _load_embedding_model(model_name: str = "all-MiniLM-L6-v2"):
         raise ClusteringError(f"Embedding model loading failed: {e}")
 
 
+def _get_encode_pool():
+    """Start the sentence-transformers worker pool once, on first large batch"""
+    global _encode_pool
+
+    if _encode_pool is None:
+        _encode_pool = _embedding_model.start_multi_process_pool()
+        atexit.register(_stop_encode_pool)
+        logger.info("Embedding worker pool started")
+    return _encode_pool
+
+
+def _stop_encode_pool():
+    """Terminate the embedding worker pool"""
+    global _encode_pool
+
+    if _encode_pool is not None:
+        _embedding_model.stop_multi_process_pool(_encode_pool)
+        _encode_pool = None
+
+
+# Above this many articles HDBSCAN runs on a sparse kNN graph, not all pairwise distances
+KNN_GRAPH_MIN_ARTICLES = 5000
+KNN_GRAPH_NEIGHBORS = 32
+
+
+def _knn_distance_graph(embeddings: np.ndarray, k: int = KNN_GRAPH_NEIGHBORS):
+    """
+    Build a symmetric sparse euclidean kNN distance graph.
+    Uses a FAISS HNSW index when available, otherwise sklearn NearestNeighbors.
+
+    Args:
+        embeddings: (N, D) embedding matrix
+        k: Neighbours per point
+
+    Returns:
+        scipy.sparse.csr_matrix of shape (N, N)
+    """
+    from scipy.sparse import csr_matrix
+
+    data = np.ascontiguousarray(embeddings, dtype=np.float32)
+    n = data.shape[0]
+    k = min(k + 1, n)  # the first hit is the point itself
+
+    try:
+        import faiss
+
+        index = faiss.IndexHNSWFlat(data.shape[1], 32)
+        index.add(data)
+        squared, neighbors = index.search(data, k)
+        distances = np.sqrt(np.maximum(squared, 0.0))
+    except ImportError:
+        from sklearn.neighbors import NearestNeighbors
+
+        distances, neighbors = NearestNeighbors(n_neighbors=k).fit(data).kneighbors(data)
+
+    rows = np.repeat(np.arange(n), k)
+    cols = neighbors.ravel()
+    # Drop self-matches and slots HNSW could not fill (-1)
+    keep = (cols >= 0) & (cols != rows)
+    graph = csr_matrix((distances.ravel()[keep], (rows[keep], cols[keep])), shape=(n, n))
+    return graph.maximum(graph.T)
+
+
+def _connected_knn_graph(embeddings: np.ndarray, k: int = KNN_GRAPH_NEIGHBORS):
+    """
+    kNN distance graph for precomputed-metric HDBSCAN, which rejects graphs
+    with more than one connected component (e.g. well-separated topics).
+
+    Returns:
+        scipy.sparse.csr_matrix, or None if the graph is disconnected
+    """
+    from scipy.sparse.csgraph import connected_components
+
+    graph = _knn_distance_graph(embeddings, k)
+    n_components, _ = connected_components(graph, directed=False)
+    if n_components > 1:
+        logger.warning(
+            f"kNN graph over {graph.shape[0]} articles has {n_components} components, "
+            f"clustering on full euclidean distances instead"
+        )
+        return None
+    return graph
+
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def head_words(text: str, n: int) -> str:
+    """First n whitespace-separated words, single-space joined, without splitting the rest"""
+    return " ".join(match.group() for match in islice(_WORD_RE.finditer(text), n))
+
+
+def embedding_text(title: str, content: str) -> str:
+    """Text embedded for clustering: title plus the first 200 words of content"""
+    return title + " " + head_words(content, 200)
+
+
+def _is_word_char(char: str) -> bool:
+    """Same notion of a word character as regex \\b"""
+    return char.isalnum() or char == "_"
+
+
+def _load_static_model(model_name: str = "minishlab/potion-base-8M"):
+    """Lazy-load a model2vec static embedding model (table lookup + mean pool)"""
+    global _static_model
+
+    if _static_model is not None:
+        return _static_model
+
+    try:
+        from model2vec import StaticModel
+
+        logger.info(f"Loading static embedding model: {model_name}")
+        _static_model = StaticModel.from_pretrained(model_name)
+        logger.info(f"Static embedding model {model_name} loaded successfully")
+        return _static_model
+
+    except Exception as e:
+        logger.error(f"Failed to load static embedding model: {e}")
+        raise ClusteringError(f"Static embedding model loading failed: {e}")
+
+
 class TopicClusterer:
     """
     Production topic clustering service using sentence-transformers and HDBSCAN.
@@ -58,23 +210,78 @@ class TopicClusterer:
         7: "Miscellaneous",
     }
 
+    KEYWORD_MAP = {
+        0: ['ai', 'artificial', 'technology', 'tech', 'software', 'digital', 'computer', 'robot', 'machine'],
+        1: ['climate', 'environment', 'green', 'energy', 'carbon', 'warming', 'pollution', 'weather'],
+        2: ['politics', 'policy', 'government', 'election', 'president', 'congress', 'vote', 'party'],
+        3: ['health', 'science', 'research', 'medical', 'disease', 'vaccine', 'hospital', 'study'],
+        4: ['business', 'economy', 'market', 'finance', 'stock', 'trade', 'company', 'revenue'],
+        5: ['sports', 'entertainment', 'game', 'movie', 'music', 'team', 'player', 'win'],
+        6: ['world', 'international', 'war', 'peace', 'crisis', 'nation', 'country', 'global'],
+    }
+
     def __init__(self, embedding_model_name: str = "all-MiniLM-L6-v2",
                  min_cluster_size: int = 5, min_samples: int = 3,
-                 max_cluster_articles: int = 50, similarity_threshold: float = 0.7):
+                 max_cluster_articles: int = 50, similarity_threshold: float = 0.7,
+                 embedding_backend: str = "onnx", static_embedding_model: Optional[str] = None,
+                 use_gpu: bool = False, vectorizer=None):
         self.embedding_model_name = embedding_model_name
+        self.embedding_backend = embedding_backend
+        self.static_embedding_model = static_embedding_model
+        self._use_static = False
         self.min_cluster_size = min_cluster_size
         self.min_samples = min_samples
         self.max_cluster_articles = max_cluster_articles
         self.similarity_threshold = similarity_threshold
+        self.use_gpu = use_gpu
         self.clusters: Dict[int, Cluster] = {}
+        self.embedding_store: Optional[EmbeddingStore] = None
+        # TF-IDF vectorizer for cluster labels; built on first use unless injected
+        self._tfidf_vectorizer = vectorizer
         self._model_loaded = False
+        # Input fingerprint and outcome of the last clustering run, reused when unchanged
+        self._last_fingerprint: Optional[tuple] = None
+        self._last_result: Optional[Dict[int, List[str]]] = None
+        self._last_assignments: Dict[str, Optional[int]] = {}
+        self._keyword_patterns, self._keyword_automaton = self._keyword_matchers()
         logger.info("TopicClusterer initialized")
 
+    def reset(self) -> None:
+        """Forget clusters and the memoized last run; models and matchers are kept"""
+        self.clusters.clear()
+        self.embedding_store = None
+        self._last_fingerprint = None
+        self._last_result = None
+        self._last_assignments = {}
+
+    @classmethod
+    def _keyword_matchers(cls):
+        """(regex per category, Aho-Corasick automaton or None), built once per class"""
+        matchers = cls.__dict__.get("_cached_keyword_matchers")
+        if matchers is None:
+            # One whole-word alternation per category (plurals allowed), searched in C
+            patterns = {
+                cid: re.compile(r"\b(?:" + "|".join(map(re.escape, kws)) + r")s?\b")
+                for cid, kws in cls.KEYWORD_MAP.items()
+            }
+            automaton = cls._build_keyword_automaton() if AHOCORASICK_AVAILABLE else None
+            matchers = (patterns, automaton)
+            cls._cached_keyword_matchers = matchers
+        return matchers
+
     def _ensure_model(self):
         """Ensure embedding model is loaded"""
+        if not self._model_loaded and self.static_embedding_model:
+            try:
+                _load_static_model(self.static_embedding_model)
+                self._use_static = True
+                self._model_loaded = True
+            except Exception as e:
+                logger.warning(f"Static embeddings not available, using transformer: {e}")
+                self.static_embedding_model = None
         if not self._model_loaded:
             try:
-                _load_embedding_model(self.embedding_model_name)
+                _load_embedding_model(self.embedding_model_name, self.embedding_backend)
                 self._model_loaded = True
             except Exception as e:
                 logger.warning(f"Embedding model not available, using keyword fallback: {e}")
@@ -92,13 +299,29 @@ class TopicClusterer:
         """
         self._ensure_model()
 
-        if not self._model_loaded or _embedding_model is None:
+        if not self._model_loaded:
             return None
 
         try:
-            embeddings = _embedding_model.encode(
-                texts, show_progress_bar=False, convert_to_numpy=True
-            )
+            if self._use_static:
+                embeddings = _static_model.encode(texts, show_progress_bar=False)
+                # Unit-normalize to match the transformer path
+                embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+                logger.debug(f"Generated {len(embeddings)} static embeddings of dim {embeddings.shape[1]}")
+                return embeddings
+
+            if len(texts) > MULTI_PROCESS_MIN_TEXTS:
+                # Encoding is compute-bound and single-threaded per call; fan out across cores
+                embeddings = _embedding_model.encode_multi_process(
+                    texts, _get_encode_pool(), batch_size=64
+                )
+                embeddings /= np.maximum(np.linalg.norm(embeddings, axis=1, keepdims=True), 1e-12)
+            else:
+                # One batched call; unit-norm output makes euclidean distance angular
+                embeddings = _embedding_model.encode(
+                    texts, batch_size=64, show_progress_bar=False,
+                    convert_to_numpy=True, normalize_embeddings=True,
+                )
             logger.debug(f"Generated {len(embeddings)} embeddings of dim {embeddings.shape[1]}")
             return embeddings
         except Exception as e:
@@ -119,70 +342,144 @@ class TopicClusterer:
         if not articles:
             return {}
 
+        fingerprint = self._fingerprint(articles)
+        if fingerprint == self._last_fingerprint and self._last_result is not None:
+            logger.info(f"Article set unchanged, reusing {len(self._last_result)} clusters")
+            for article in articles:
+                article.cluster_id = self._last_assignments.get(article.id)
+            return self._last_result
+
+        result = self._cluster(articles)
+        self._last_fingerprint = fingerprint
+        self._last_result = result
+        self._last_assignments = {a.id: a.cluster_id for a in articles}
+        return result
+
+    @staticmethod
+    def _fingerprint(articles: List[Article]) -> tuple:
+        """
+        XOR of per-article (id, content hash) hashes: order-independent without
+        sorting, and adding or removing an article is a single XOR.
+        """
+        combined = 0
+        for article in articles:
+            combined ^= hash((article.id, article.content_hash))
+        return len(articles), combined
+
+    def _cluster(self, articles: List[Article]) -> Dict[int, List[str]]:
+        """Embed and cluster articles (uncached body of cluster_articles)"""
         logger.info(f"Clustering {len(articles)} articles")
 
-        # Prepare texts for embedding (title + first 200 words of content)
-        texts = []
-        for article in articles:
-            text = article.title
-            if hasattr(article, 'compressed_content') and article.compressed_content:
-                try:
-                    from ..services.compressor import ContentCompressor
-                    comp = ContentCompressor()
-                    content = comp.decompress(article.compressed_content)
-                    words = content.split()[:200]
-                    text += " " + " ".join(words)
-                except Exception:
-                    pass
-            texts.append(text)
-
-        # Try HDBSCAN clustering with embeddings
-        embeddings = self.generate_embeddings(texts)
+        # Reuse embeddings computed at ingest; otherwise decompress and encode
+        embeddings = self._stored_embeddings(articles)
+        if embeddings is None:
+            # Prepare texts for embedding (title + first 200 words of content)
+            embeddings = self.generate_embeddings(self._prepare_texts(articles))
+
+        if embeddings is not None:
+            # Keep one shared float16 buffer; articles hold row views into it
+            self.embedding_store = EmbeddingStore.from_embeddings(
+                [a.id for a in articles], embeddings
+            )
+            for i, article in enumerate(articles):
+                article.embedding = self.embedding_store.row(i)
+            # Cluster on the FP16 copy and let the FP32 encoder output go
+            embeddings = self.embedding_store.matrix
 
         if embeddings is not None and len(articles) >= self.min_cluster_size:
             return self._hdbscan_cluster(articles, embeddings)
         else:
             return self._keyword_cluster(articles)
 
+    @handle_errors
+    def embed_articles(self, articles: List[Article], texts: List[str]) -> None:
+        """
+        Attach float16 embeddings at ingest so clustering can skip decompression.
+
+        Args:
+            articles: Newly processed articles
+            texts: Matching embedding texts (see embedding_text)
+        """
+        if not articles:
+            return
+        embeddings = self.generate_embeddings(texts)
+        if embeddings is None:
+            return
+        for article, row in zip(articles, embeddings.astype(np.float16)):
+            article.embedding = row
+
+    @staticmethod
+    def _stored_embeddings(articles: List[Article]) -> Optional[np.ndarray]:
+        """Stack ingest-time embeddings, or None if any article lacks one"""
+        if any(a.embedding is None for a in articles):
+            return None
+        try:
+            return np.stack([a.embedding for a in articles])
+        except ValueError:
+            # Dimensions differ (embedding model changed); re-encode everything
+            return None
+
+    @staticmethod
+    def _prepare_texts(articles: List[Article]) -> List[str]:
+        """
+        Embedding texts in two passes: titles for every article, then the
+        decompress path only over the articles that carry content.
+        """
+        texts = [article.title for article in articles]
+        pending = [i for i, article in enumerate(articles) if article.compressed_content]
+        for i in pending:
+            try:
+                content = decompress_head_cached(articles[i].compressed_content)
+            except Exception:
+                continue
+            texts[i] = embedding_text(texts[i], content)
+        return texts
+
     def _hdbscan_cluster(self, articles: List[Article], embeddings: np.ndarray) -> Dict[int, List[str]]:
         """Cluster using HDBSCAN algorithm"""
         try:
-            import hdbscan
-
             # Adjust min_cluster_size if we have too few articles
             effective_min_cluster = min(self.min_cluster_size, max(2, len(articles) // 3))
             effective_min_samples = min(self.min_samples, effective_min_cluster)
 
-            clusterer = hdbscan.HDBSCAN(
-                min_cluster_size=effective_min_cluster,
-                min_samples=effective_min_samples,
-                metric='euclidean',
-                cluster_selection_method='eom',
-            )
+            labels = None
+            if self.use_gpu:
+                labels = self._gpu_hdbscan_labels(
+                    embeddings, effective_min_cluster, effective_min_samples
+                )
+            if labels is None:
+                labels = self._cpu_hdbscan_labels(
+                    embeddings, effective_min_cluster, effective_min_samples
+                )
+
+            # Bucket articles by label in one pass; HDBSCAN's noise (-1) becomes "Miscellaneous" (999)
+            cluster_labels = np.where(np.asarray(labels) < 0, 999, labels)
+            cluster_ids, dense_labels = np.unique(cluster_labels, return_inverse=True)
+            order = np.argsort(dense_labels, kind='stable')
+            counts = np.bincount(dense_labels, minlength=len(cluster_ids))
+            buckets = np.split(order, np.cumsum(counts)[:-1])
 
-            labels = clusterer.fit_predict(embeddings)
+            # Centroids from one scatter-add streaming over the matrix in place (no gathered copy)
+            sums = np.zeros((len(cluster_ids), embeddings.shape[1]), dtype=np.float32)
+            np.add.at(sums, dense_labels, embeddings)
+            centroids = sums / counts[:, None]
 
-            # Build cluster mapping
             clusters: Dict[int, List[str]] = {}
+            oversized = []
             now = datetime.now()
 
-            for i, (article, label) in enumerate(zip(articles, labels)):
-                # HDBSCAN uses -1 for noise; assign to a "Miscellaneous" cluster
-                cluster_id = int(label) if label >= 0 else 999
-
-                if cluster_id not in clusters:
-                    clusters[cluster_id] = []
-                clusters[cluster_id].append(article.id)
+            for article, cluster_id in zip(articles, cluster_labels.tolist()):
                 article.cluster_id = cluster_id
 
-            # Generate cluster labels using TF-IDF
-            for cluster_id, article_ids in clusters.items():
-                cluster_articles = [a for a in articles if a.id in article_ids]
-                label = self._generate_tfidf_label(cluster_articles, embeddings, articles)
+            tfidf = self._fit_title_tfidf(articles)
+
+            for cluster_id, indices, centroid in zip(cluster_ids.tolist(), buckets, centroids):
+                cluster_articles = [articles[i] for i in indices]
+                article_ids = [a.id for a in cluster_articles]
+                clusters[cluster_id] = article_ids
 
-                # Get centroid
-                cluster_indices = [i for i, a in enumerate(articles) if a.id in article_ids]
-                centroid = np.mean(embeddings[cluster_indices], axis=0) if cluster_indices else None
+                # Generate cluster label using TF-IDF
+                label = self._generate_tfidf_label(tfidf, indices)
 
                 self.clusters[cluster_id] = Cluster(
                     id=cluster_id,
@@ -192,11 +489,12 @@ class TopicClusterer:
                     created_at=now,
                     updated_at=now,
                 )
+                if len(article_ids) > self.max_cluster_articles:
+                    oversized.append((cluster_id, cluster_articles, indices))
 
             # Handle sub-clustering for large clusters
-            for cluster_id, article_ids in list(clusters.items()):
-                if len(article_ids) > self.max_cluster_articles:
-                    self._sub_cluster(cluster_id, articles, embeddings)
+            for cluster_id, cluster_articles, indices in oversized:
+                self._sub_cluster(cluster_id, cluster_articles, embeddings[indices])
 
             logger.info(f"HDBSCAN created {len(clusters)} clusters")
             return clusters
@@ -208,54 +506,116 @@ class TopicClusterer:
             logger.error(f"HDBSCAN clustering failed: {e}")
             return self._keyword_cluster(articles)
 
-    def _generate_tfidf_label(self, cluster_articles: List[Article],
-                               all_embeddings: np.ndarray, all_articles: List[Article]) -> str:
-        """Generate cluster label using TF-IDF of article titles"""
+    @staticmethod
+    def _cpu_hdbscan_labels(embeddings: np.ndarray, min_cluster_size: int,
+                            min_samples: int) -> np.ndarray:
+        """Run CPU HDBSCAN, on a sparse kNN graph for large batches"""
+        import hdbscan
+
+        graph = _connected_knn_graph(embeddings) if len(embeddings) > KNN_GRAPH_MIN_ARTICLES else None
+        if graph is not None:
+            # Approximate neighbourhoods keep memory near O(N·k)
+            clusterer = hdbscan.HDBSCAN(
+                min_cluster_size=min_cluster_size,
+                min_samples=min_samples,
+                metric='precomputed',
+                cluster_selection_method='eom',
+            )
+            return clusterer.fit_predict(graph)
+
+        clusterer = hdbscan.HDBSCAN(
+            min_cluster_size=min_cluster_size,
+            min_samples=min_samples,
+            metric='euclidean',
+            algorithm='boruvka_kdtree',
+            cluster_selection_method='eom',
+            core_dist_n_jobs=-1,
+        )
+        # One C-contiguous FP32 copy up front, instead of conversions inside the tree code
+        return clusterer.fit_predict(np.ascontiguousarray(embeddings, dtype=np.float32))
+
+    @staticmethod
+    def _gpu_hdbscan_labels(embeddings: np.ndarray, min_cluster_size: int,
+                            min_samples: int) -> Optional[np.ndarray]:
+        """Run HDBSCAN on the GPU with cuML; None if cuML or CUDA is unavailable"""
         try:
-            from sklearn.feature_extraction.text import TfidfVectorizer
+            import cupy
+            from cuml.cluster import HDBSCAN as GpuHDBSCAN
+        except ImportError:
+            return None
 
-            titles = [a.title for a in cluster_articles]
-            if not titles:
-                return "Miscellaneous"
+        try:
+            # Embeddings are unit-norm, so euclidean here ranks like cosine
+            clusterer = GpuHDBSCAN(
+                min_cluster_size=min_cluster_size,
+                min_samples=min_samples,
+                metric='euclidean',
+            )
+            labels = clusterer.fit_predict(cupy.asarray(embeddings, dtype=cupy.float32))
+            return cupy.asnumpy(labels)
+        except Exception as e:
+            logger.warning(f"GPU HDBSCAN failed, using CPU: {e}")
+            return None
 
-            vectorizer = TfidfVectorizer(max_features=100, stop_words='english', max_df=0.9)
-            tfidf_matrix = vectorizer.fit_transform(titles)
-            feature_names = vectorizer.get_feature_names_out()
+    def _fit_title_tfidf(self, articles: List[Article]):
+        """
+        Fit TF-IDF once on every title in the batch.
 
-            # Get top 3 keywords
-            mean_tfidf = tfidf_matrix.mean(axis=0).A1
-            top_indices = mean_tfidf.argsort()[-3:][::-1]
-            keywords = [feature_names[i] for i in top_indices if mean_tfidf[i] > 0]
+        Returns:
+            (sparse matrix with one row per article, feature names), or None on failure
+        """
+        try:
+            if self._tfidf_vectorizer is None:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+                self._tfidf_vectorizer = TfidfVectorizer(
+                    max_features=1000, stop_words='english', max_df=0.9
+                )
+            matrix = self._tfidf_vectorizer.fit_transform([a.title for a in articles])
+            return matrix, self._tfidf_vectorizer.get_feature_names_out()
+        except Exception as e:
+            logger.debug(f"TF-IDF fitting failed: {e}")
+            return None
 
-            if keywords:
-                return " & ".join(word.title() for word in keywords)
+    def _generate_tfidf_label(self, tfidf, indices) -> str:
+        """Generate cluster label from the top TF-IDF title terms of the given rows"""
+        if tfidf is None or len(indices) == 0:
             return "Miscellaneous"
 
-        except Exception as e:
-            logger.debug(f"TF-IDF label generation failed: {e}")
-            return "Miscellaneous"
+        matrix, feature_names = tfidf
+        rows = matrix[indices]
+        mean_tfidf = np.asarray(rows.sum(axis=0)).ravel() / rows.shape[0]
+
+        # Top 3 keywords: O(F) partition, then order just those three
+        k = min(3, len(mean_tfidf))
+        top_indices = np.argpartition(mean_tfidf, -k)[-k:]
+        top_indices = top_indices[np.argsort(-mean_tfidf[top_indices])]
+        keywords = [feature_names[i] for i in top_indices if mean_tfidf[i] > 0]
 
-    def _sub_cluster(self, cluster_id: int, articles: List[Article], embeddings: np.ndarray):
-        """Split large clusters into sub-clusters"""
+        if keywords:
+            return " & ".join(word.title() for word in keywords)
+        return "Miscellaneous"
+
+    def _sub_cluster(self, cluster_id: int, cluster_articles: List[Article],
+                     cluster_embeddings: np.ndarray):
+        """Split a large cluster (its articles and embedding rows) into sub-clusters"""
         cluster = self.clusters.get(cluster_id)
         if not cluster or len(cluster.article_ids) <= self.max_cluster_articles:
             return
 
         logger.info(f"Sub-clustering cluster {cluster_id} with {len(cluster.article_ids)} articles")
 
-        # Get articles and embeddings for this cluster
-        cluster_articles = [a for a in articles if a.id in cluster.article_ids]
-        cluster_indices = [i for i, a in enumerate(articles) if a.id in cluster.article_ids]
-        cluster_embeddings = embeddings[cluster_indices]
-
         try:
             import hdbscan
 
             sub_clusterer = hdbscan.HDBSCAN(
                 min_cluster_size=max(2, len(cluster_articles) // 5),
                 metric='euclidean',
+                algorithm='boruvka_kdtree',
+                core_dist_n_jobs=-1,
+            )
+            sub_labels = sub_clusterer.fit_predict(
+                np.ascontiguousarray(cluster_embeddings, dtype=np.float32)
             )
-            sub_labels = sub_clusterer.fit_predict(cluster_embeddings)
 
             # Create sub-clusters with IDs like cluster_id * 100 + sub_id
             now = datetime.now()
@@ -280,40 +640,66 @@ class TopicClusterer:
         except Exception as e:
             logger.warning(f"Sub-clustering failed: {e}")
 
+    @classmethod
+    def _build_keyword_automaton(cls):
+        """Aho-Corasick automaton over every keyword (and plural) -> (category, length)"""
+        automaton = ahocorasick.Automaton()
+        for cid, keywords in cls.KEYWORD_MAP.items():
+            for keyword in keywords:
+                for form in (keyword, keyword + "s"):
+                    # Lowest category wins, matching the regex path's order
+                    if form not in automaton or automaton.get(form)[0] > cid:
+                        automaton.add_word(form, (cid, len(form)))
+        automaton.make_automaton()
+        return automaton
+
+    def _keyword_category(self, title_lower: str) -> Optional[int]:
+        """First keyword category matching a whole word of the title, or None"""
+        if self._keyword_automaton is None:
+            for cluster_id, pattern in self._keyword_patterns.items():
+                if pattern.search(title_lower):
+                    return cluster_id
+            return None
+
+        # One pass over the title reports every keyword hit
+        best = None
+        last = len(title_lower) - 1
+        for end, (cluster_id, length) in self._keyword_automaton.iter(title_lower):
+            if best is not None and cluster_id >= best:
+                continue
+            start = end - length + 1
+            if start > 0 and _is_word_char(title_lower[start - 1]):
+                continue
+            if end < last and _is_word_char(title_lower[end + 1]):
+                continue
+            best = cluster_id
+        return best
+
+    def categorize_articles(self, articles: List[Article]) -> None:
+        """
+        Attach each article's keyword category, scanning only titles not seen before.
+
+        Args:
+            articles: Articles to categorize in place
+        """
+        for article in articles:
+            if article.keyword_category is None:
+                category = self._keyword_category(article.title.lower())
+                article.keyword_category = 7 if category is None else category  # 7: Miscellaneous
+
     def _keyword_cluster(self, articles: List[Article]) -> Dict[int, List[str]]:
         """Fallback keyword-based clustering"""
-        keyword_map = {
-            0: ['ai', 'artificial', 'technology', 'tech', 'software', 'digital', 'computer', 'robot', 'machine'],
-            1: ['climate', 'environment', 'green', 'energy', 'carbon', 'warming', 'pollution', 'weather'],
-            2: ['politics', 'policy', 'government', 'election', 'president', 'congress', 'vote', 'party'],
-            3: ['health', 'science', 'research', 'medical', 'disease', 'vaccine', 'hospital', 'study'],
-            4: ['business', 'economy', 'market', 'finance', 'stock', 'trade', 'company', 'revenue'],
-            5: ['sports', 'entertainment', 'game', 'movie', 'music', 'team', 'player', 'win'],
-            6: ['world', 'international', 'war', 'peace', 'crisis', 'nation', 'country', 'global'],
-        }
-
         clusters: Dict[int, List[str]] = {}
         now = datetime.now()
 
+        # Re-clustering reuses categories from ingest, so this is a dict build per article
+        self.categorize_articles(articles)
         for article in articles:
-            title_lower = article.title.lower()
-            assigned = False
-
-            for cluster_id, keywords in keyword_map.items():
-                if any(word in title_lower for word in keywords):
-                    if cluster_id not in clusters:
-                        clusters[cluster_id] = []
-                    clusters[cluster_id].append(article.id)
-                    article.cluster_id = cluster_id
-                    assigned = True
-                    break
-
-            if not assigned:
-                misc_id = 7
-                if misc_id not in clusters:
-                    clusters[misc_id] = []
-                clusters[misc_id].append(article.id)
-                article.cluster_id = misc_id
+            cluster_id = article.keyword_category
+            if cluster_id not in clusters:
+                clusters[cluster_id] = []
+            clusters[cluster_id].append(article.id)
+            article.cluster_id = cluster_id
 
         for cluster_id, article_ids in clusters.items():
             label = self.KEYWORD_LABELS.get(cluster_id, f"Topic {cluster_id}")
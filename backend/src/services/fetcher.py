@@ -1,12 +1,29 @@
 """Real article fetching service with RSS, NewsAPI, and web scraping support"""
+import html
+import io
 import logging
 import hashlib
 import asyncio
-from typing import List, Optional, Dict
-from datetime import datetime, timedelta
-from ..models.article import RawArticle
+import atexit
+import multiprocessing
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import attrgetter
+from typing import Callable, List, Optional, Dict, Tuple
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+import orjson
+
+from ..models.article import RawArticle, content_digest
 from ..core.exceptions import FetchError
 from ..core.error_handler import handle_errors
+from .rate_limiter import HostLimiters, retry_after_seconds
+from .seen_filter import BloomFilter
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +44,8 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
@@ -39,6 +58,194 @@ except ImportError:
     BS4_AVAILABLE = False
     logger.warning("beautifulsoup4 not available - HTML parsing disabled")
 
+# libxml2-backed tree builder; several times faster than the pure-Python html.parser
+try:
+    from lxml import etree
+    import lxml.html
+    LXML_AVAILABLE = True
+    HTML_PARSER = "lxml"
+except ImportError:
+    LXML_AVAILABLE = False
+    HTML_PARSER = "html.parser"
+    logger.warning("lxml not available - using the slower html.parser")
+
+SCRAPE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+NEWSAPI_URL = "https://newsapi.org/v2/everything"
+
+# Connection pool shape for concurrent fetching: many hosts, bounded per host
+MAX_CONNECTIONS = 256
+MAX_CONNECTIONS_PER_HOST = 64
+
+# Base delay for exponential backoff between retries (0.5s, 1s, 2s, ...)
+RETRY_BACKOFF_SECONDS = 0.5
+
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Page chrome dropped before looking for article paragraphs
+_NON_CONTENT_TAGS = ("script", "style", "nav", "header", "footer", "aside")
+
+# Paragraphs this short (after stripping) are bylines, captions and the like
+_MIN_PARAGRAPH_CHARS = 30
+
+# Snippets up to this size without script/style bodies are stripped with a regex
+REGEX_STRIP_MAX_CHARS = 2048
+_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+_SCRIPT_OR_STYLE_RE = re.compile(r"<(?:script|style)", re.IGNORECASE)
+
+_URL = attrgetter("url")
+_CONTENT_HASH = attrgetter("content_hash")
+
+# Feeds at least this large are parsed in a worker process; feedparser holds the GIL
+PROCESS_PARSE_MIN_BYTES = 100 * 1024
+_parse_pool = None
+
+# Entries taken from each feed
+ENTRIES_PER_FEED = 20
+
+# Root element sniffed from the start of a feed body: rss, feed (Atom) or rdf:RDF
+_FEED_ROOT_RE = re.compile(rb"<(rss|feed|rdf:RDF)[\s>]")
+_FEED_SNIFF_BYTES = 512
+_ATOM = "{http://www.w3.org/2005/Atom}"
+
+# After this many consecutive failed scrapes on a host, stop scraping it for the run
+MAX_SCRAPE_FAILURES_PER_HOST = 3
+
+# Scraped page text is reused across fetch runs for this long
+SCRAPE_CACHE_TTL_SECONDS = 24 * 3600
+
+# Bound on cached pages; least recently used URLs are evicted first
+SCRAPE_CACHE_MAX_ENTRIES = 10_000
+
+# Responses that mean the host wants less traffic, not that the request was bad
+_OVERLOAD_STATUSES = {429, 503}
+
+
+def _parse_feed(source, content_type: Optional[str] = None):
+    """
+    feedparser.parse without the passes this fetcher redoes anyway.
+
+    Entry HTML is flattened to text with BeautifulSoup, so feedparser's HTML
+    sanitizer and relative-URI rewriting (each a full re-parse and copy of
+    every entry body) are skipped. A known Content-Type lets feedparser take
+    the declared charset instead of trying encodings one by one.
+
+    Args:
+        source: Feed bytes, or a URL for feedparser to download
+        content_type: Content-Type header of an already downloaded body
+    """
+    return feedparser.parse(
+        source,
+        response_headers={"content-type": content_type} if content_type else None,
+        sanitize_html=False,
+        resolve_relative_uris=False,
+    )
+
+
+def _parse_feed_for_pool(body: bytes, content_type: Optional[str] = None):
+    """
+    _parse_feed in a pool worker. The result is pickled back to the parent,
+    and the parser exception kept on malformed (bozo) feeds often cannot be
+    pickled, so it is reduced to its message.
+    """
+    feed = _parse_feed(body, content_type)
+    if "bozo_exception" in feed:
+        feed["bozo_exception"] = str(feed["bozo_exception"])
+    return feed
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Start the feed parsing worker pool once, on the first large feed"""
+    global _parse_pool
+
+    if _parse_pool is None:
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+        atexit.register(_stop_parse_pool)
+        logger.info("Feed parsing worker pool started")
+    return _parse_pool
+
+
+def _stop_parse_pool():
+    """Shut down the feed parsing worker pool"""
+    global _parse_pool
+
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+
+
+async def _parse_feed_async(body: bytes, content_type: Optional[str] = None):
+    """
+    _parse_feed off the event loop: large feeds go to the worker pool so
+    several feeds parse on separate cores, small ones to a thread.
+    """
+    if len(body) >= PROCESS_PARSE_MIN_BYTES:
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(_get_parse_pool(), _parse_feed_for_pool, body, content_type)
+        except BrokenProcessPool as e:
+            logger.warning(f"Feed parsing pool failed, parsing in-process: {e}")
+            _stop_parse_pool()
+        except Exception as e:
+            # e.g. a result that would not pickle; the thread path has no such limit
+            logger.warning(f"Feed parsing in the pool failed, parsing in-process: {e}")
+    return await asyncio.to_thread(_parse_feed, body, content_type)
+
+
+def _feed_kind(body: bytes) -> Optional[str]:
+    """Root element name of a feed ("rss", "feed" or "rdf:RDF") from its first bytes"""
+    match = _FEED_ROOT_RE.search(body[:_FEED_SNIFF_BYTES])
+    return match.group(1).decode() if match else None
+
+
+def _atom_datetime(text: Optional[str]) -> Optional[datetime]:
+    """RFC 3339 timestamp as naive UTC (matching feedparser's *_parsed fields)"""
+    if not text:
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _atom_text(element) -> str:
+    """Text of an Atom text construct; xhtml content is nested markup, not escaped text"""
+    if element is None:
+        return ""
+    if element.get("type") == "xhtml":
+        return "".join(etree.tostring(child, encoding="unicode") for child in element)
+    return element.text or ""
+
+
+def has_min_words(text: str, n: int) -> bool:
+    """
+    Whether text has at least n whitespace-separated words. split() with a
+    maxsplit stops after n words instead of tokenizing a whole article.
+
+    Args:
+        text: Text to check
+        n: Minimum word count
+
+    Returns:
+        True if text has n or more words
+    """
+    if n <= 0:
+        return True
+    return len(text.split(None, n - 1)) == n
+
+
+def _declares_utf8(content_type: str) -> bool:
+    """True when a Content-Type header names UTF-8, so no charset sniffing is needed"""
+    return "charset=utf-8" in content_type.lower().replace('"', "")
+
 
 class ArticleFetcher:
     """
@@ -54,18 +261,32 @@ class ArticleFetcher:
     ]
 
     def __init__(self, newsapi_key: str = "", rss_feeds: List[str] = None,
-                 timeout: int = 10, max_retries: int = 3, min_content_words: int = 100):
+                 timeout: int = 10, max_retries: int = 3, min_content_words: int = 100,
+                 seen_filter_path: str = ""):
         self.newsapi_key = newsapi_key
         self.rss_feeds = rss_feeds or self.DEFAULT_RSS_FEEDS
         self.timeout = timeout
         self.max_retries = max_retries
         self.min_content_words = min_content_words
+        # Learned per-host concurrency, kept across fetch runs
+        self._host_limiters = HostLimiters(max_limit=MAX_CONNECTIONS_PER_HOST)
+        # Consecutive scrape failures per host, reset at the start of each run
+        self._scrape_failures: Dict[str, int] = {}
+        # URL digest -> (page text, time.monotonic() deadline), kept across fetch runs
+        self._scrape_cache: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        # One keep-alive session for the blocking path, so repeat hosts skip TCP/TLS setup
+        self._http = self._make_session() if REQUESTS_AVAILABLE else None
+        # URLs and content hashes of ingested articles; known URLs are never downloaded again
+        self.seen_filter_path = seen_filter_path
+        self._seen = BloomFilter.load(seen_filter_path) if seen_filter_path else BloomFilter()
+        self._skipped_seen = 0
         logger.info(f"ArticleFetcher initialized with {len(self.rss_feeds)} RSS feeds")
 
     @handle_errors
     def fetch_articles(self, count: int = 50) -> List[RawArticle]:
         """
         Fetch articles from all configured sources.
+        Blocking entry point; runs the concurrent fetch when aiohttp is installed.
 
         Args:
             count: Maximum number of articles to fetch
@@ -73,15 +294,66 @@ class ArticleFetcher:
         Returns:
             List of RawArticle objects
         """
-        # Check if required libraries are available
-        if not FEEDPARSER_AVAILABLE and not REQUESTS_AVAILABLE:
-            error_msg = (
-                "Cannot fetch real articles - required packages not installed.\n"
-                "Please install: pip install feedparser beautifulsoup4 requests lxml"
-            )
-            logger.error(error_msg)
-            raise FetchError(error_msg)
-        
+        if AIOHTTP_AVAILABLE:
+            return asyncio.run(self.fetch_articles_async(count))
+        return self._fetch_articles_blocking(count)
+
+    @handle_errors
+    async def fetch_articles_async(self, count: int = 50) -> List[RawArticle]:
+        """
+        Fetch articles from all configured sources concurrently.
+        All feeds (and NewsAPI) download at once, then short entries are
+        scraped in a second concurrent wave, so latency is the slowest
+        request rather than the sum of all of them.
+
+        Args:
+            count: Maximum number of articles to fetch
+
+        Returns:
+            List of RawArticle objects
+        """
+        self._check_dependencies()
+        if not AIOHTTP_AVAILABLE:
+            return await asyncio.to_thread(self._fetch_articles_blocking, count)
+
+        self._scrape_failures = {}
+        self._skipped_seen = 0
+        candidates: List[Dict] = []
+        timeout = aiohttp.ClientTimeout(sock_connect=self.timeout, sock_read=self.timeout)
+        connector = aiohttp.TCPConnector(limit=MAX_CONNECTIONS, limit_per_host=MAX_CONNECTIONS_PER_HOST)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            sources = []
+            jobs = []
+            if FEEDPARSER_AVAILABLE and BS4_AVAILABLE:
+                for feed_url in self.rss_feeds:
+                    sources.append(f"RSS: {feed_url}")
+                    jobs.append(self._fetch_from_rss_async(session, feed_url))
+            if self.newsapi_key and BS4_AVAILABLE:
+                sources.append("NewsAPI")
+                jobs.append(self._fetch_from_newsapi_async(session))
+
+            for source, result in zip(sources, await asyncio.gather(*jobs, return_exceptions=True)):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to fetch {source}: {result}")
+                    continue
+                candidates.extend(result)
+                logger.info(f"Fetched {len(result)} articles from {source}")
+
+            # Second wave: full-page scrapes for entries whose feed text is too short
+            await asyncio.gather(*(
+                self._scrape_candidate_async(session, c)
+                for c in candidates if c["url"] and self._is_short(c["content"])
+            ))
+
+        return self._select(self._build_articles(candidates), count)
+
+    def _fetch_articles_blocking(self, count: int) -> List[RawArticle]:
+        """Fetch sources one after another with requests (used when aiohttp is missing)"""
+        self._check_dependencies()
+        self._scrape_failures = {}
+        self._skipped_seen = 0
+
         all_articles = []
 
         # Fetch from RSS feeds
@@ -104,8 +376,26 @@ class ArticleFetcher:
             except Exception as e:
                 logger.warning(f"Failed to fetch from NewsAPI: {e}")
 
+        return self._select(all_articles, count)
+
+    @staticmethod
+    def _check_dependencies() -> None:
+        """Raise if no source can be fetched at all"""
+        if not FEEDPARSER_AVAILABLE and not REQUESTS_AVAILABLE and not AIOHTTP_AVAILABLE:
+            error_msg = (
+                "Cannot fetch real articles - required packages not installed.\n"
+                "Please install: pip install feedparser beautifulsoup4 requests lxml"
+            )
+            logger.error(error_msg)
+            raise FetchError(error_msg)
+
+    def _select(self, all_articles: List[RawArticle], count: int) -> List[RawArticle]:
+        """Filter short and already ingested articles, deduplicate and limit to count"""
+        if self._skipped_seen:
+            logger.info(f"Skipped {self._skipped_seen} already ingested articles")
+
         # If no articles fetched, raise error
-        if not all_articles:
+        if not all_articles and not self._skipped_seen:
             error_msg = (
                 "No articles could be fetched from any source.\n"
                 "Please check:\n"
@@ -117,8 +407,12 @@ class ArticleFetcher:
             raise FetchError(error_msg)
 
         # Filter short articles
-        filtered = [a for a in all_articles if len(a.content.split()) >= self.min_content_words]
-        logger.info(f"Filtered {len(all_articles) - len(filtered)} short articles")
+        min_words, seen = self.min_content_words, self._seen
+        filtered = [
+            a for a in all_articles
+            if has_min_words(a.content, min_words) and a.content_hash not in seen
+        ]
+        logger.info(f"Filtered {len(all_articles) - len(filtered)} short or already ingested articles")
 
         # Deduplicate
         unique = self.deduplicate(filtered)
@@ -128,200 +422,515 @@ class ArticleFetcher:
         logger.info(f"Returning {len(result)} REAL articles from news sources")
         return result
 
+    def mark_seen(self, articles) -> None:
+        """
+        Record ingested articles so later runs skip their URLs before any
+        download, and persist the filter when a path is configured.
+
+        Args:
+            articles: Stored articles (anything with url and content_hash)
+        """
+        seen = self._seen
+        for article in articles:
+            if article.url:
+                seen.add(article.url)
+            if article.content_hash:
+                seen.add(article.content_hash)
+        if self.seen_filter_path:
+            try:
+                seen.save(self.seen_filter_path)
+            except OSError as e:
+                logger.warning(f"Could not save seen-article filter {self.seen_filter_path}: {e}")
+
+    def _is_seen(self, url: str) -> bool:
+        """Whether the URL was ingested by an earlier run"""
+        if url and url in self._seen:
+            self._skipped_seen += 1
+            return True
+        return False
+
+    # --- Source parsing (shared by the blocking and concurrent paths) ---
+
+    def _is_short(self, content: str) -> bool:
+        """Whether content is below min_content_words and worth a full-page scrape"""
+        return not has_min_words(content, self.min_content_words)
+
+    @staticmethod
+    def _apply_scrape(candidate: Dict, full_content: str) -> None:
+        """Replace the feed text with the scraped page when the page is longer"""
+        # Only short feed text is scraped, so counting its words is cheap
+        if full_content and has_min_words(full_content, len(candidate["content"].split()) + 1):
+            candidate["content"] = full_content
+
+    def _scrape_blocked(self, url: str) -> bool:
+        """Whether this run has given up scraping the URL's host"""
+        return self._scrape_failures.get(urlparse(url).netloc, 0) >= MAX_SCRAPE_FAILURES_PER_HOST
+
+    def _record_scrape(self, url: str, content: str) -> None:
+        """Track consecutive failed (or empty) scrapes per host"""
+        host = urlparse(url).netloc
+        if content:
+            self._scrape_failures[host] = 0
+            return
+        failures = self._scrape_failures.get(host, 0) + 1
+        self._scrape_failures[host] = failures
+        if failures == MAX_SCRAPE_FAILURES_PER_HOST:
+            logger.info(f"Scraping {host} failed {failures} times in a row; skipping it this run")
+
+    def _cached_scrape(self, url: str) -> Optional[str]:
+        """Page text scraped from the URL within the cache TTL, if any"""
+        key = content_digest(url.encode())[:16]
+        entry = self._scrape_cache.get(key)
+        if entry is None:
+            return None
+        content, deadline = entry
+        if time.monotonic() >= deadline:
+            del self._scrape_cache[key]
+            return None
+        self._scrape_cache.move_to_end(key)
+        return content
+
+    def _cache_scrape(self, url: str, content: str) -> None:
+        """Remember a successful scrape; failures are retried on the next run"""
+        if not content:
+            return
+        key = content_digest(url.encode())[:16]
+        self._scrape_cache[key] = (content, time.monotonic() + SCRAPE_CACHE_TTL_SECONDS)
+        self._scrape_cache.move_to_end(key)
+        if len(self._scrape_cache) > SCRAPE_CACHE_MAX_ENTRIES:
+            self._scrape_cache.popitem(last=False)
+
+    def _scrape_candidate(self, candidate: Dict) -> None:
+        """Blocking full-page scrape for one short candidate"""
+        url = candidate["url"]
+        full_content = self._cached_scrape(url)
+        if full_content is None:
+            if self._scrape_blocked(url):
+                return
+            full_content = self._scrape_article_content(url)
+            self._record_scrape(url, full_content)
+            self._cache_scrape(url, full_content)
+        self._apply_scrape(candidate, full_content)
+
+    async def _scrape_candidate_async(self, session, candidate: Dict) -> None:
+        """Concurrent full-page scrape for one short candidate"""
+        url = candidate["url"]
+        full_content = self._cached_scrape(url)
+        if full_content is None:
+            full_content = await self._scrape_article_content_async(
+                session, url, skip=lambda: self._scrape_blocked(url)
+            )
+            self._record_scrape(url, full_content)
+            self._cache_scrape(url, full_content)
+        self._apply_scrape(candidate, full_content)
+
+    @staticmethod
+    def _clean_html(content: str) -> str:
+        """Strip markup from a feed or API snippet"""
+        if not content:
+            return ""
+        if "<" not in content and "&" not in content:
+            # Plain text: nothing for a parser to strip
+            return content.strip()
+        if len(content) < REGEX_STRIP_MAX_CHARS and not _SCRIPT_OR_STYLE_RE.search(content):
+            # A short summary with a few inline tags: no parse tree needed
+            return " ".join(html.unescape(_TAG_RE.sub(" ", content)).split())
+        soup = BeautifulSoup(content, HTML_PARSER)
+        return soup.get_text(separator=" ", strip=True)
+
+    @staticmethod
+    def _build_articles(candidates: List[Dict]) -> List[RawArticle]:
+        """Turn candidate dicts into RawArticles, dropping ones without title or content"""
+        return [
+            RawArticle(**candidate)
+            for candidate in candidates
+            if candidate["title"] and candidate["content"]
+        ]
+
+    def _rss_candidates(self, feed, feed_url: str) -> List[Dict]:
+        """Extract candidate articles from a parsed feed"""
+        if feed.bozo and not feed.entries:
+            logger.warning(f"RSS feed error for {feed_url}: {feed.bozo_exception}")
+            return []
+
+        source_name = feed.feed.get("title", feed_url)
+        candidates = []
+
+        for entry in feed.entries[:ENTRIES_PER_FEED]:
+            try:
+                title = entry.get("title", "").strip()
+                link = entry.get("link", "")
+                author = entry.get("author", None)
+
+                # Get published date
+                pub_date = None
+                if hasattr(entry, "published_parsed") and entry.published_parsed:
+                    pub_date = datetime(*entry.published_parsed[:6])
+                elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
+                    pub_date = datetime(*entry.updated_parsed[:6])
+                else:
+                    pub_date = datetime.now()
+
+                # Get content - try multiple fields
+                content = ""
+                if hasattr(entry, "content") and entry.content:
+                    content = entry.content[0].get("value", "")
+                elif hasattr(entry, "summary"):
+                    content = entry.get("summary", "")
+                elif hasattr(entry, "description"):
+                    content = entry.get("description", "")
+
+                candidate = self._feed_candidate(title, link, content, source_name, pub_date, author)
+                if candidate is not None:
+                    candidates.append(candidate)
+
+            except Exception as e:
+                logger.debug(f"Skipping RSS entry: {e}")
+                continue
+
+        return candidates
+
+    def _atom_candidates(self, body: bytes, feed_url: str) -> List[Dict]:
+        """
+        Extract candidate articles from an Atom feed with lxml's streaming
+        iterparse, stopping after ENTRIES_PER_FEED entries.
+
+        Raises:
+            etree.XMLSyntaxError: On malformed XML (callers fall back to feedparser)
+        """
+        source_name = feed_url
+        candidates = []
+        seen = 0
+
+        events = etree.iterparse(
+            io.BytesIO(body), events=("end",), tag=(f"{_ATOM}entry", f"{_ATOM}title"),
+            resolve_entities=False, no_network=True,
+        )
+        for _, element in events:
+            if element.tag == f"{_ATOM}title":
+                if element.getparent().tag == f"{_ATOM}feed":
+                    source_name = (element.text or "").strip() or feed_url
+                continue
+
+            try:
+                link = ""
+                for link_element in element.iterfind(f"{_ATOM}link"):
+                    if link_element.get("rel", "alternate") == "alternate":
+                        link = link_element.get("href", "")
+                        break
+
+                content_element = element.find(f"{_ATOM}content")
+                if content_element is None:
+                    content_element = element.find(f"{_ATOM}summary")
+
+                pub_date = (
+                    _atom_datetime(element.findtext(f"{_ATOM}published"))
+                    or _atom_datetime(element.findtext(f"{_ATOM}updated"))
+                    or datetime.now()
+                )
+
+                candidate = self._feed_candidate(
+                    _atom_text(element.find(f"{_ATOM}title")).strip(),
+                    link,
+                    _atom_text(content_element),
+                    source_name,
+                    pub_date,
+                    element.findtext(f"{_ATOM}author/{_ATOM}name"),
+                )
+                if candidate is not None:
+                    candidates.append(candidate)
+            except Exception as e:
+                logger.debug(f"Skipping Atom entry: {e}")
+            finally:
+                # Streamed entries are done with; keep the tree from growing
+                element.clear()
+
+            seen += 1
+            if seen >= ENTRIES_PER_FEED:
+                break
+
+        return candidates
+
+    def _feed_candidate(self, title: str, link: str, content: str, source: str,
+                        pub_date: datetime, author: Optional[str]) -> Optional[Dict]:
+        """Candidate dict for a feed entry, or None if it can never pass the word filter"""
+        # No page to scrape and too few words even counting markup: can't pass the filter
+        if not link and content.count(" ") + 1 < self.min_content_words:
+            return None
+        if self._is_seen(link):
+            return None
+        # Feeds are parsed without feedparser's sanitizer, so markup in titles
+        # and bylines (including <script>) is stripped here along with content
+        return {
+            "url": link,
+            "title": self._clean_html(title),
+            "content": self._clean_html(content),
+            "source": self._clean_html(source),
+            "published_date": pub_date,
+            "author": self._clean_html(author) if author else author,
+        }
+
+    def _newsapi_candidates(self, data: dict) -> List[Dict]:
+        """Extract candidate articles from a NewsAPI response body"""
+        if data.get("status") != "ok":
+            logger.warning(f"NewsAPI returned status: {data.get('status')}")
+            return []
+
+        candidates = []
+        for item in data.get("articles", []):
+            try:
+                if self._is_seen(item.get("url", "")):
+                    continue
+                content = item.get("content", "") or item.get("description", "") or ""
+
+                pub_date_str = item.get("publishedAt", "")
+                try:
+                    pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
+                    pub_date = pub_date.replace(tzinfo=None)
+                except (ValueError, AttributeError):
+                    pub_date = datetime.now()
+
+                candidates.append({
+                    "url": item.get("url", ""),
+                    "title": item.get("title", "").strip(),
+                    # NewsAPI truncates content; short entries get a full scrape
+                    "content": self._clean_html(content),
+                    "source": item.get("source", {}).get("name", "NewsAPI"),
+                    "published_date": pub_date,
+                    "author": item.get("author", None),
+                })
+
+            except Exception as e:
+                logger.debug(f"Skipping NewsAPI article: {e}")
+                continue
+
+        return candidates
+
+    def _newsapi_params(self, query: str, page_size: int) -> dict:
+        """Query string for a NewsAPI request"""
+        return {
+            "q": query,
+            "pageSize": page_size,
+            "sortBy": "publishedAt",
+            "language": "en",
+            "apiKey": self.newsapi_key,
+        }
+
+    @staticmethod
+    def _extract_article_text(html: bytes, utf8: bool = False) -> str:
+        """
+        Pull the article body out of a page's HTML.
+
+        Args:
+            html: Raw page bytes
+            utf8: Whether the response declared UTF-8 (skips encoding detection)
+
+        Returns:
+            Paragraph text joined by spaces
+        """
+        if LXML_AVAILABLE:
+            # Walk the libxml2 tree directly: no BeautifulSoup wrapper object per node
+            parser = lxml.html.HTMLParser(encoding="utf-8" if utf8 else None)
+            tree = lxml.html.document_fromstring(html, parser=parser)
+            etree.strip_elements(tree, *_NON_CONTENT_TAGS, with_tail=False)
+
+            # Try to find article content in common containers
+            container = tree.find(".//article")
+            if container is None:
+                container = tree.find(".//main")
+            paragraphs = (container if container is not None else tree).iter("p")
+
+            text_parts = []
+            for p in paragraphs:
+                text = p.text_content().strip()
+                if len(text) > _MIN_PARAGRAPH_CHARS:  # Skip very short paragraphs
+                    text_parts.append(text)
+            return " ".join(text_parts)
+
+        soup = BeautifulSoup(html, HTML_PARSER, from_encoding="utf-8" if utf8 else None)
+
+        # Remove script and style elements
+        for element in soup(list(_NON_CONTENT_TAGS)):
+            element.decompose()
+
+        # Try to find article content in common containers
+        article = soup.find("article") or soup.find("main")
+        if article:
+            paragraphs = article.find_all("p")
+        else:
+            paragraphs = soup.find_all("p")
+
+        text_parts = []
+        for p in paragraphs:
+            text = p.get_text(strip=True)
+            if len(text) > _MIN_PARAGRAPH_CHARS:  # Skip very short paragraphs
+                text_parts.append(text)
+
+        return " ".join(text_parts)
+
+    # --- Concurrent (aiohttp) fetching ---
+
+    async def _get_with_retry(self, session, url: str, params: Optional[dict] = None,
+                              headers: Optional[dict] = None,
+                              skip: Optional[Callable[[], bool]] = None) -> Tuple[bytes, str]:
+        """
+        GET a URL, retrying connection errors, timeouts and 429/5xx with exponential backoff.
+        Requests run under the host's adaptive concurrency limit, which shrinks
+        (and honours Retry-After) when the host signals overload. skip is checked
+        once a slot is held, so queued requests can be dropped without being sent.
+
+        Returns:
+            (body, content type)
+        """
+        limiter = self._host_limiters.for_url(url)
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            try:
+                async with limiter.slot():
+                    if skip is not None and skip():
+                        raise FetchError(f"Skipped {url}")
+                    async with session.get(url, params=params, headers=headers) as response:
+                        if response.status in _OVERLOAD_STATUSES:
+                            limiter.on_overload(retry_after_seconds(response.headers))
+                        elif response.status < 400:
+                            limiter.on_success()
+                        if response.status in _RETRY_STATUSES and attempt < attempts - 1:
+                            raise aiohttp.ClientResponseError(
+                                response.request_info, response.history, status=response.status
+                            )
+                        response.raise_for_status()
+                        return await response.read(), response.headers.get("content-type", "")
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    limiter.on_overload()
+                if attempt == attempts - 1:
+                    raise
+                if isinstance(e, aiohttp.ClientResponseError) and e.status not in _RETRY_STATUSES:
+                    raise
+                delay = RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                logger.debug(f"Retrying {url} in {delay}s after: {e}")
+                await asyncio.sleep(delay)
+
+    async def _fetch_from_rss_async(self, session, feed_url: str) -> List[Dict]:
+        """Download and parse one RSS feed into candidate dicts"""
+        try:
+            body, content_type = await self._get_with_retry(session, feed_url)
+            # Feed parsing is CPU-bound; keep it off the event loop
+            if LXML_AVAILABLE and _feed_kind(body) == "feed":
+                try:
+                    return await asyncio.to_thread(self._atom_candidates, body, feed_url)
+                except etree.XMLSyntaxError as e:
+                    logger.debug(f"Atom fast path failed for {feed_url}, using feedparser: {e}")
+            feed = await _parse_feed_async(body, content_type)
+            del body  # the raw feed isn't needed once parsed
+            return await asyncio.to_thread(self._rss_candidates, feed, feed_url)
+        except Exception as e:
+            raise FetchError(f"RSS fetch failed for {feed_url}: {e}")
+
+    async def _fetch_from_newsapi_async(self, session, query: str = "latest news",
+                                        page_size: int = 20) -> List[Dict]:
+        """Query NewsAPI into candidate dicts"""
+        try:
+            body, _ = await self._get_with_retry(
+                session, NEWSAPI_URL, params=self._newsapi_params(query, page_size)
+            )
+            return self._newsapi_candidates(orjson.loads(body))
+        except Exception as e:
+            raise FetchError(f"NewsAPI fetch failed: {e}")
+
+    async def _scrape_article_content_async(self, session, url: str,
+                                            skip: Optional[Callable[[], bool]] = None) -> str:
+        """Scrape article content from a URL; empty string on any failure"""
+        try:
+            body, content_type = await self._get_with_retry(
+                session, url, headers=SCRAPE_HEADERS, skip=skip
+            )
+            return await asyncio.to_thread(
+                self._extract_article_text, body, _declares_utf8(content_type)
+            )
+        except Exception as e:
+            logger.debug(f"Web scraping failed for {url}: {e}")
+            return ""
+
+    # --- Blocking (requests) fetching ---
+
+    def _make_session(self):
+        """requests.Session with pooled connections and backoff retries on gateway errors"""
+        retry = Retry(
+            total=self.max_retries,
+            backoff_factor=RETRY_BACKOFF_SECONDS,
+            status_forcelist=[502, 503, 504],
+        )
+        adapter = HTTPAdapter(
+            pool_connections=MAX_CONNECTIONS_PER_HOST,
+            pool_maxsize=MAX_CONNECTIONS_PER_HOST,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     def _fetch_from_rss(self, feed_url: str) -> List[RawArticle]:
         """Fetch articles from an RSS feed"""
         if not FEEDPARSER_AVAILABLE or not BS4_AVAILABLE:
             logger.warning("feedparser or beautifulsoup4 not available - skipping RSS")
             return []
-        
-        articles = []
 
         try:
-            import feedparser
-            from bs4 import BeautifulSoup
-            
-            feed = feedparser.parse(feed_url)
-
-            if feed.bozo and not feed.entries:
-                logger.warning(f"RSS feed error for {feed_url}: {feed.bozo_exception}")
-                return articles
-
-            source_name = feed.feed.get("title", feed_url)
+            if REQUESTS_AVAILABLE:
+                response = self._http.get(feed_url, timeout=self.timeout)
+                response.raise_for_status()
+                feed = _parse_feed(response.content, response.headers.get("content-type"))
+            else:
+                feed = _parse_feed(feed_url)
+            candidates = self._rss_candidates(feed, feed_url)
 
-            for entry in feed.entries[:20]:  # Limit per feed
-                try:
-                    title = entry.get("title", "").strip()
-                    link = entry.get("link", "")
-                    author = entry.get("author", None)
-
-                    # Get published date
-                    pub_date = None
-                    if hasattr(entry, "published_parsed") and entry.published_parsed:
-                        pub_date = datetime(*entry.published_parsed[:6])
-                    elif hasattr(entry, "updated_parsed") and entry.updated_parsed:
-                        pub_date = datetime(*entry.updated_parsed[:6])
-                    else:
-                        pub_date = datetime.now()
-
-                    # Get content - try multiple fields
-                    content = ""
-                    if hasattr(entry, "content") and entry.content:
-                        content = entry.content[0].get("value", "")
-                    elif hasattr(entry, "summary"):
-                        content = entry.get("summary", "")
-                    elif hasattr(entry, "description"):
-                        content = entry.get("description", "")
-
-                    # Clean HTML from content
-                    if content:
-                        soup = BeautifulSoup(content, "html.parser")
-                        content = soup.get_text(separator=" ", strip=True)
-
-                    # If content is too short, try to fetch the full page
-                    if len(content.split()) < self.min_content_words and link:
-                        try:
-                            full_content = self._scrape_article_content(link)
-                            if full_content and len(full_content.split()) > len(content.split()):
-                                content = full_content
-                        except Exception:
-                            pass
-
-                    if not title or not content:
-                        continue
-
-                    article = RawArticle(
-                        url=link,
-                        title=title,
-                        content=content,
-                        source=source_name,
-                        published_date=pub_date,
-                        author=author,
-                    )
-                    articles.append(article)
-
-                except Exception as e:
-                    logger.debug(f"Skipping RSS entry: {e}")
-                    continue
+            # If content is too short, try to fetch the full page
+            for candidate in candidates:
+                if candidate["url"] and self._is_short(candidate["content"]):
+                    self._scrape_candidate(candidate)
 
         except Exception as e:
             raise FetchError(f"RSS fetch failed for {feed_url}: {e}")
 
-        return articles
+        return self._build_articles(candidates)
 
     def _fetch_from_newsapi(self, query: str = "latest news", page_size: int = 20) -> List[RawArticle]:
         """Fetch articles from NewsAPI"""
         if not REQUESTS_AVAILABLE or not BS4_AVAILABLE:
             logger.warning("requests or beautifulsoup4 not available - skipping NewsAPI")
             return []
-        
-        articles = []
 
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
-            url = "https://newsapi.org/v2/everything"
-            params = {
-                "q": query,
-                "pageSize": page_size,
-                "sortBy": "publishedAt",
-                "language": "en",
-                "apiKey": self.newsapi_key,
-            }
-
-            response = requests.get(url, params=params, timeout=self.timeout)
+            response = self._http.get(
+                NEWSAPI_URL, params=self._newsapi_params(query, page_size), timeout=self.timeout
+            )
             response.raise_for_status()
-            data = response.json()
-
-            if data.get("status") != "ok":
-                logger.warning(f"NewsAPI returned status: {data.get('status')}")
-                return articles
-
-            for item in data.get("articles", []):
-                try:
-                    title = item.get("title", "").strip()
-                    content = item.get("content", "") or item.get("description", "") or ""
-                    url_str = item.get("url", "")
-                    source = item.get("source", {}).get("name", "NewsAPI")
-                    author = item.get("author", None)
-
-                    pub_date_str = item.get("publishedAt", "")
-                    try:
-                        pub_date = datetime.fromisoformat(pub_date_str.replace("Z", "+00:00"))
-                        pub_date = pub_date.replace(tzinfo=None)
-                    except (ValueError, AttributeError):
-                        pub_date = datetime.now()
-
-                    # Clean content
-                    if content:
-                        soup = BeautifulSoup(content, "html.parser")
-                        content = soup.get_text(separator=" ", strip=True)
-                        # NewsAPI truncates content - try full scrape
-                        if len(content.split()) < self.min_content_words and url_str:
-                            try:
-                                full_content = self._scrape_article_content(url_str)
-                                if full_content and len(full_content.split()) > len(content.split()):
-                                    content = full_content
-                            except Exception:
-                                pass
-
-                    if not title or not content:
-                        continue
-
-                    article = RawArticle(
-                        url=url_str,
-                        title=title,
-                        content=content,
-                        source=source,
-                        published_date=pub_date,
-                        author=author,
-                    )
-                    articles.append(article)
+            candidates = self._newsapi_candidates(response.json())
 
-                except Exception as e:
-                    logger.debug(f"Skipping NewsAPI article: {e}")
-                    continue
+            # NewsAPI truncates content - try full scrape
+            for candidate in candidates:
+                if candidate["url"] and self._is_short(candidate["content"]):
+                    self._scrape_candidate(candidate)
 
         except requests.RequestException as e:
             raise FetchError(f"NewsAPI fetch failed: {e}")
 
-        return articles
+        return self._build_articles(candidates)
 
     def _scrape_article_content(self, url: str) -> str:
         """Scrape article content from a URL using BeautifulSoup"""
         if not REQUESTS_AVAILABLE or not BS4_AVAILABLE:
             return ""
-        
+
         try:
-            import requests
-            from bs4 import BeautifulSoup
-            
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            response = self._http.get(url, headers=SCRAPE_HEADERS, timeout=self.timeout)
             response.raise_for_status()
-
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # Remove script and style elements
-            for element in soup(["script", "style", "nav", "header", "footer", "aside"]):
-                element.decompose()
-
-            # Try to find article content in common containers
-            article = soup.find("article") or soup.find("main")
-            if article:
-                paragraphs = article.find_all("p")
-            else:
-                paragraphs = soup.find_all("p")
-
-            text_parts = []
-            for p in paragraphs:
-                text = p.get_text(strip=True)
-                if len(text) > 30:  # Skip very short paragraphs
-                    text_parts.append(text)
-
-            return " ".join(text_parts)
+            # Hand bs4 the raw bytes; a declared UTF-8 charset skips encoding detection
+            return self._extract_article_text(
+                response.content, _declares_utf8(response.headers.get("content-type", ""))
+            )
 
         except Exception as e:
             logger.debug(f"Web scraping failed for {url}: {e}")
@@ -338,18 +947,30 @@ class ArticleFetcher:
         Returns:
             Deduplicated list
         """
+        # content_hash is computed once in RawArticle.__post_init__
+        seen_urls = set(map(_URL, articles))
+        seen_hashes = set(map(_CONTENT_HASH, articles))
+        if len(seen_urls) == len(articles) and len(seen_hashes) == len(articles):
+            # Common case, settled by two C-level set builds: nothing repeats
+            logger.info(f"Deduplicated {len(articles)} to {len(articles)} articles")
+            return list(articles)
+
         seen_hashes = set()
         seen_urls = set()
         unique_articles = []
+        add_hash, add_url, keep = seen_hashes.add, seen_urls.add, unique_articles.append
+        log_duplicates = logger.isEnabledFor(logging.DEBUG)
 
         for article in articles:
-            if article.content_hash in seen_hashes or article.url in seen_urls:
-                logger.debug(f"Duplicate article found: {article.title}")
+            content_hash, url = article.content_hash, article.url
+            if content_hash in seen_hashes or url in seen_urls:
+                if log_duplicates:
+                    logger.debug(f"Duplicate article found: {article.title}")
                 continue
 
-            seen_hashes.add(article.content_hash)
-            seen_urls.add(article.url)
-            unique_articles.append(article)
+            add_hash(content_hash)
+            add_url(url)
+            keep(article)
 
         logger.info(f"Deduplicated {len(articles)} to {len(unique_articles)} articles")
         return unique_articles
@@ -365,13 +986,17 @@ class ArticleFetcher:
             RawArticle or None
         """
         try:
-            content = self._scrape_article_content(url)
+            # One download; both parsers read the raw bytes, never a decoded str copy
+            response = self._http.get(url, headers=SCRAPE_HEADERS, timeout=self.timeout)
+            response.raise_for_status()
+            body = response.content
+            utf8 = _declares_utf8(response.headers.get("content-type", ""))
+
+            content = self._extract_article_text(body, utf8)
             if not content:
                 return None
 
-            headers = {"User-Agent": "Mozilla/5.0"}
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(body, HTML_PARSER, from_encoding="utf-8" if utf8 else None)
 
             title = ""
             title_tag = soup.find("title")
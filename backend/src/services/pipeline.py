@@ -1,54 +1,93 @@
 """Main processing pipeline - wires all services together"""
+import asyncio
 import logging
 import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
-from ..models.article import Article, RawArticle
+from ..models.article import Article, RawArticle, CONTENT_HASH_ALGORITHM
 from ..services.compressor import ContentCompressor
 from ..services.fetcher import ArticleFetcher
 from ..services.summarizer import Summarizer
-from ..services.clusterer import TopicClusterer
+from ..services.clusterer import TopicClusterer, embedding_text
 from ..services.store import ArticleStore
 from ..services.cache import CacheManager
 
 logger = logging.getLogger(__name__)
 
 
+def _recluster(
+    clusterer: TopicClusterer, articles: List[Article]
+) -> Tuple[Dict[int, List[str]], List[Article]]:
+    """
+    Cluster articles and pick out the ones worth persisting.
+
+    Args:
+        clusterer: Clusterer to run
+        articles: Stored articles to cluster (assigned in place)
+
+    Returns:
+        The cluster map, and the articles whose cluster changed or that
+        gained an embedding. Every run hands out fresh embedding views, so
+        an embedding that was already stored does not count as changed.
+    """
+    before = {a.id: (a.cluster_id, a.embedding is None) for a in articles}
+    cluster_map = clusterer.cluster_articles(articles)
+    changed = [
+        a for a in articles
+        if a.cluster_id is not None
+        and (
+            a.cluster_id != before[a.id][0]
+            or (before[a.id][1] and a.embedding is not None)
+        )
+    ]
+    return cluster_map, changed
+
+
 class Pipeline:
     """
     Main processing pipeline.
-    Orchestrates: Fetch → Compress → Store → Summarize → Cluster
+    Orchestrates: Fetch → Compress + Summarize → Store → Cluster
     """
 
     def __init__(self):
         from config.settings import settings
 
-        self.compressor = ContentCompressor()
+        self.compressor = ContentCompressor.instance()
         self.fetcher = ArticleFetcher(
             newsapi_key=settings.fetcher.newsapi_key,
             rss_feeds=settings.fetcher.rss_feeds,
             timeout=settings.fetcher.timeout,
             max_retries=settings.fetcher.max_retries,
             min_content_words=settings.fetcher.min_content_words,
+            seen_filter_path=settings.fetcher.seen_filter_path,
         )
         self.summarizer = Summarizer(
             model_name=settings.summarizer.model_name,
             max_length=settings.summarizer.max_summary_words,
             use_gpu=settings.summarizer.use_gpu,
             num_beams=settings.summarizer.num_beams,
+            batch_size=settings.summarizer.batch_size,
+            quantize=settings.summarizer.quantize,
+            compile_model=settings.summarizer.compile,
         )
         self.clusterer = TopicClusterer(
             embedding_model_name=settings.clusterer.embedding_model,
+            embedding_backend=settings.clusterer.embedding_backend,
+            static_embedding_model=(
+                settings.clusterer.static_embedding_model
+                if settings.clusterer.use_static_embeddings else None
+            ),
             min_cluster_size=settings.clusterer.min_cluster_size,
             min_samples=settings.clusterer.min_samples,
             max_cluster_articles=settings.clusterer.max_cluster_articles,
             similarity_threshold=settings.clusterer.similarity_threshold,
+            use_gpu=settings.clusterer.use_gpu,
         )
         self.store = ArticleStore()
         self.cache = CacheManager()
 
-        logger.info("Processing pipeline initialized")
+        logger.info(f"Processing pipeline initialized (content hash: {CONTENT_HASH_ALGORITHM})")
 
     async def process_articles(self, count: int = 50) -> dict:
         """
@@ -71,7 +110,7 @@ class Pipeline:
         try:
             # Step 1: Fetch articles
             logger.info(f"Pipeline: Fetching up to {count} articles...")
-            raw_articles = self.fetcher.fetch_articles(count=count)
+            raw_articles = await self.fetcher.fetch_articles_async(count=count)
             results["fetched"] = len(raw_articles)
             logger.info(f"Pipeline: Fetched {len(raw_articles)} articles")
 
@@ -79,53 +118,77 @@ class Pipeline:
                 logger.warning("No articles fetched")
                 return results
 
-            # Step 2: Compress and store articles
+            # Step 2: Compress, summarize and embed each article from the plaintext
+            # already in hand, then store them all in one bulk write
             stored_articles = []
+            contents = []
+            embedding_texts = []
             for raw in raw_articles:
                 try:
-                    article = self._process_raw_article(raw)
-                    article_id = await self.store.save_article(article)
-                    article.id = article_id
-                    stored_articles.append(article)
-                    results["stored"] += 1
+                    stored_articles.append(self._process_raw_article(raw))
+                    contents.append(raw.content)
+                    embedding_texts.append(embedding_text(raw.title, raw.content))
                 except Exception as e:
                     logger.error(f"Failed to process article '{raw.title}': {e}")
                     results["errors"].append(f"Store: {raw.title} - {str(e)}")
 
-            logger.info(f"Pipeline: Stored {len(stored_articles)} articles")
-
-            # Step 3: Generate summaries
-            for article in stored_articles:
-                try:
-                    content = self.compressor.decompress(article.compressed_content)
-                    summary = self.summarizer.summarize(content)
+            # One model pass per batch of articles rather than per article
+            try:
+                summaries = await self.summarizer.abatch_summarize(contents)
+                for article, summary in zip(stored_articles, summaries):
                     article.summary = summary
-                    await self.store.save_article(article)
-                    results["summarized"] += 1
-                except Exception as e:
-                    logger.error(f"Summarization failed for '{article.title}': {e}")
-                    results["errors"].append(f"Summary: {article.title} - {str(e)}")
+                results["summarized"] = len(summaries)
+            except Exception as e:
+                logger.error(f"Summarization failed: {e}")
+                results["errors"].append(f"Summary: {str(e)}")
 
             logger.info(f"Pipeline: Summarized {results['summarized']} articles")
 
-            # Step 4: Cluster articles
+            # Title categories are fixed, so the keyword fallback never rescans them
+            self.clusterer.categorize_articles(stored_articles)
+
+            # Embedding now, from the plain text, spares clustering a decompress per
+            # article; the model runs in a worker thread, off the event loop
+            try:
+                await asyncio.to_thread(self.clusterer.embed_articles, stored_articles, embedding_texts)
+            except Exception as e:
+                logger.warning(f"Ingest-time embedding failed, clustering will encode: {e}")
+
+            try:
+                durable = await self.store.persist_articles(stored_articles)
+                results["stored"] = len(stored_articles)
+                # Only articles in MongoDB count as seen: the seen filter outlives a
+                # restart, the in-memory fallback does not, so those are refetched
+                if durable:
+                    self.fetcher.mark_seen(stored_articles)
+                else:
+                    logger.warning("Pipeline: articles kept in memory only, not marked seen")
+            except Exception as e:
+                logger.error(f"Failed to store articles: {e}")
+                results["errors"].append(f"Store: {str(e)}")
+                stored_articles = []
+                results["summarized"] = 0
+
+            logger.info(f"Pipeline: Stored {len(stored_articles)} articles")
+
+            # Step 3: Cluster articles
             try:
                 all_articles = await self.store.get_all_articles()
                 if all_articles:
-                    cluster_map = self.clusterer.cluster_articles(all_articles)
+                    cluster_map, changed = _recluster(self.clusterer, all_articles)
                     results["clustered"] = len(cluster_map)
 
-                    # Update articles with cluster assignments
-                    for article in all_articles:
-                        if article.cluster_id is not None:
-                            await self.store.save_article(article)
+                    # Persist only new assignments or embeddings, in one bulk write;
+                    # steady-state runs mostly reassign the same clusters
+                    await self.store.save_cluster_assignments(changed)
+                    logger.info(f"Pipeline: {len(changed)} cluster assignments changed")
 
                     logger.info(f"Pipeline: Created {len(cluster_map)} clusters")
             except Exception as e:
                 logger.error(f"Clustering failed: {e}")
                 results["errors"].append(f"Clustering: {str(e)}")
 
-            # Step 5: Invalidate cache
+            # Step 4: Invalidate cache
             await self.cache.clear()
             logger.info("Pipeline: Cache cleared after processing")
 
@@ -137,7 +200,7 @@ class Pipeline:
 
     def _process_raw_article(self, raw: RawArticle) -> Article:
         """Convert raw article to stored article with compression"""
-        compressed = self.compressor.compress(raw.content)
+        compressed = self.compressor.compress_bytes(raw.content_bytes)
 
         return Article(
             id=str(uuid.uuid4()),
@@ -164,7 +227,5 @@ class Pipeline:
             "total_articles": article_count,
             "total_clusters": cluster_count,
             "cache_size": cache_size,
-            "sources": list(set(
-                a.source for a in (await self.store.get_all_articles())
-            )) if article_count > 0 else [],
+            "sources": await self.store.get_sources() if article_count > 0 else [],
         }
@@ -0,0 +1,128 @@
+"""Adaptive per-host concurrency limiting for outbound scraping"""
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Longest server-requested pause honoured. The pause is slept inside a slot,
+# outside any socket timeout, so a "Retry-After: 86400" would stall the run
+MAX_SERVER_PAUSE_SECONDS = 10.0
+
+
+def retry_after_seconds(headers) -> Optional[float]:
+    """
+    Server-requested pause from Retry-After (seconds or HTTP date), or from an
+    exhausted X-RateLimit-Remaining with X-RateLimit-Reset.
+
+    Args:
+        headers: Response headers mapping
+
+    Returns:
+        Seconds to wait, or None if the server asked for nothing
+    """
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                return max(0.0, parsedate_to_datetime(retry_after).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+
+    if headers.get("X-RateLimit-Remaining") == "0":
+        reset = headers.get("X-RateLimit-Reset")
+        try:
+            reset = float(reset)
+        except (TypeError, ValueError):
+            return None
+        # Reset is either an epoch timestamp or a delta in seconds
+        return max(0.0, reset - time.time()) if reset > 1e9 else reset
+    return None
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for one host: grows by about one slot per window of
+    successful requests and halves when the host pushes back (429/503,
+    timeouts). A server-requested pause holds back every new request to the host.
+    """
+
+    def __init__(self, initial_limit: int = 4, min_limit: int = 1, max_limit: int = 64):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.in_flight = 0
+        self.resume_at = 0.0  # time.monotonic() before which no request starts
+        # Futures are made from the running loop at wait time, so one limiter can
+        # outlive the event loop of a single fetch run
+        self._waiters: deque = deque()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one concurrency slot for the duration of a request"""
+        while self.in_flight >= int(self.limit):
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self.in_flight += 1
+        try:
+            delay = self.resume_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield
+        finally:
+            self.in_flight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        """Let waiters re-check the limit after a release or a limit change"""
+        free = int(self.limit) - self.in_flight
+        while self._waiters and free > 0:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def on_success(self) -> None:
+        """Additive increase: roughly +1 slot after a full window of successes"""
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+        self._wake()
+
+    def on_overload(self, pause: Optional[float] = None) -> None:
+        """Multiplicative decrease, plus an optional server-requested pause (capped)"""
+        self.limit = max(self.min_limit, self.limit / 2)
+        if pause and pause > MAX_SERVER_PAUSE_SECONDS:
+            logger.debug(f"Host asked for a {pause}s pause; capping at {MAX_SERVER_PAUSE_SECONDS}s")
+            pause = MAX_SERVER_PAUSE_SECONDS
+        if pause:
+            self.resume_at = max(self.resume_at, time.monotonic() + pause)
+        logger.debug(f"Host pushed back; limit now {int(self.limit)}, pause {pause or 0}s")
+
+
+class HostLimiters:
+    """AdaptiveLimiter per URL host, created on first use"""
+
+    def __init__(self, initial_limit: int = 4, max_limit: int = 64):
+        self.initial_limit = initial_limit
+        self.max_limit = max_limit
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def for_url(self, url: str) -> AdaptiveLimiter:
+        """Limiter for the URL's host"""
+        host = urlparse(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = AdaptiveLimiter(self.initial_limit, max_limit=self.max_limit)
+            self._limiters[host] = limiter
+        return limiter
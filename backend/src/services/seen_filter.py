@@ -0,0 +1,87 @@
+"""Persistent Bloom filter of already-ingested article URLs and content hashes"""
+import hashlib
+import logging
+import math
+import os
+import struct
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+# File header: bit count and hash count, little-endian
+_HEADER = struct.Struct("<QI")
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings. Membership tests can give false
+    positives at about error_rate once capacity keys are added, never false
+    negatives. Bit positions come from double hashing one BLAKE2b digest.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        """Bit indexes for a key"""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+
+    def add(self, key: str) -> None:
+        """Add a key"""
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+
+    def update(self, keys: Iterable[str]) -> None:
+        """Add several keys"""
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: str) -> None:
+        """Write the filter to path, replacing any previous file atomically"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(self.num_bits, self.num_hashes))
+            f.write(self.bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, capacity: int = 1_000_000, error_rate: float = 0.001) -> "BloomFilter":
+        """
+        Read a filter saved by save(); an empty filter if the file is missing,
+        unreadable or was built for a different size.
+
+        Args:
+            path: File written by save()
+            capacity: Expected number of keys
+            error_rate: Target false-positive rate at capacity
+
+        Returns:
+            BloomFilter
+        """
+        bloom = cls(capacity, error_rate)
+        try:
+            with open(path, "rb") as f:
+                num_bits, num_hashes = _HEADER.unpack(f.read(_HEADER.size))
+                bits = f.read()
+        except FileNotFoundError:
+            return bloom
+        except (OSError, struct.error) as e:
+            logger.warning(f"Could not read seen-article filter {path}: {e}")
+            return bloom
+
+        if (num_bits, num_hashes) != (bloom.num_bits, bloom.num_hashes) or len(bits) != len(bloom.bits):
+            logger.warning(f"Seen-article filter {path} has a different size; starting empty")
+            return bloom
+        bloom.bits = bytearray(bits)
+        return bloom
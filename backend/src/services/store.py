@@ -1,17 +1,65 @@
 """Real article storage service using MongoDB with async Motor"""
 import logging
-import json
-from typing import List, Optional, Tuple
-from datetime import datetime, timedelta
-import uuid
+import math
 import re
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from itertools import islice
+from operator import attrgetter
+from typing import AsyncIterator, Callable, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import uuid
+
+import numpy as np
+import orjson
 
-from ..models.article import Article, QueryFilters
+from ..models.article import Article, QueryFilters, CONTENT_HASH_ALGORITHM, content_digest
 from ..core.exceptions import ArticleNotFoundError, DatabaseError
 from ..core.error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+# insert_many batch size and MongoDB's duplicate-key error code
+BULK_INSERT_CHUNK_SIZE = 1000
+DUPLICATE_KEY_ERROR = 11000
+
+# In-memory index entries are (_EPOCH - published_date, insertion seq, id), so
+# ascending order is newest first and ties keep insertion order
+_EPOCH = datetime(1970, 1, 1)
+
+# Default cap on get_all_articles from MongoDB; the in-memory store is returned whole
+ALL_ARTICLES_DB_LIMIT = 10000
+
+# Date fields that must be stored as BSON dates for range queries to use indexes
+_DATE_FIELDS = ("published_date", "fetched_date")
+
+
+def _as_datetime(value) -> datetime:
+    """
+    Coerce a stored or incoming date to a naive UTC datetime. ISO strings
+    (e.g. from a JSON round-trip) are parsed so they are never written as text.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not isinstance(value, datetime):
+        raise TypeError(f"Expected a datetime, got {type(value).__name__}")
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Words for the in-memory search, like the tokens of MongoDB's text index
+_WORD_RE = re.compile(r"\w+")
+
+
+def _search_words(text: str) -> frozenset:
+    """Distinct lowercased words of text"""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+# Heavy fields left out of list queries unless include_body is set
+_LIST_EXCLUDED_FIELDS = {"compressed_content": 0, "embedding": 0}
+
 # Try to import DB module; fall back to in-memory if not available
 _db_available = False
 
@@ -22,6 +70,13 @@ except ImportError:
     logger.warning("Database module not available, using in-memory storage")
 
 
+def _remove_sorted(index: list, entry: tuple) -> None:
+    """Remove entry from a sorted index list, if present"""
+    i = bisect_left(index, entry)
+    if i < len(index) and index[i] == entry:
+        del index[i]
+
+
 class ArticleStore:
     """
     Production article storage service.
@@ -30,10 +85,40 @@ class ArticleStore:
 
     def __init__(self):
         """Initialize storage"""
-        self._memory_articles: dict[str, Article] = {}
+        self.clear_memory()
         self._use_db = _db_available
+        # articles collection handle, resolved once instead of per operation
+        self._collection = None
         logger.info(f"ArticleStore initialized ({'MongoDB' if self._use_db else 'in-memory'} mode)")
 
+    def clear_memory(self) -> None:
+        """Empty the in-memory fallback and its indexes"""
+        self._memory_articles: dict[str, Article] = {}
+        # Title and summary words for the in-memory search filter, kept in step with writes
+        self._search_index: dict[str, frozenset] = {}
+        # Sorted newest-first indexes over the in-memory articles, overall and per
+        # source / cluster, so queries walk a slice instead of sorting everything
+        self._by_date: list = []
+        self._by_source: dict[str, list] = defaultdict(list)
+        self._by_cluster: dict[int, list] = defaultdict(list)
+        # id -> (index entry, source, cluster_id) as last indexed
+        self._index_keys: dict[str, tuple] = {}
+        self._next_seq = 0
+
+    async def ensure_collection(self):
+        """
+        Resolve and cache the articles collection handle. Called at startup
+        so the first request does not pay for it, and by every operation to
+        get the handle; once resolved, calls are free.
+
+        Returns:
+            The articles collection, or None in in-memory mode
+        """
+        if self._collection is None and self._use_db:
+            db = await get_db()
+            self._collection = db["articles"]
+        return self._collection
+
     @handle_errors
     async def save_article(self, article: Article) -> str:
         """
@@ -50,42 +135,342 @@ class ArticleStore:
 
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
-
-                # Check if article already exists (by URL or content hash)
-                existing = await collection.find_one({
-                    "$or": [
-                        {"url": article.url},
-                        {"content_hash": article.content_hash or ""}
-                    ]
-                })
-
-                if existing:
-                    # Update existing article
-                    update_doc = self._to_document(article)
-                    update_doc.pop("_id", None)
-                    await collection.update_one(
-                        {"_id": existing["_id"]},
-                        {"$set": update_doc}
+                collection = await self.ensure_collection()
+
+                from pymongo import ReturnDocument
+                from pymongo.errors import DuplicateKeyError
+
+                new_id = article.id
+                try:
+                    stored = await collection.find_one_and_update(
+                        *self._url_upsert(article),
+                        upsert=True,
+                        projection={"_id": 0, "id": 1},
+                        return_document=ReturnDocument.AFTER,
                     )
-                    logger.debug(f"Updated existing article: {article.title}")
+                except DuplicateKeyError:
+                    stored = await collection.find_one(
+                        {"content_hash": article.content_hash or ""}, projection={"_id": 0, "id": 1}
+                    )
+                    if stored is None:
+                        raise
+                    logger.debug(f"Duplicate content, keeping existing article: {article.title}")
+                    article.id = stored["id"]
                     return article.id
 
-                # Insert new article
-                doc = self._to_document(article)
-                await collection.insert_one(doc)
-                logger.info(f"Saved article to MongoDB: {article.id}")
+                if stored["id"] != new_id:
+                    logger.debug(f"Updated existing article: {article.title}")
+                else:
+                    logger.info(f"Saved article to MongoDB: {article.id}")
+                article.id = stored["id"]
                 return article.id
 
             except Exception as e:
                 logger.error(f"MongoDB save failed, falling back to memory: {e}")
 
         # In-memory fallback
-        self._memory_articles[article.id] = article
+        self._memory_put(article)
         logger.info(f"Saved article to memory: {article.id}: {article.title}")
         return article.id
 
+    @handle_errors
+    async def save_articles(self, articles: List[Article]) -> List[str]:
+        """
+        Save a batch of articles with unordered bulk inserts (see persist_articles).
+
+        Args:
+            articles: Articles to save
+
+        Returns:
+            Article IDs, in input order
+        """
+        await self.persist_articles(articles)
+        return [a.id for a in articles]
+
+    @handle_errors
+    async def persist_articles(self, articles: List[Article]) -> bool:
+        """
+        Save a batch of articles with unordered bulk inserts.
+
+        Duplicates (by URL or content hash) are skipped by the bulk insert
+        and then upserted on URL in one bulk write, matching save_article:
+        an existing article keeps its id, and the same content under another
+        URL keeps the stored article. Article ids are updated in place.
+
+        Args:
+            articles: Articles to save
+
+        Returns:
+            True if the batch reached MongoDB; False if it is only in the
+            in-memory fallback, which does not survive a restart
+        """
+        for article in articles:
+            if not article.id:
+                article.id = str(uuid.uuid4())
+
+        if self._use_db and articles:
+            try:
+                from pymongo.errors import BulkWriteError
+
+                collection = await self.ensure_collection()
+
+                duplicates = []
+                for start in range(0, len(articles), BULK_INSERT_CHUNK_SIZE):
+                    chunk = articles[start:start + BULK_INSERT_CHUNK_SIZE]
+                    try:
+                        await collection.insert_many(
+                            [self._to_document(a) for a in chunk], ordered=False
+                        )
+                    except BulkWriteError as e:
+                        write_errors = e.details.get("writeErrors", [])
+                        if any(err.get("code") != DUPLICATE_KEY_ERROR for err in write_errors):
+                            raise
+                        duplicates.extend(chunk[err["index"]] for err in write_errors)
+
+                if duplicates:
+                    # Same effect as save_article's upsert, in one round trip
+                    from pymongo import UpdateOne
+                    updates = [UpdateOne(*self._url_upsert(a), upsert=True) for a in duplicates]
+                    content_duplicates = []
+                    try:
+                        await collection.bulk_write(updates, ordered=False)
+                    except BulkWriteError as e:
+                        # A new URL whose content is already stored trips content_hash
+                        write_errors = e.details.get("writeErrors", [])
+                        if any(err.get("code") != DUPLICATE_KEY_ERROR for err in write_errors):
+                            raise
+                        content_duplicates = [duplicates[err["index"]] for err in write_errors]
+                    await self._adopt_stored_ids(collection, duplicates, content_duplicates)
+
+                logger.info(
+                    f"Bulk saved {len(articles) - len(duplicates)} articles to MongoDB "
+                    f"({len(duplicates)} existing updated)"
+                )
+                return True
+
+            except Exception as e:
+                logger.error(f"MongoDB bulk save failed, falling back to memory: {e}")
+
+        # In-memory fallback
+        for article in articles:
+            self._memory_put(article)
+        logger.info(f"Saved {len(articles)} articles to memory")
+        return False
+
+    def _url_upsert(self, article: Article) -> Tuple[dict, dict]:
+        """
+        Filter and update saving an article by upsert on the unique url index
+        alone; an existing article keeps its id. The same content under another
+        URL trips the unique content_hash index instead of needing an $or lookup.
+        """
+        doc = self._to_document(article)
+        new_id = doc.pop("id")
+        return {"url": article.url}, {"$set": doc, "$setOnInsert": {"id": new_id}}
+
+    @staticmethod
+    async def _adopt_stored_ids(
+        collection, duplicates: List[Article], content_duplicates: List[Article]
+    ) -> None:
+        """
+        Give re-saved articles the ids already stored for them: by URL, or by
+        content hash for the ones whose content is stored under another URL.
+        """
+        projection = {"_id": 0, "id": 1, "url": 1, "content_hash": 1}
+        by_url = {
+            doc["url"]: doc["id"]
+            async for doc in collection.find(
+                {"url": {"$in": [a.url for a in duplicates]}}, projection=projection
+            )
+        }
+        by_hash = {}
+        if content_duplicates:
+            by_hash = {
+                doc["content_hash"]: doc["id"]
+                async for doc in collection.find(
+                    {"content_hash": {"$in": [a.content_hash or "" for a in content_duplicates]}},
+                    projection=projection,
+                )
+            }
+        for article in duplicates:
+            article.id = by_url.get(article.url) or by_hash.get(article.content_hash or "", article.id)
+
+    @handle_errors
+    async def save_cluster_assignments(self, articles: List[Article]) -> None:
+        """
+        Persist cluster ids (and any embeddings attached while clustering)
+        with one unordered bulk update instead of a full save per article.
+
+        Args:
+            articles: Stored articles whose cluster_id was just assigned
+        """
+        if self._use_db and articles:
+            try:
+                from pymongo import UpdateOne
+
+                collection = await self.ensure_collection()
+
+                for start in range(0, len(articles), BULK_INSERT_CHUNK_SIZE):
+                    chunk = articles[start:start + BULK_INSERT_CHUNK_SIZE]
+                    await collection.bulk_write([
+                        UpdateOne(
+                            {"id": a.id},
+                            {"$set": {
+                                "cluster_id": a.cluster_id,
+                                "embedding": self._embedding_field(a),
+                            }},
+                        )
+                        for a in chunk
+                    ], ordered=False)
+                logger.info(f"Bulk updated cluster assignments for {len(articles)} articles")
+                return
+
+            except Exception as e:
+                logger.error(f"MongoDB bulk cluster update failed, falling back to memory: {e}")
+
+        # In-memory fallback
+        for article in articles:
+            self._memory_put(article)
+
+    async def migrate_embeddings(self) -> int:
+        """
+        Rewrite embeddings stored by older versions as JSON list strings into
+        float32 bytes. Safe to run repeatedly; already migrated documents
+        are not matched.
+
+        Returns:
+            Number of documents rewritten
+        """
+        if not self._use_db:
+            return 0
+        try:
+            from pymongo import UpdateOne
+
+            collection = await self.ensure_collection()
+            cursor = collection.find(
+                {"embedding": {"$type": "string"}}, projection={"_id": 1, "embedding": 1}
+            )
+
+            migrated = 0
+            ops = []
+            async for doc in cursor:
+                embedding = self._embedding_from_field(doc["embedding"])
+                value = embedding.tobytes() if embedding is not None else None
+                ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"embedding": value}}))
+                if len(ops) == BULK_INSERT_CHUNK_SIZE:
+                    await collection.bulk_write(ops, ordered=False)
+                    migrated += len(ops)
+                    ops = []
+            if ops:
+                await collection.bulk_write(ops, ordered=False)
+                migrated += len(ops)
+
+            if migrated:
+                logger.info(f"Migrated {migrated} JSON embeddings to float32 binary")
+            return migrated
+
+        except Exception as e:
+            logger.error(f"Embedding migration failed: {e}")
+            return 0
+
+    async def migrate_content_hashes(self, decompress: Callable[[bytes], bytes]) -> int:
+        """
+        Recompute content hashes stored under another algorithm (documents
+        without content_hash_algorithm predate it and hold SHA-256), so the
+        unique content_hash index keeps catching republished stories. Safe to
+        run repeatedly; already migrated documents are not matched.
+
+        Args:
+            decompress: Turns compressed_content back into the hashed UTF-8 bytes
+
+        Returns:
+            Number of documents rewritten
+        """
+        if not self._use_db:
+            return 0
+        try:
+            from pymongo import UpdateOne
+            from pymongo.errors import BulkWriteError
+
+            collection = await self.ensure_collection()
+            cursor = collection.find(
+                {"content_hash_algorithm": {"$ne": CONTENT_HASH_ALGORITHM}},
+                projection={"_id": 1, "compressed_content": 1},
+            )
+
+            migrated = 0
+            duplicates = 0
+
+            async def flush(ops):
+                nonlocal migrated, duplicates
+                try:
+                    await collection.bulk_write(ops, ordered=False)
+                    migrated += len(ops)
+                except BulkWriteError as e:
+                    # Content already stored under its new hash: leave the older copy as is
+                    write_errors = e.details.get("writeErrors", [])
+                    if any(err.get("code") != DUPLICATE_KEY_ERROR for err in write_errors):
+                        raise
+                    duplicates += len(write_errors)
+                    migrated += len(ops) - len(write_errors)
+
+            ops = []
+            async for doc in cursor:
+                try:
+                    content_hash = content_digest(decompress(doc.get("compressed_content", b"")))
+                except Exception as e:
+                    logger.debug(f"Skipping rehash of {doc['_id']}: {e}")
+                    continue
+                ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {
+                    "content_hash": content_hash,
+                    "content_hash_algorithm": CONTENT_HASH_ALGORITHM,
+                }}))
+                if len(ops) == BULK_INSERT_CHUNK_SIZE:
+                    await flush(ops)
+                    ops = []
+            if ops:
+                await flush(ops)
+
+            if migrated or duplicates:
+                logger.info(
+                    f"Rehashed {migrated} articles with {CONTENT_HASH_ALGORITHM} "
+                    f"({duplicates} duplicates of newer articles left unchanged)"
+                )
+            return migrated
+
+        except Exception as e:
+            logger.error(f"Content hash migration failed: {e}")
+            return 0
+
+    async def migrate_dates(self) -> int:
+        """
+        Rewrite published_date/fetched_date values stored as strings into BSON
+        dates, so date filters and the newest-first sort use the indexes.
+        Safe to run repeatedly; already migrated documents are not matched.
+
+        Returns:
+            Number of documents rewritten
+        """
+        if not self._use_db:
+            return 0
+        try:
+            collection = await self.ensure_collection()
+
+            migrated = 0
+            for field in _DATE_FIELDS:
+                result = await collection.update_many(
+                    {field: {"$type": "string"}},
+                    [{"$set": {field: {"$toDate": f"${field}"}}}],
+                )
+                migrated += result.modified_count
+
+            if migrated:
+                logger.info(f"Migrated {migrated} string dates to BSON dates")
+            return migrated
+
+        except Exception as e:
+            logger.error(f"Date migration failed: {e}")
+            return 0
+
     @handle_errors
     async def get_article(self, article_id: str) -> Article:
         """
@@ -102,8 +487,7 @@ class ArticleStore:
         """
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
+                collection = await self.ensure_collection()
 
                 doc = await collection.find_one({"id": article_id})
                 if doc:
@@ -122,7 +506,8 @@ class ArticleStore:
         self,
         filters: QueryFilters,
         page: int = 1,
-        page_size: int = 20
+        page_size: int = 20,
+        include_body: bool = False,
     ) -> Tuple[List[Article], int]:
         """
         Query articles with filters and pagination.
@@ -131,41 +516,20 @@ class ArticleStore:
             filters: Query filters
             page: Page number (1-indexed)
             page_size: Items per page
+            include_body: Also load compressed_content and embedding, which
+                list views never render
 
         Returns:
             Tuple of (articles list, total count)
         """
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
-
-                # Build MongoDB filter
-                query = {}
-                conditions = []
-
-                if filters.source:
-                    conditions.append({"source": filters.source})
-                if filters.date_from:
-                    conditions.append({"published_date": {"$gte": filters.date_from}})
-                if filters.date_to:
-                    conditions.append({"published_date": {"$lte": filters.date_to}})
-                if filters.cluster_id is not None:
-                    conditions.append({"cluster_id": filters.cluster_id})
-                if filters.search_text:
-                    conditions.append({"title": {"$regex": re.escape(filters.search_text), "$options": "i"}})
-
-                if conditions:
-                    query = {"$and": conditions}
-
-                # Get total count
-                total = await collection.count_documents(query)
-
-                # Apply ordering and pagination
-                offset = (page - 1) * page_size
-                cursor = collection.find(query).sort("published_date", -1).skip(offset).limit(page_size)
-                docs = await cursor.to_list(length=page_size)
+                collection = await self.ensure_collection()
 
+                docs, total = await self._aggregate_page(
+                    collection, filters, page, page_size,
+                    None if include_body else _LIST_EXCLUDED_FIELDS,
+                )
                 articles = [self._to_article(doc) for doc in docs]
 
                 logger.info(f"MongoDB query returned {len(articles)} articles (total: {total})")
@@ -175,28 +539,190 @@ class ArticleStore:
                 logger.error(f"MongoDB query failed: {e}")
 
         # In-memory fallback
-        filtered = list(self._memory_articles.values())
+        paginated, total = self._memory_query(filters, page, page_size)
+        logger.info(f"Memory query returned {len(paginated)} articles (total: {total})")
+        return paginated, total
 
-        if filters.source:
-            filtered = [a for a in filtered if a.source == filters.source]
-        if filters.date_from:
-            filtered = [a for a in filtered if a.published_date >= filters.date_from]
-        if filters.date_to:
-            filtered = [a for a in filtered if a.published_date <= filters.date_to]
-        if filters.cluster_id is not None:
-            filtered = [a for a in filtered if a.cluster_id == filters.cluster_id]
-        if filters.search_text:
-            search_lower = filters.search_text.lower()
-            filtered = [a for a in filtered if search_lower in a.title.lower()]
+    @handle_errors
+    async def query_article_rows(
+        self,
+        filters: QueryFilters,
+        page: int = 1,
+        page_size: int = 20,
+        fields: Sequence[str] = ("id", "title", "published_date"),
+    ) -> Tuple[List[dict], int]:
+        """
+        Like query_articles, but each match is a plain dict of just the given
+        fields. Read-only list endpoints serialize these directly; MongoDB sends
+        only those fields and no Article objects are built.
+
+        Args:
+            filters: Query filters
+            page: Page number (1-indexed)
+            page_size: Items per page
+            fields: Article attributes to return, in order
+
+        Returns:
+            Tuple of (row dicts, total count)
+        """
+        if self._use_db:
+            try:
+                collection = await self.ensure_collection()
+
+                projection = dict.fromkeys(fields, 1)
+                projection["_id"] = 0
+                docs, total = await self._aggregate_page(collection, filters, page, page_size, projection)
+                return [{f: doc.get(f) for f in fields} for doc in docs], total
 
-        filtered.sort(key=lambda a: a.published_date, reverse=True)
+            except Exception as e:
+                logger.error(f"MongoDB row query failed: {e}")
+
+        # In-memory fallback
+        paginated, total = self._memory_query(filters, page, page_size)
+        get_fields = attrgetter(*fields)
+        if len(fields) == 1:
+            return [{fields[0]: get_fields(a)} for a in paginated], total
+        return [dict(zip(fields, get_fields(a))) for a in paginated], total
+
+    async def _aggregate_page(
+        self, collection, filters: QueryFilters, page: int, page_size: int,
+        projection: Optional[dict],
+    ) -> Tuple[List[dict], int]:
+        """One page of matching documents, newest first, and the total match count"""
+        # Page and total in one round-trip. $match and $sort come before
+        # $facet so they can use the indexes; facet sub-pipelines cannot.
+        # The id tiebreak matches query_articles_page, so a next_cursor taken
+        # from this page resumes exactly where it ended
+        offset = (page - 1) * page_size
+        pipeline = [
+            {"$match": self._build_query(filters)},
+            {"$sort": {"published_date": -1, "id": 1}},
+        ]
+        if projection:
+            pipeline.append({"$project": projection})
+        pipeline.append(
+            {"$facet": {
+                "data": [{"$skip": offset}, {"$limit": page_size}],
+                "total": [{"$count": "n"}],
+            }}
+        )
+        result = (await collection.aggregate(pipeline).to_list(length=1))[0]
+        total = result["total"][0]["n"] if result["total"] else 0
+        return result["data"], total
 
-        total = len(filtered)
+    @handle_errors
+    async def query_articles_page(
+        self,
+        filters: QueryFilters,
+        page: int = 1,
+        page_size: int = 20,
+        after_date: Optional[datetime] = None,
+        after_id: Optional[str] = None,
+    ) -> Tuple[List[Article], bool]:
+        """
+        Query one page of articles without counting every match, for clients
+        that only need to know whether another page follows.
+
+        Passing the last article's (published_date, id) as after_date/after_id
+        continues right after it (keyset pagination), so deep pages cost the
+        same as the first; page then counts from the cursor.
+
+        Args:
+            filters: Query filters
+            page: Page number (1-indexed)
+            page_size: Items per page
+            after_date: published_date of the last article already returned
+            after_id: id of that article, to break ties on published_date
+
+        Returns:
+            Tuple of (articles list, whether more articles follow)
+        """
+        if self._use_db:
+            try:
+                collection = await self.ensure_collection()
+
+                query = self._build_query(filters)
+                if after_date is not None:
+                    if after_id is None:
+                        query.setdefault("published_date", {})["$lt"] = after_date
+                    else:
+                        query["$or"] = [
+                            {"published_date": {"$lt": after_date}},
+                            {"published_date": after_date, "id": {"$gt": after_id}},
+                        ]
+
+                # One extra document answers has_more; no count over all matches
+                offset = (page - 1) * page_size
+                cursor = (
+                    collection.find(query, projection=_LIST_EXCLUDED_FIELDS)
+                    .sort([("published_date", -1), ("id", 1)])
+                    .skip(offset)
+                    .limit(page_size + 1)
+                )
+                docs = await cursor.to_list(length=page_size + 1)
+                articles = [self._to_article(doc) for doc in docs[:page_size]]
+                return articles, len(docs) > page_size
+
+            except Exception as e:
+                logger.error(f"MongoDB page query failed: {e}")
+
+        # In-memory fallback (its match count is a cheap index slice)
+        after = (after_date, after_id) if after_date is not None else None
+        paginated, total = self._memory_query(filters, page, page_size, after)
+        return paginated, total > page * page_size
+
+    def _memory_query(
+        self,
+        filters: QueryFilters,
+        page: int,
+        page_size: int,
+        after: Optional[Tuple[datetime, Optional[str]]] = None,
+    ) -> Tuple[List[Article], int]:
+        """In-memory query_articles: one page newest first, and the match count (after the cursor, if any)"""
+        # Walk the most selective sorted index; its order is already newest first
+        check_source = False
+        if filters.cluster_id is not None:
+            index = self._by_cluster.get(filters.cluster_id, [])
+            check_source = bool(filters.source)
+        elif filters.source:
+            index = self._by_source.get(filters.source, [])
+        else:
+            index = self._by_date
+
+        # The date bounds are a contiguous slice of any index
+        lo = bisect_left(index, (_EPOCH - filters.date_to,)) if filters.date_to else 0
+        hi = (
+            bisect_right(index, (_EPOCH - filters.date_from, math.inf))
+            if filters.date_from else len(index)
+        )
+        if after is not None:
+            # Resume right after the cursor article; in memory, ties on the date
+            # keep insertion order, so an unknown id skips the whole date
+            after_date, after_id = after
+            indexed = self._index_keys.get(after_id)
+            if indexed is not None and indexed[0][0] == _EPOCH - after_date:
+                lo = max(lo, bisect_right(index, indexed[0]))
+            else:
+                lo = max(lo, bisect_right(index, (_EPOCH - after_date, math.inf)))
+
+        articles = self._memory_articles
         start = (page - 1) * page_size
         end = start + page_size
-        paginated = filtered[start:end]
 
-        logger.info(f"Memory query returned {len(paginated)} articles (total: {total})")
+        if not check_source and not filters.search_text:
+            total = max(0, hi - lo)
+            paginated = [articles[e[2]] for e in index[lo + start:min(lo + end, hi)]]
+        else:
+            matched = [articles[e[2]] for e in islice(index, lo, hi)]
+            if check_source:
+                matched = [a for a in matched if a.source == filters.source]
+            if filters.search_text:
+                # Any whole word in title or summary, as $text matches (minus stemming)
+                terms, words = _search_words(filters.search_text), self._search_index
+                matched = [a for a in matched if not terms.isdisjoint(words[a.id])]
+            total = len(matched)
+            paginated = matched[start:end]
+
         return paginated, total
 
     @handle_errors
@@ -204,8 +730,7 @@ class ArticleStore:
         """Get all articles in a cluster"""
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
+                collection = await self.ensure_collection()
 
                 cursor = collection.find({"cluster_id": cluster_id}).sort("published_date", -1)
                 docs = await cursor.to_list(length=1000)
@@ -213,29 +738,80 @@ class ArticleStore:
             except Exception as e:
                 logger.error(f"MongoDB cluster query failed: {e}")
 
-        return [a for a in self._memory_articles.values() if a.cluster_id == cluster_id]
+        articles = self._memory_articles
+        return [articles[e[2]] for e in self._by_cluster.get(cluster_id, [])]
+
+    async def iter_all_articles(
+        self, batch_size: int = 500, limit: Optional[int] = None
+    ) -> AsyncIterator[Article]:
+        """
+        Stream all articles newest first, one cursor batch in memory at a time.
+
+        Args:
+            batch_size: Documents per cursor round trip
+            limit: Maximum number of articles, or None for all
+
+        Yields:
+            Article objects
 
-    async def get_all_articles(self) -> List[Article]:
-        """Get all articles"""
+        Raises:
+            DatabaseError: If the cursor fails after articles were yielded;
+                a partial scan must not look like a complete one
+        """
         if self._use_db:
+            yielded = 0
             try:
-                db = await get_db()
-                collection = db["articles"]
-
-                cursor = collection.find().sort("published_date", -1)
-                docs = await cursor.to_list(length=10000)
-                return [self._to_article(doc) for doc in docs]
+                collection = await self.ensure_collection()
+                cursor = collection.find().sort("published_date", -1).batch_size(batch_size)
+                if limit is not None:
+                    cursor = cursor.limit(limit)
+                async for doc in cursor:
+                    yield self._to_article(doc)
+                    yielded += 1
+                return
             except Exception as e:
+                if yielded:
+                    raise DatabaseError(f"Article scan failed after {yielded} articles: {e}") from e
                 logger.error(f"MongoDB get all failed: {e}")
 
-        return list(self._memory_articles.values())
+        # Snapshot the index: saves may run while the caller awaits between items
+        articles = self._memory_articles
+        for entry in self._by_date[:limit]:
+            article = articles.get(entry[2])
+            if article is not None:
+                yield article
+
+    async def get_all_articles(self, limit: Optional[int] = None) -> List[Article]:
+        """
+        Get all articles as a list; prefer iter_all_articles for scans.
+
+        Args:
+            limit: Maximum number of articles. None reads up to
+                ALL_ARTICLES_DB_LIMIT from MongoDB and everything from memory.
+
+        Returns:
+            Articles, newest first
+        """
+        if limit is None and self._use_db:
+            limit = ALL_ARTICLES_DB_LIMIT
+        return [a async for a in self.iter_all_articles(limit=limit)]
+
+    async def get_sources(self) -> List[str]:
+        """Distinct article sources, without loading any articles"""
+        if self._use_db:
+            try:
+                collection = await self.ensure_collection()
+                return await collection.distinct("source")
+            except Exception as e:
+                logger.error(f"MongoDB distinct sources failed: {e}")
+
+        return list(self._by_source)
 
     async def count_articles(self) -> int:
         """Get total article count"""
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
+                collection = await self.ensure_collection()
                 return await collection.count_documents({})
             except Exception as e:
                 logger.error(f"MongoDB count failed: {e}")
@@ -249,8 +825,7 @@ class ArticleStore:
 
         if self._use_db:
             try:
-                db = await get_db()
-                collection = db["articles"]
+                collection = await self.ensure_collection()
 
                 result = await collection.delete_many({"published_date": {"$lt": cutoff}})
                 archived = result.deleted_count
@@ -263,57 +838,140 @@ class ArticleStore:
                 if a.published_date < cutoff
             ]
             for aid in old_ids:
-                del self._memory_articles[aid]
+                self._memory_delete(aid)
             archived = len(old_ids)
 
         return archived
 
-    def _to_document(self, article: Article) -> dict:
-        """Convert Article dataclass to MongoDB document"""
-        embedding_json = None
-        if article.embedding is not None:
+    def _memory_put(self, article: Article) -> None:
+        """Insert or replace an article in the in-memory fallback"""
+        previous = self._index_keys.get(article.id)
+        if previous is not None:
+            # A replaced article keeps its place among equal dates, like a dict key
+            seq = previous[0][1]
+            self._unindex(previous)
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+
+        entry = (_EPOCH - article.published_date, seq, article.id)
+        insort(self._by_date, entry)
+        insort(self._by_source[article.source], entry)
+        if article.cluster_id is not None:
+            insort(self._by_cluster[article.cluster_id], entry)
+        self._index_keys[article.id] = (entry, article.source, article.cluster_id)
+
+        self._memory_articles[article.id] = article
+        self._search_index[article.id] = _search_words(f"{article.title} {article.summary or ''}")
+
+    def _memory_delete(self, article_id: str) -> None:
+        """Remove an article from the in-memory fallback"""
+        del self._memory_articles[article_id]
+        self._search_index.pop(article_id, None)
+        previous = self._index_keys.pop(article_id, None)
+        if previous is not None:
+            self._unindex(previous)
+
+    def _unindex(self, indexed: tuple) -> None:
+        """Drop an article's entries from the sorted in-memory indexes"""
+        entry, source, cluster_id = indexed
+        _remove_sorted(self._by_date, entry)
+        _remove_sorted(self._by_source[source], entry)
+        if not self._by_source[source]:
+            del self._by_source[source]
+        if cluster_id is not None:
+            _remove_sorted(self._by_cluster[cluster_id], entry)
+            if not self._by_cluster[cluster_id]:
+                del self._by_cluster[cluster_id]
+
+    @staticmethod
+    def _build_query(filters: QueryFilters) -> dict:
+        """
+        Flat top-level find() filter for QueryFilters. Equality fields lead and
+        the date bounds form one range, matching the (source|cluster_id,
+        published_date) compound indexes created in init_db.
+
+        Args:
+            filters: Query filters
+
+        Returns:
+            MongoDB filter document
+        """
+        query = {}
+        if filters.source:
+            query["source"] = filters.source
+        if filters.cluster_id is not None:
+            query["cluster_id"] = filters.cluster_id
+        date_range = {}
+        if filters.date_from:
+            date_range["$gte"] = filters.date_from
+        if filters.date_to:
+            date_range["$lte"] = filters.date_to
+        if date_range:
+            query["published_date"] = date_range
+        if filters.search_text:
+            query["$text"] = {"$search": filters.search_text}
+        return query
+
+    @staticmethod
+    def _embedding_field(article: Article) -> Optional[bytes]:
+        """Embedding as stored in a document (raw float32 bytes, BSON binary), or None"""
+        if article.embedding is None:
+            return None
+        try:
+            return np.asarray(article.embedding, dtype=np.float32).tobytes()
+        except Exception:
+            return None
+
+    @staticmethod
+    def _embedding_from_field(raw) -> Optional[np.ndarray]:
+        """Embedding from a document field: float32 bytes, or a legacy JSON list string"""
+        if isinstance(raw, (bytes, bytearray)):
+            # Zero-copy, read-only view over the BSON payload
+            return np.frombuffer(raw, dtype=np.float32)
+        if isinstance(raw, str) and raw:
             try:
-                embedding_json = json.dumps(article.embedding.tolist())
+                return np.array(orjson.loads(raw), dtype=np.float32)
             except Exception:
-                pass
+                return None
+        return None
 
+    def _to_document(self, article: Article) -> dict:
+        """Convert Article dataclass to MongoDB document"""
         return {
             "id": article.id,
             "url": article.url,
             "content_hash": article.content_hash or "",
+            "content_hash_algorithm": CONTENT_HASH_ALGORITHM,
             "title": article.title,
             "compressed_content": article.compressed_content,
             "summary": article.summary,
             "source": article.source,
             "author": article.author,
-            "published_date": article.published_date,
-            "fetched_date": article.fetched_date,
+            "published_date": _as_datetime(article.published_date),
+            "fetched_date": _as_datetime(article.fetched_date),
             "cluster_id": article.cluster_id,
-            "embedding": embedding_json,
+            "embedding": self._embedding_field(article),
+            "keyword_category": article.keyword_category,
         }
 
     def _to_article(self, doc: dict) -> Article:
         """Convert MongoDB document to Article dataclass"""
-        import numpy as np
-
-        embedding = None
-        if doc.get("embedding"):
-            try:
-                embedding = np.array(json.loads(doc["embedding"]))
-            except Exception:
-                pass
+        embedding = self._embedding_from_field(doc.get("embedding"))
 
         return Article(
             id=doc.get("id", str(doc.get("_id", ""))),
             url=doc["url"],
             title=doc["title"],
-            compressed_content=doc["compressed_content"],
+            # Absent when a list query projected the body away
+            compressed_content=doc.get("compressed_content", b""),
             summary=doc.get("summary"),
             source=doc["source"],
             author=doc.get("author"),
-            published_date=doc["published_date"],
-            fetched_date=doc.get("fetched_date", datetime.now()),
+            published_date=_as_datetime(doc["published_date"]),
+            fetched_date=_as_datetime(doc.get("fetched_date") or datetime.now()),
             cluster_id=doc.get("cluster_id"),
             embedding=embedding,
             content_hash=doc.get("content_hash"),
+            keyword_category=doc.get("keyword_category"),
         )
@@ -1,44 +1,95 @@
 """Real article summarization service using T5 transformer model"""
+import asyncio
+import html
 import logging
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Optional
+
+from ..models.article import content_digest
 from ..core.exceptions import SummarizationError
 from ..core.error_handler import handle_errors
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[A-Za-z/!?][^>]*>")
+
+# Bound on remembered model summaries; least recently used are evicted first
+SUMMARY_CACHE_MAX_ENTRIES = 10_000
+
+@lru_cache(maxsize=256)
+def _tokenize_sentences(text: str) -> tuple[str, ...]:
+    """Non-empty sentences of text, memoized since the same content is often summarized again"""
+    sentences = (s.strip() for s in text.replace('\n', ' ').split('. '))
+    return tuple(s for s in sentences if s)
+
+
 # Lazy loading of heavy ML imports
 _model = None
 _tokenizer = None
+_model_lock = threading.Lock()
 
 
-def _load_model(model_name: str = "t5-small", use_gpu: bool = False):
-    """Lazy-load the T5 model and tokenizer"""
+def _load_model(model_name: str = "t5-small", use_gpu: bool = False, quantize: bool = True,
+                compile_model: bool = False):
+    """Lazy-load the T5 model and tokenizer, with INT8 linear layers on CPU"""
     global _model, _tokenizer
 
     if _model is not None and _tokenizer is not None:
         return _model, _tokenizer
 
-    try:
-        from transformers import T5ForConditionalGeneration, T5Tokenizer
-        import torch
+    # asummarize callers run in worker threads; only one of them loads the model
+    with _model_lock:
+        if _model is not None and _tokenizer is not None:
+            return _model, _tokenizer
 
-        logger.info(f"Loading summarization model: {model_name}")
-        _tokenizer = T5Tokenizer.from_pretrained(model_name, legacy=True)
-        _model = T5ForConditionalGeneration.from_pretrained(model_name)
+        try:
+            from transformers import T5ForConditionalGeneration, T5Tokenizer
+            import torch
+
+            logger.info(f"Loading summarization model: {model_name}")
+            tokenizer = T5Tokenizer.from_pretrained(model_name, legacy=True)
+            model = T5ForConditionalGeneration.from_pretrained(model_name)
+
+            model.eval()
+
+            if use_gpu and torch.cuda.is_available():
+                model = model.to("cuda")
+                logger.info("Summarizer using GPU")
+            elif quantize:
+                # Dynamic INT8 quantization: int8 weights and VNNI GEMMs for every
+                # nn.Linear, activations quantized on the fly; no calibration needed
+                try:
+                    model = torch.quantization.quantize_dynamic(
+                        model, {torch.nn.Linear}, dtype=torch.qint8
+                    )
+                    logger.info("Summarizer using CPU (INT8 dynamic quantization)")
+                except Exception as e:
+                    logger.warning(f"INT8 quantization failed, using FP32: {e}")
+            else:
+                logger.info("Summarizer using CPU")
 
-        if use_gpu and torch.cuda.is_available():
-            _model = _model.to("cuda")
-            logger.info("Summarizer using GPU")
-        else:
-            logger.info("Summarizer using CPU")
+            if compile_model:
+                # generate() is not compiled itself but calls forward once per
+                # decoding step; dynamic shapes avoid a recompile per length
+                try:
+                    mode = "reduce-overhead" if use_gpu and torch.cuda.is_available() else "default"
+                    model.forward = torch.compile(model.forward, mode=mode, dynamic=True, fullgraph=False)
+                    logger.info(f"Summarizer forward compiled (mode={mode})")
+                except Exception as e:
+                    logger.warning(f"torch.compile unavailable, running eagerly: {e}")
 
-        _model.eval()
-        logger.info(f"Model {model_name} loaded successfully")
-        return _model, _tokenizer
+            # Publish only the finished model; unlocked readers check these first
+            _model, _tokenizer = model, tokenizer
+            logger.info(f"Model {model_name} loaded successfully")
+            return _model, _tokenizer
 
-    except Exception as e:
-        logger.error(f"Failed to load model {model_name}: {e}")
-        raise SummarizationError(f"Model loading failed: {e}")
+        except Exception as e:
+            logger.error(f"Failed to load model {model_name}: {e}")
+            raise SummarizationError(f"Model loading failed: {e}")
 
 
 class Summarizer:
@@ -48,11 +99,19 @@ class Summarizer:
     """
 
     def __init__(self, model_name: str = "t5-small", max_length: int = 150,
-                 use_gpu: bool = False, num_beams: int = 4):
+                 use_gpu: bool = False, num_beams: int = 4, batch_size: int = 8,
+                 quantize: bool = True, compile_model: bool = False):
         self.model_name = model_name
         self.max_length = max_length
         self.use_gpu = use_gpu
+        self.quantize = quantize
+        self.compile_model = compile_model
+        # Content digest -> model summary, so re-submitted articles skip generate
+        self._summary_cache: OrderedDict[str, str] = OrderedDict()
+        # asummarize/abatch_summarize share the cache across worker threads
+        self._cache_lock = threading.Lock()
         self.num_beams = num_beams
+        self.batch_size = batch_size
         self.max_input_tokens = 512
         self._model_loaded = False
         logger.info(f"Summarizer initialized (model={model_name}, max_length={max_length})")
@@ -61,25 +120,49 @@ class Summarizer:
         """Ensure model is loaded"""
         if not self._model_loaded:
             try:
-                _load_model(self.model_name, self.use_gpu)
+                _load_model(self.model_name, self.use_gpu, self.quantize, self.compile_model)
                 self._model_loaded = True
             except Exception as e:
                 logger.warning(f"Model not available, will use extractive fallback: {e}")
 
+    def warm_up(self) -> None:
+        """
+        Load the model and run one generate pass, so a compiled model pays its
+        compilation cost at startup rather than on the first real article.
+        If the compiled forward fails, it is dropped and the eager model is
+        warmed up instead.
+        """
+        self._ensure_model()
+        if not (self._model_loaded and _model is not None and _tokenizer is not None):
+            return
+        # Straight to generate: a warm-up text has no place in the summary cache
+        sample = [self._preprocess("The quick brown fox jumps over the lazy dog. " * 20)]
+        try:
+            self._generate(sample)
+            logger.info("Summarizer warmed up")
+            return
+        except Exception as e:
+            logger.warning(f"Summarizer warm-up failed: {e}")
+            if "forward" not in vars(_model):
+                return
+
+        # Compilation errors surface on first call; fall back to eager and check it runs
+        del _model.forward
+        logger.warning("Summarizer compiled forward dropped, running eagerly")
+        try:
+            self._generate(sample)
+            logger.info("Summarizer warmed up (eager)")
+        except Exception as e:
+            logger.warning(f"Summarizer eager warm-up failed: {e}")
+
     def _preprocess(self, content: str) -> str:
         """Preprocess content for T5 model"""
-        from bs4 import BeautifulSoup
-        import re
-
-        # Strip HTML
-        try:
-            soup = BeautifulSoup(content, "html.parser")
-            content = soup.get_text(separator=" ", strip=True)
-        except Exception:
-            pass
+        # Strip HTML; fetched content is usually plain text already
+        if "<" in content or "&" in content:
+            content = html.unescape(_TAG_RE.sub(" ", content))
 
         # Normalize whitespace
-        content = re.sub(r'\s+', ' ', content).strip()
+        content = _WHITESPACE_RE.sub(" ", content).strip()
 
         # Add T5 task prefix
         return f"summarize: {content}"
@@ -109,19 +192,69 @@ class Summarizer:
         self._ensure_model()
 
         if self._model_loaded and _model is not None and _tokenizer is not None:
+            cached = self._cached_summary(content)
+            if cached is not None:
+                return cached
             try:
-                return self._ai_summarize(content)
+                summary = self._ai_summarize(content)
+                self._remember_summary(content, summary)
+                return summary
             except Exception as e:
                 logger.warning(f"AI summarization failed, using extractive fallback: {e}")
 
         # Fallback: extractive summarization
         return self._extractive_summarize(content)
 
+    async def asummarize(self, content: str) -> str:
+        """summarize() in a worker thread, keeping model inference off the event loop"""
+        return await asyncio.to_thread(self.summarize, content)
+
+    async def abatch_summarize(self, contents: List[str], batch_size: Optional[int] = None) -> List[str]:
+        """batch_summarize() in a worker thread, keeping model inference off the event loop"""
+        return await asyncio.to_thread(self.batch_summarize, contents, batch_size)
+
+    def _cached_summary(self, content: str) -> Optional[str]:
+        """Model summary previously generated for identical content, if any"""
+        key = content_digest(content.encode("utf-8"))
+        with self._cache_lock:
+            summary = self._summary_cache.get(key)
+            if summary is not None:
+                self._summary_cache.move_to_end(key)
+        return summary
+
+    def _remember_summary(self, content: str, summary: str) -> None:
+        """Cache a model summary; extractive fallbacks are cheap and not cached"""
+        key = content_digest(content.encode("utf-8"))
+        with self._cache_lock:
+            self._summary_cache[key] = summary
+            self._summary_cache.move_to_end(key)
+            if len(self._summary_cache) > SUMMARY_CACHE_MAX_ENTRIES:
+                self._summary_cache.popitem(last=False)
+
     def _ai_summarize(self, content: str) -> str:
         """Summarize using T5 model"""
-        import torch
+        return self._ai_summarize_batch([content])[0]
+
+    def _ai_summarize_batch(self, contents: List[str]) -> List[str]:
+        """Summarize several articles with one padded tokenizer call and one generate pass"""
+        summary_ids = self._generate([self._preprocess(content) for content in contents])
+
+        summaries = []
+        for summary in _tokenizer.batch_decode(summary_ids, skip_special_tokens=True):
+            # Ensure word count limit
+            summary_words = summary.split()
+            if len(summary_words) > self.max_length:
+                summary = " ".join(summary_words[:self.max_length])
+                if not summary.endswith('.'):
+                    summary += '.'
+            summaries.append(summary)
+
+        logger.debug(f"AI summarized {len(contents)} articles in one batch")
+        return summaries
 
-        preprocessed = self._preprocess(content)
+    def _generate(self, preprocessed: List[str]):
+        """Token ids from one padded tokenizer call and one generate pass over preprocessed texts"""
+        import torch
 
         # Tokenize with truncation for long articles
         inputs = _tokenizer(
@@ -135,9 +268,9 @@ class Summarizer:
         if self.use_gpu and torch.cuda.is_available():
             inputs = {k: v.to("cuda") for k, v in inputs.items()}
 
-        # Generate summary
-        with torch.no_grad():
-            summary_ids = _model.generate(
+        # Generate summary; inference_mode also skips autograd version counters
+        with torch.inference_mode():
+            return _model.generate(
                 inputs["input_ids"],
                 attention_mask=inputs["attention_mask"],
                 max_length=self.max_length,
@@ -148,28 +281,12 @@ class Summarizer:
                 no_repeat_ngram_size=3,
             )
 
-        summary = _tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-
-        # Ensure word count limit
-        summary_words = summary.split()
-        if len(summary_words) > self.max_length:
-            summary = " ".join(summary_words[:self.max_length])
-            if not summary.endswith('.'):
-                summary += '.'
-
-        logger.debug(f"AI summary: {len(summary_words)} words from {len(content.split())} words")
-        return summary
-
     def _extractive_summarize(self, content: str) -> str:
         """Fallback extractive summarization - takes first N sentences up to word limit"""
-        sentences = content.replace('\n', ' ').split('. ')
         summary_words = []
         word_count = 0
 
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
+        for sentence in _tokenize_sentences(content):
             words = sentence.split()
             if word_count + len(words) <= self.max_length:
                 summary_words.extend(words)
@@ -185,36 +302,54 @@ class Summarizer:
         return summary
 
     @handle_errors
-    def batch_summarize(self, contents: List[str]) -> List[str]:
+    def batch_summarize(self, contents: List[str], batch_size: Optional[int] = None) -> List[str]:
         """
-        Summarize multiple articles.
+        Summarize multiple articles, running the model on batches of them at once.
+        Same per-article results as summarize: short content is returned as is,
+        and a failed batch falls back to extractive summaries.
 
         Args:
             contents: List of article contents
+            batch_size: Articles per model forward pass (defaults to self.batch_size)
 
         Returns:
-            List of summaries
+            List of summaries, in input order
         """
         logger.info(f"Batch summarizing {len(contents)} articles")
-        summaries = []
+        batch_size = batch_size or self.batch_size
+        summaries = list(contents)
+        # Only content longer than max_length words needs summarizing
+        pending = [i for i, content in enumerate(contents) if len(content.split()) > self.max_length]
+        if not pending:
+            return summaries
+        # Similar lengths share a batch, so little of each batch is padding
+        pending.sort(key=lambda i: len(contents[i]))
 
         self._ensure_model()
-
-        if self._model_loaded and _model is not None and _tokenizer is not None:
-            # Process in batches for efficiency
-            batch_size = 8
-            for i in range(0, len(contents), batch_size):
-                batch = contents[i:i + batch_size]
-                for content in batch:
-                    try:
-                        summary = self.summarize(content)
-                        summaries.append(summary)
-                    except Exception as e:
-                        logger.warning(f"Batch item failed: {e}")
-                        summaries.append(self._extractive_summarize(content))
-        else:
-            # Use extractive fallback for all
-            for content in contents:
-                summaries.append(self._extractive_summarize(content))
+        use_model = self._model_loaded and _model is not None and _tokenizer is not None
+        if use_model:
+            # Articles summarized before need no model pass
+            misses = []
+            for i in pending:
+                cached = self._cached_summary(contents[i])
+                if cached is None:
+                    misses.append(i)
+                else:
+                    summaries[i] = cached
+            pending = misses
+
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start:start + batch_size]
+            texts = [contents[i] for i in batch]
+            if use_model:
+                try:
+                    for i, content, summary in zip(batch, texts, self._ai_summarize_batch(texts)):
+                        summaries[i] = summary
+                        self._remember_summary(content, summary)
+                    continue
+                except Exception as e:
+                    logger.warning(f"Batch summarization failed, using extractive fallback: {e}")
+            for i, content in zip(batch, texts):
+                summaries[i] = self._extractive_summarize(content)
 
         return summaries
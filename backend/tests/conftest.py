@@ -2,6 +2,38 @@
 import sys
 import os
 import pytest
+from hypothesis import Phase, settings
+from pytest_asyncio import is_async_test
+
+# Hypothesis example budgets: "dev" keeps local runs quick, "ci" searches wider,
+# "examples_only" runs just explicit @example cases. Pick with HYPOTHESIS_PROFILE.
+settings.register_profile("dev", max_examples=10)
+settings.register_profile("ci", max_examples=50)
+settings.register_profile("examples_only", phases=[Phase.explicit])
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "dev"))
 
 # Add backend root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_addoption(parser):
+    parser.addoption("--runslow", action="store_true", default=False, help="run tests marked slow")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "slow: expensive test, skipped unless --runslow is given")
+
+
+def pytest_collection_modifyitems(config, items):
+    # One event loop for the whole session instead of one per async test
+    session_loop = pytest.mark.asyncio(scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -1,10 +1,11 @@
 """Integration tests for API routes"""
 import pytest
+import asyncio
 from httpx import AsyncClient, ASGITransport
 from src.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def client():
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
@@ -14,7 +15,6 @@ async def client():
 class TestAPIRoutes:
     """Integration tests for FastAPI endpoints"""
 
-    @pytest.mark.asyncio
     async def test_root_endpoint(self, client):
         response = await client.get("/")
         assert response.status_code == 200
@@ -22,14 +22,12 @@ class TestAPIRoutes:
         assert "message" in data
         assert data["version"] == "1.0.0"
 
-    @pytest.mark.asyncio
     async def test_health_endpoint(self, client):
         response = await client.get("/api/v1/health")
         assert response.status_code == 200
         data = response.json()
         assert data["data"]["status"] == "healthy"
 
-    @pytest.mark.asyncio
     async def test_get_articles_empty(self, client):
         response = await client.get("/api/v1/articles")
         assert response.status_code == 200
@@ -37,7 +35,6 @@ class TestAPIRoutes:
         assert "data" in data
         assert isinstance(data["data"], list)
 
-    @pytest.mark.asyncio
     async def test_get_articles_with_pagination(self, client):
         response = await client.get("/api/v1/articles?page=1&page_size=10")
         assert response.status_code == 200
@@ -45,19 +42,27 @@ class TestAPIRoutes:
         assert data["page"] == 1
         assert data["page_size"] == 10
 
-    @pytest.mark.asyncio
+    async def test_get_articles_without_total(self, client):
+        response = await client.get("/api/v1/articles?include_total=false")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_more"] is False
+
+    async def test_invalid_cursor(self, client):
+        response = await client.get("/api/v1/articles?after=not-a-cursor")
+        assert response.status_code == 400
+
     async def test_get_nonexistent_article(self, client):
         response = await client.get("/api/v1/articles/nonexistent-id-12345")
         assert response.status_code in [404, 500]
 
-    @pytest.mark.asyncio
     async def test_get_clusters_empty(self, client):
         response = await client.get("/api/v1/clusters")
         assert response.status_code == 200
         data = response.json()
         assert "data" in data
 
-    @pytest.mark.asyncio
     async def test_get_stats(self, client):
         response = await client.get("/api/v1/stats")
         assert response.status_code == 200
@@ -65,17 +70,105 @@ class TestAPIRoutes:
         assert "data" in data
         assert "total_articles" in data["data"]
 
-    @pytest.mark.asyncio
+    async def test_etag_not_modified(self, client):
+        response = await client.get("/api/v1/clusters")
+        etag = response.headers["etag"]
+        response = await client.get("/api/v1/clusters", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+    async def test_etag_not_modified_with_weak_list_and_wildcard(self, client):
+        response = await client.get("/api/v1/clusters")
+        etag = response.headers["etag"]
+        for header in (f"W/{etag}", f'"stale", {etag}', f'"stale",W/{etag}', "*"):
+            response = await client.get("/api/v1/clusters", headers={"If-None-Match": header})
+            assert response.status_code == 304, header
+        response = await client.get("/api/v1/clusters", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+
     async def test_invalid_date_format(self, client):
         response = await client.get("/api/v1/articles?date_from=invalid-date")
         assert response.status_code == 400
 
-    @pytest.mark.asyncio
     async def test_pagination_validation(self, client):
         response = await client.get("/api/v1/articles?page=-1")
         assert response.status_code == 422  # Pydantic validation error
 
-    @pytest.mark.asyncio
     async def test_page_size_validation(self, client):
         response = await client.get("/api/v1/articles?page_size=500")
         assert response.status_code == 422  # Exceeds max
+
+    async def test_concurrent_cache_misses_coalesced(self):
+        from src.api.routes import _coalesce
+        calls = 0
+
+        async def build():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"{}"
+
+        results = await asyncio.gather(*(_coalesce("coalesce:test", build) for _ in range(5)))
+        assert results == [b"{}"] * 5
+        assert calls == 1
+
+    async def test_coalesce_waiters_survive_leader_cancellation(self):
+        from src.api.routes import _coalesce
+        calls = 0
+
+        async def build():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"{}"
+
+        leader = asyncio.create_task(_coalesce("coalesce:cancel", build))
+        await asyncio.sleep(0)
+        waiters = [asyncio.create_task(_coalesce("coalesce:cancel", build)) for _ in range(3)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await asyncio.gather(*waiters) == [b"{}"] * 3
+        assert leader.cancelled()
+        assert calls == 2
+
+    async def test_overlapping_zstd_responses_decode(self):
+        zstandard = pytest.importorskip("zstandard")
+        from src.api.compression import CompressionMiddleware
+
+        chunks = [b"streamed part one " * 400, b"streamed part two " * 400, b"tail"]
+        single = b"single body response " * 400
+        first_chunk_sent = asyncio.Event()
+        single_sent = asyncio.Event()
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            if scope["path"] == "/stream":
+                for i, chunk in enumerate(chunks):
+                    more = i < len(chunks) - 1
+                    await send({"type": "http.response.body", "body": chunk, "more_body": more})
+                    if i == 0:
+                        first_chunk_sent.set()
+                        await single_sent.wait()
+            else:
+                # Compress a whole body while the stream is mid-response
+                await first_chunk_sent.wait()
+                await send({"type": "http.response.body", "body": single})
+                single_sent.set()
+
+        middleware = CompressionMiddleware(app, minimum_size=1)
+
+        async def request(path):
+            body = []
+
+            async def send(message):
+                if message["type"] == "http.response.body":
+                    body.append(message.get("body", b""))
+
+            scope = {"type": "http", "path": path, "headers": [(b"accept-encoding", b"zstd")]}
+            await middleware(scope, None, send)
+            return b"".join(body)
+
+        streamed, whole = await asyncio.gather(request("/stream"), request("/single"))
+        dctx = zstandard.ZstdDecompressor()
+        assert dctx.decompressobj().decompress(streamed) == b"".join(chunks)
+        assert dctx.decompress(whole) == single
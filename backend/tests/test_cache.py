@@ -1,7 +1,7 @@
 """Tests for Cache Manager (in-memory mode)"""
 import pytest
 import asyncio
-from src.services.cache import CacheManager
+from src.services.cache import CacheManager, as_async, _encode, _decode
 
 
 @pytest.fixture
@@ -14,39 +14,34 @@ def cache():
 class TestCacheManager:
     """Unit tests for CacheManager"""
 
-    @pytest.mark.asyncio
     async def test_set_and_get(self, cache):
         await cache.set("key1", {"data": "value"}, ttl=3600)
         result = await cache.get("key1")
         assert result == {"data": "value"}
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_key(self, cache):
         result = await cache.get("nonexistent")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_delete(self, cache):
         await cache.set("key1", "value1")
         await cache.delete("key1")
         result = await cache.get("key1")
         assert result is None
 
-    @pytest.mark.asyncio
     async def test_get_or_compute(self, cache):
         computed_value = {"computed": True}
 
         def compute():
             return computed_value
 
-        result = await cache.get_or_compute("computed_key", compute, ttl=3600)
+        result = await cache.get_or_compute("computed_key", as_async(compute), ttl=3600)
         assert result == computed_value
 
         # Second call should return cached value
-        result2 = await cache.get_or_compute("computed_key", compute, ttl=3600)
+        result2 = await cache.get_or_compute("computed_key", as_async(compute), ttl=3600)
         assert result2 == computed_value
 
-    @pytest.mark.asyncio
     async def test_clear(self, cache):
         await cache.set("key1", "value1")
         await cache.set("key2", "value2")
@@ -55,13 +50,11 @@ class TestCacheManager:
         assert await cache.get("key1") is None
         assert await cache.get("key2") is None
 
-    @pytest.mark.asyncio
     async def test_size(self, cache):
         assert await cache.size() == 0
         await cache.set("key1", "value1")
         assert await cache.size() == 1
 
-    @pytest.mark.asyncio
     async def test_different_value_types(self, cache):
         # String
         await cache.set("str", "hello")
@@ -78,3 +71,38 @@ class TestCacheManager:
         # Number
         await cache.set("num", 42)
         assert await cache.get("num") == 42
+
+    async def test_memory_cache_evicts_least_recently_used(self, cache, monkeypatch):
+        monkeypatch.setattr("src.services.cache._MEMORY_CACHE_MAX_ENTRIES", 2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        assert await cache.get("a") == 1  # "b" is now least recently used
+        await cache.set("c", 3)
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    async def test_set_and_get_bytes(self, cache):
+        payload = b'{"success":true}'
+        await cache.set_bytes("raw", payload, '"abc"', ttl=3600)
+        assert await cache.get_bytes("raw") == (payload, '"abc"')
+        assert await cache.get_bytes("missing") is None
+
+
+class TestCacheSerialization:
+    """Tests for the tagged Redis value encoding"""
+
+    def test_json_roundtrip(self):
+        value = {"data": [1, 2, 3], "nested": {"a": "b"}}
+        encoded = _encode(value)
+        assert encoded[:1] == b"J"
+        assert _decode(encoded) == value
+
+    def test_pickle_fallback_roundtrip(self):
+        value = {"tags": {"x", "y"}}
+        encoded = _encode(value)
+        assert encoded[:1] == b"P"
+        assert _decode(encoded) == value
+
+    def test_unknown_format_is_miss(self):
+        assert _decode(b'{"legacy": true}') is None
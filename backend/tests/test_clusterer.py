@@ -1,32 +1,60 @@
 """Tests for Topic Clusterer"""
 import pytest
+import dataclasses
 from datetime import datetime
-import uuid
-from src.services.clusterer import TopicClusterer
+import itertools
+from src.services.clusterer import TopicClusterer, head_words
 from src.models.article import Article
 
 
+# One clock read per module; relative dates are all the tests need
+_NOW = datetime.now()
+
+# Distinct ids and URLs from bound format methods: no os.urandom call per
+# uuid4() and no f-string evaluation per article
+_ids = map("{:032x}".format, itertools.count())
+_urls = map("https://example.com/{:032x}".format, itertools.count())
+
+# Fields every test article shares; _make_article fills in the rest per call
+_TEMPLATE = Article(
+    id="",
+    url="",
+    title="template",
+    compressed_content=b"",
+    summary=None,
+    source="Test Source",
+    author="Test Author",
+    published_date=datetime.min,
+    fetched_date=datetime.min,
+    cluster_id=None,
+)
+
+
 def _make_article(title, cluster_id=None):
     """Helper to create test articles"""
-    return Article(
-        id=str(uuid.uuid4()),
-        url=f"https://example.com/{uuid.uuid4()}",
+    return dataclasses.replace(
+        _TEMPLATE,
+        id=next(_ids),
+        url=next(_urls),
         title=title,
-        compressed_content=b"",
-        summary=None,
-        source="Test Source",
-        author="Test Author",
-        published_date=datetime.now(),
-        fetched_date=datetime.now(),
+        published_date=_NOW,
+        fetched_date=_NOW,
         cluster_id=cluster_id,
     )
 
 
+@pytest.fixture(scope="module")
+def shared_clusterer():
+    return TopicClusterer(min_cluster_size=2, min_samples=2)
+
+
 class TestTopicClusterer:
     """Unit tests for TopicClusterer"""
 
-    def setup_method(self):
-        self.clusterer = TopicClusterer(min_cluster_size=2, min_samples=2)
+    @pytest.fixture(autouse=True)
+    def _clusterer(self, shared_clusterer):
+        shared_clusterer.reset()
+        self.clusterer = shared_clusterer
 
     def test_keyword_clustering(self):
         articles = [
@@ -39,9 +67,7 @@ class TestTopicClusterer:
         clusters = self.clusterer._keyword_cluster(articles)
         assert len(clusters) > 0
         # Every article should be assigned
-        all_ids = set()
-        for article_ids in clusters.values():
-            all_ids.update(article_ids)
+        all_ids = set(itertools.chain.from_iterable(clusters.values()))
         assert len(all_ids) == 5
 
     def test_cluster_labels_generated(self):
@@ -55,6 +81,43 @@ class TestTopicClusterer:
             assert c.label is not None
             assert len(c.label) > 0
 
+    def test_reset_forgets_clusters(self):
+        self.clusterer._keyword_cluster([_make_article("New AI breakthrough announced today")])
+        assert self.clusterer.get_all_clusters()
+        self.clusterer.reset()
+        assert self.clusterer.get_all_clusters() == []
+        # Keyword matchers are built once and shared by every instance
+        assert TopicClusterer()._keyword_patterns is self.clusterer._keyword_patterns
+
+    def test_keyword_category_matches_whole_words(self):
+        assert self.clusterer._keyword_category("officials said talks stalled") is None
+        assert self.clusterer._keyword_category("new ai chip unveiled") == 0
+        assert self.clusterer._keyword_category("elections and markets") == 2
+
+    def test_head_words_matches_split(self):
+        text = "  one\ttwo\n three   four five "
+        assert head_words(text, 3) == " ".join(text.split()[:3])
+        assert head_words(text, 200) == " ".join(text.split())
+
+    def test_unchanged_article_set_reuses_clustering(self):
+        articles = [_make_article("New AI chip unveiled"), _make_article("Climate talks resume")]
+        first = self.clusterer.cluster_articles(articles)
+        for article in articles:
+            article.cluster_id = None
+        assert self.clusterer.cluster_articles(list(reversed(articles))) is first
+        assert all(a.cluster_id is not None for a in articles)
+
+    def test_disconnected_knn_graph_is_rejected(self):
+        pytest.importorskip("scipy")
+        pytest.importorskip("sklearn")
+        import numpy as np
+        from src.services.clusterer import _connected_knn_graph
+        rng = np.random.default_rng(0)
+        blob = rng.standard_normal((40, 8)).astype(np.float32)
+        assert _connected_knn_graph(blob, k=8) is not None
+        # Two topics far apart: no kNN edge crosses between them
+        assert _connected_knn_graph(np.vstack([blob, blob + 1000.0]), k=8) is None
+
     def test_get_cluster_not_found(self):
         assert self.clusterer.get_cluster(9999) is None
 
@@ -66,8 +129,10 @@ class TestTopicClusterer:
 class TestTopicClustererProperties:
     """Property-based tests for clusterer behavior"""
 
-    def setup_method(self):
-        self.clusterer = TopicClusterer(min_cluster_size=2, min_samples=2)
+    @pytest.fixture(autouse=True)
+    def _clusterer(self, shared_clusterer):
+        shared_clusterer.reset()
+        self.clusterer = shared_clusterer
 
     def test_all_articles_assigned(self):
         """Property: Every article should be assigned to a cluster"""
@@ -77,9 +142,7 @@ class TestTopicClustererProperties:
         ]
         clusters = self.clusterer._keyword_cluster(articles)
 
-        assigned_ids = set()
-        for article_ids in clusters.values():
-            assigned_ids.update(article_ids)
+        assigned_ids = set(itertools.chain.from_iterable(clusters.values()))
 
         article_ids = {a.id for a in articles}
         assert assigned_ids == article_ids
@@ -1,15 +1,21 @@
 """Comprehensive tests for Content Compressor"""
+import zlib
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
 from src.services.compressor import ContentCompressor
 from src.core.exceptions import CompressionError
 
+# Large payloads built once per module rather than per test run
+_64KB_TEXT = "A" * 65_536
+_MB_TEXT = "A" * 1_000_000
+
 
 class TestContentCompressor:
     """Unit tests for ContentCompressor"""
 
-    def setup_method(self):
-        self.compressor = ContentCompressor()
+    @classmethod
+    def setup_class(cls):
+        cls.compressor = ContentCompressor()
 
     # --- Unit Tests ---
     def test_compress_normal_text(self):
@@ -32,12 +38,6 @@ class TestContentCompressor:
         decompressed = self.compressor.decompress(b"")
         assert decompressed == ""
 
-    def test_compress_special_characters(self):
-        content = "Special chars: àéîöü 中文 🎉 <html>&amp; \"quotes\" $100"
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
-        assert decompressed == content
-
     def test_compression_ratio(self):
         content = "Repetitive content. " * 100  # Very repetitive = high compression
         compressed = self.compressor.compress(content)
@@ -46,56 +46,79 @@ class TestContentCompressor:
 
     def test_custom_compression_level(self):
         content = "Test content for custom compression level. " * 50
-        compressor_max = ContentCompressor(compression_level=9)
+        compressor_max = ContentCompressor(compression_level=15)
         compressed = compressor_max.compress(content)
         decompressed = compressor_max.decompress(compressed)
         assert decompressed == content
 
+    def test_dictionary_roundtrip_and_legacy_blobs(self):
+        pytest.importorskip("zstandard")
+        from src.services.compressor import train_dictionary, ZSTD_MAGIC
+        samples = [f"Story {i}: the minister said talks on the budget would resume. " * 5 for i in range(200)]
+        compressor_dict = ContentCompressor(dict_data=train_dictionary(samples, dict_size=4096))
+        content = samples[0]
+        compressed = compressor_dict.compress(content)
+        assert compressed.startswith(ZSTD_MAGIC)
+        assert compressor_dict.decompress(compressed) == content
+        # Plain zstd and legacy zlib blobs still decode
+        assert compressor_dict.decompress(self.compressor.compress(content)) == content
+        assert compressor_dict.decompress(zlib.compress(content.encode("utf-8"))) == content
+
+    def test_decompress_bytes_prefix(self):
+        content = "Breaking news about markets and policy. " * 500
+        data = content.encode("utf-8")
+        for blob in (self.compressor.compress(content), zlib.compress(data), data):
+            assert self.compressor.decompress_bytes(blob) == data
+            assert self.compressor.decompress_bytes(blob, 100) == data[:100]
+
     # --- Property-Based Tests ---
-    @given(st.text(min_size=1, max_size=10000))
-    @settings(max_examples=50)
-    def test_roundtrip_property(self, content):
+    # Each example is a batch of payloads, amortizing Hypothesis overhead per call
+    @given(st.lists(st.text(min_size=1, max_size=1000), min_size=10, max_size=10))
+    def test_roundtrip_property(self, contents):
         """Property: compress(decompress(content)) == content (roundtrip)"""
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
-        assert decompressed == content
+        for content in contents:
+            compressed = self.compressor.compress(content)
+            decompressed = self.compressor.decompress(compressed)
+            assert decompressed == content
 
-    @given(st.text(min_size=100, max_size=5000))
-    @settings(max_examples=30)
-    def test_compression_reduces_size(self, content):
+    @given(st.lists(st.text(min_size=100, max_size=1000), min_size=10, max_size=10))
+    def test_compression_reduces_size(self, contents):
         """Property: compressed size should not exceed original + overhead for long text"""
-        compressed = self.compressor.compress(content)
-        original_size = len(content.encode('utf-8'))
-        # Allow for small inflation due to zlib header, but generally should be <= original
-        assert len(compressed) <= original_size * 1.1
+        for content in contents:
+            compressed = self.compressor.compress(content)
+            original_size = len(content.encode('utf-8'))
+            # Allow for small inflation due to frame header, but generally should be <= original
+            assert len(compressed) <= original_size * 1.1
 
 
 class TestCompressionEdgeCases:
     """Edge case tests"""
 
-    def setup_method(self):
-        self.compressor = ContentCompressor()
+    @classmethod
+    def setup_class(cls):
+        cls.compressor = ContentCompressor()
 
     def test_very_long_content(self):
-        content = "A" * 1_000_000  # 1MB of text
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
-        assert decompressed == content
-
-    def test_single_character(self):
-        content = "X"
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
+        content = _64KB_TEXT
+        # A single repeated byte reaches full ratio at any level; the fastest will do
+        compressor_fast = ContentCompressor(compression_level=1)
+        compressed = compressor_fast.compress(content)
+        decompressed = compressor_fast.decompress(compressed)
         assert decompressed == content
 
-    def test_newlines_and_tabs(self):
-        content = "Line 1\nLine 2\n\tTabbed\n\n\nMultiple newlines"
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
+    @pytest.mark.slow
+    def test_very_long_content_1mb(self):
+        content = _MB_TEXT
+        compressor_fast = ContentCompressor(compression_level=1)
+        compressed = compressor_fast.compress(content)
+        decompressed = compressor_fast.decompress(compressed)
         assert decompressed == content
 
-    def test_binary_like_content(self):
-        content = "\x00\x01\x02\x03\xff"
-        compressed = self.compressor.compress(content)
-        decompressed = self.compressor.decompress(compressed)
-        assert decompressed == content
+    @pytest.mark.parametrize("content", [
+        "X",
+        "Line 1\nLine 2\n\tTabbed\n\n\nMultiple newlines",
+        "\x00\x01\x02\x03\xff",
+        "Special chars: àéîöü 中文 🎉 <html>&amp; \"quotes\" $100",
+    ], ids=["single_character", "newlines_and_tabs", "binary_like", "special_characters"])
+    def test_roundtrip(self, content):
+        assert self.compressor.decompress(self.compressor.compress(content)) == content
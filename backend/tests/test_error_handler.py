@@ -44,7 +44,6 @@ class TestRetryWithBackoff:
         with pytest.raises(ValueError, match="permanent error"):
             always_fails()
 
-    @pytest.mark.asyncio
     async def test_async_retry_success(self):
         call_count = 0
 
@@ -58,7 +57,6 @@ class TestRetryWithBackoff:
         assert result == "async_success"
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_async_retry_uses_asyncio_sleep(self):
         """Verify async retry uses non-blocking sleep"""
         call_count = 0
@@ -94,7 +92,6 @@ class TestHandleErrors:
         with pytest.raises(FetchError):
             raises_app_error()
 
-    @pytest.mark.asyncio
     async def test_async_handle_success(self):
         @handle_errors
         async def async_fn():
@@ -1,8 +1,11 @@
 """Tests for Article Fetcher"""
+import asyncio
+import numpy as np
 import pytest
 from unittest.mock import patch, MagicMock
 from datetime import datetime
-from src.services.fetcher import ArticleFetcher
+from src.services.fetcher import ArticleFetcher, has_min_words
+from src.services.rate_limiter import AdaptiveLimiter, MAX_SERVER_PAUSE_SECONDS, retry_after_seconds
 from src.models.article import RawArticle
 
 
@@ -12,14 +15,14 @@ class TestArticleFetcher:
     def setup_method(self):
         self.fetcher = ArticleFetcher(
             rss_feeds=["https://feeds.bbci.co.uk/news/rss.xml"],
-            timeout=5,
+            timeout=0.1,
             max_retries=1,
             min_content_words=10,
         )
 
     def test_initialization(self):
         assert len(self.fetcher.rss_feeds) == 1
-        assert self.fetcher.timeout == 5
+        assert self.fetcher.timeout == 0.1
 
     def test_deduplicate_by_url(self):
         articles = [
@@ -76,28 +79,205 @@ class TestArticleFetcher:
         unique = self.fetcher.deduplicate(articles)
         assert len(unique) == 5
 
+    def test_has_min_words_matches_split(self):
+        for text in ["", "   ", "one", " one two ", "one\ttwo\nthree  ", "a b c d e f"]:
+            for n in range(0, 8):
+                assert has_min_words(text, n) == (len(text.split()) >= n)
+
+    def test_rss_candidates_clean_html(self):
+        feedparser = pytest.importorskip("feedparser")
+        feed = feedparser.parse(
+            b"<?xml version='1.0'?><rss version='2.0'><channel><title>Wire</title>"
+            b"<item><title>Markets rally</title><link>https://example.com/a</link>"
+            b"<description>&lt;p&gt;Stocks &lt;b&gt;rose&lt;/b&gt; today&lt;/p&gt;</description></item>"
+            b"<item><title></title><link>https://example.com/b</link><description>x</description></item>"
+            b"</channel></rss>"
+        )
+        candidates = self.fetcher._rss_candidates(feed, "https://example.com/feed")
+        assert candidates[0]["content"] == "Stocks rose today"
+        assert candidates[0]["source"] == "Wire"
+        articles = self.fetcher._build_articles(candidates)
+        assert [a.url for a in articles] == ["https://example.com/a"]
+
+    def test_feed_titles_and_authors_are_stripped(self):
+        feedparser = pytest.importorskip("feedparser")
+        from src.services.fetcher import _parse_feed
+        body = (
+            b"<?xml version='1.0'?><rss version='2.0'><channel><title>Wire</title><item>"
+            b"<title>&lt;script&gt;alert(1)&lt;/script&gt;Markets &lt;b&gt;rally&lt;/b&gt; &amp;amp; bonds</title>"
+            b"<author>&lt;img src=x onerror=alert(1)&gt;Ann Lee</author>"
+            b"<link>https://example.com/a</link><description>Stocks rose today</description>"
+            b"</item></channel></rss>"
+        )
+        [candidate] = self.fetcher._rss_candidates(_parse_feed(body), "https://example.com/feed")
+        assert candidate["title"] == "Markets rally & bonds"
+        assert candidate["author"] == "Ann Lee"
+
+    def test_clean_html_regex_path_matches_bs4(self):
+        from bs4 import BeautifulSoup
+        snippets = [
+            '<p>Stocks <b>rose</b> today &amp; bonds fell</p><p><a href="x">More</a></p>',
+            "Rates at 3 < 5 percent<br/>for now",
+            "<div><!-- ad --><img src='a.png'/>Caf&eacute; opens</div>",
+        ]
+        for snippet in snippets:
+            expected = BeautifulSoup(snippet, "html.parser").get_text(separator=" ", strip=True)
+            assert self.fetcher._clean_html(snippet) == " ".join(expected.split())
+
+    def test_atom_fast_path_matches_feedparser(self):
+        pytest.importorskip("lxml")
+        feedparser = pytest.importorskip("feedparser")
+        from src.services.fetcher import _feed_kind
+        body = (
+            b'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Wire</title>'
+            b'<entry><title>Markets rally</title><link href="https://example.com/a"/>'
+            b'<published>2024-03-01T12:00:00+02:00</published><author><name>Ann</name></author>'
+            b'<summary type="html">&lt;p&gt;Stocks &lt;b&gt;rose&lt;/b&gt; today&lt;/p&gt;</summary></entry>'
+            b'</feed>'
+        )
+        assert _feed_kind(body) == "feed"
+        fast = self.fetcher._atom_candidates(body, "https://example.com/feed")
+        slow = self.fetcher._rss_candidates(feedparser.parse(body), "https://example.com/feed")
+        assert fast == slow
+        assert fast[0]["published_date"] == datetime(2024, 3, 1, 10, 0)
+
+    async def test_large_malformed_feed_parses_in_pool(self):
+        pytest.importorskip("feedparser")
+        from src.services.fetcher import PROCESS_PARSE_MIN_BYTES, _parse_feed_async, _stop_parse_pool
+        item = (
+            "<item><title>Story {i}</title><link>https://example.com/{i}</link>"
+            "<description>{pad}</description></item>"
+        )
+        pad = "Markets moved on rates news. " * 20
+        body = (
+            "<?xml version='1.0'?><rss version='2.0'><channel><title>Wire & Co</title>"
+            + "".join(item.format(i=i, pad=pad) for i in range(300))
+            + "</channel></rss>"
+        ).encode()
+        assert len(body) >= PROCESS_PARSE_MIN_BYTES
+        try:
+            feed = await _parse_feed_async(body, "application/rss+xml")
+        finally:
+            _stop_parse_pool()
+        assert feed.bozo
+        assert len(feed.entries) == 300
+
+    def test_scrape_skips_host_after_repeated_failures(self):
+        candidates = [{"url": f"https://paywalled.example/{i}", "content": "short"} for i in range(5)]
+        with patch.object(self.fetcher, "_scrape_article_content", return_value="") as scrape:
+            for candidate in candidates:
+                self.fetcher._scrape_candidate(candidate)
+        assert scrape.call_count == 3
+
+    def test_scrape_cache_reuses_pages_across_runs(self):
+        pages = {"https://example.com/a": "full article text", "https://example.com/b": ""}
+        with patch.object(self.fetcher, "_scrape_article_content", side_effect=pages.get) as scrape:
+            for _ in range(2):
+                for url in pages:
+                    self.fetcher._scrape_candidate({"url": url, "content": "short"})
+        # Successful scrapes are served from the cache; failures are retried
+        assert [c.args[0] for c in scrape.call_args_list] == [
+            "https://example.com/a", "https://example.com/b", "https://example.com/b"
+        ]
+
+    def test_seen_articles_skipped_on_later_runs(self, tmp_path):
+        path = str(tmp_path / "seen.bloom")
+        fetcher = ArticleFetcher(min_content_words=1, seen_filter_path=path)
+        stored = RawArticle(
+            url="https://example.com/old", title="Old", content="old story",
+            source="Wire", published_date=datetime.now(),
+        )
+        fetcher.mark_seen([stored])
+
+        # A new fetcher loads the persisted filter
+        fetcher = ArticleFetcher(min_content_words=1, seen_filter_path=path)
+        now = datetime.now()
+        assert fetcher._feed_candidate("Old", stored.url, "old story", "Wire", now, None) is None
+        assert fetcher._feed_candidate("New", "https://example.com/new", "new", "Wire", now, None)
+        # A republished body under a new URL is dropped by content hash
+        moved = RawArticle(
+            url="https://example.com/moved", title="Old", content="old story",
+            source="Wire", published_date=now,
+        )
+        assert fetcher._select([moved], 10) == []
+
+    def test_extract_article_text_prefers_article_paragraphs(self):
+        html = (
+            "<html><body><nav><p>Navigation links that are long enough to count</p></nav>"
+            "<article><p>First paragraph of the actual article body.</p><p>short</p>"
+            "<aside><p>Related stories that are long enough to count</p></aside>"
+            "<p>Second paragraph with <b>bold</b> text inside of it.</p></article></body></html>"
+        ).encode()
+        text = self.fetcher._extract_article_text(html, utf8=True)
+        assert text == (
+            "First paragraph of the actual article body. "
+            "Second paragraph with bold text inside of it."
+        )
+
     def test_fetch_from_web_invalid_url(self):
-        result = self.fetcher.fetch_from_web("https://this-definitely-does-not-exist-12345.com")
+        requests = pytest.importorskip("requests")
+        error = requests.exceptions.ConnectionError("Name or service not known")
+        with patch.object(self.fetcher._http, "get", side_effect=error) as get:
+            result = self.fetcher.fetch_from_web("https://this-definitely-does-not-exist-12345.com")
         assert result is None
+        get.assert_called_once()
+
+
+class TestAdaptiveLimiter:
+    """Unit tests for per-host adaptive concurrency"""
+
+    def test_aimd_limit(self):
+        limiter = AdaptiveLimiter(initial_limit=4, max_limit=8)
+        for _ in range(5):
+            limiter.on_success()
+        assert int(limiter.limit) == 5
+        limiter.on_overload()
+        assert limiter.limit < 3
+
+    def test_retry_after_headers(self):
+        assert retry_after_seconds({"Retry-After": "7"}) == 7.0
+        assert retry_after_seconds({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"}) == 3.0
+        assert retry_after_seconds({"X-RateLimit-Remaining": "5"}) is None
+
+    def test_huge_retry_after_is_capped(self):
+        import time
+        limiter = AdaptiveLimiter()
+        limiter.on_overload(retry_after_seconds({"Retry-After": "86400"}))
+        assert limiter.resume_at - time.monotonic() <= MAX_SERVER_PAUSE_SECONDS
+
+    async def test_slots_cap_concurrency(self):
+        limiter = AdaptiveLimiter(initial_limit=2)
+        peak = 0
+
+        async def request():
+            nonlocal peak
+            async with limiter.slot():
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(request() for _ in range(6)))
+        assert peak == 2
+        assert limiter.in_flight == 0
 
 
 class TestArticleFetcherProperties:
     """Property-based tests for fetcher behavior"""
 
     def test_content_hash_uniqueness(self):
-        """Different content should produce different hashes"""
+        """Different content should produce different hashes, even truncated to 64 bits"""
+        n, now = 10_000, datetime.now()
         articles = [
             RawArticle(
                 url=f"https://example.com/{i}",
                 title=f"Article {i}",
                 content=f"Unique content number {i} that is long enough to pass.",
                 source="Test",
-                published_date=datetime.now(),
+                published_date=now,
             )
-            for i in range(10)
+            for i in range(n)
         ]
-        hashes = {a.content_hash for a in articles}
-        assert len(hashes) == 10
+        hashes = np.fromiter((int(a.content_hash[:16], 16) for a in articles), dtype=np.uint64, count=n)
+        assert np.unique(hashes).size == n
 
     def test_raw_article_content_hash_generation(self):
         """Content hash should be auto-generated"""
@@ -109,4 +289,4 @@ class TestArticleFetcherProperties:
             published_date=datetime.now(),
         )
         assert article.content_hash is not None
-        assert len(article.content_hash) == 64  # SHA-256 hex digest
+        assert len(article.content_hash) == 64  # 256-bit hex digest
@@ -0,0 +1,63 @@
+"""Tests for the processing pipeline"""
+import dataclasses
+from datetime import datetime
+
+import numpy as np
+
+from src.models.article import Article
+from src.services.clusterer import TopicClusterer
+from src.services.pipeline import _recluster
+
+
+def _stored_articles():
+    """Articles as loaded from the store, carrying ingest-time embeddings"""
+    now = datetime.now()
+    rng = np.random.default_rng(0)
+    titles = [
+        "Stock market rallies", "Stock market slips", "Bank raises rates",
+        "Election results announced", "Election polls tighten", "Candidates debate policy",
+    ]
+    return [
+        Article(
+            id=f"a{i}",
+            url=f"https://example.com/{i}",
+            title=title,
+            compressed_content=b"",
+            summary=None,
+            source="Test Source",
+            author=None,
+            published_date=now,
+            fetched_date=now,
+            cluster_id=None,
+            embedding=rng.standard_normal(8).astype(np.float32),
+        )
+        for i, title in enumerate(titles)
+    ]
+
+
+class TestRecluster:
+    """Unit tests for the pipeline's cluster step"""
+
+    def test_second_run_saves_nothing(self):
+        clusterer = TopicClusterer(min_cluster_size=2, min_samples=2)
+        articles = _stored_articles()
+        _, changed = _recluster(clusterer, articles)
+        assert changed
+
+        # A later run reloads the same articles; clustering is not reused
+        clusterer.reset()
+        reloaded = [dataclasses.replace(a) for a in articles]
+        _, changed = _recluster(clusterer, reloaded)
+        assert changed == []
+
+    def test_gained_embedding_is_saved(self):
+        clusterer = TopicClusterer(min_cluster_size=2, min_samples=2)
+        articles = _stored_articles()
+        _recluster(clusterer, articles)
+
+        clusterer.reset()
+        reloaded = [dataclasses.replace(a) for a in articles]
+        reloaded[0].embedding = None
+        clusterer.generate_embeddings = lambda texts: np.ones((len(texts), 8), dtype=np.float32)
+        _, changed = _recluster(clusterer, reloaded)
+        assert "a0" in [a.id for a in changed]
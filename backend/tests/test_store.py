@@ -1,41 +1,150 @@
 """Tests for Article Store (in-memory mode)"""
 import pytest
 import asyncio
+import dataclasses
 from datetime import datetime, timedelta
-import uuid
+import itertools
+import numpy as np
 from src.services.store import ArticleStore
 from src.models.article import Article, QueryFilters
-from src.core.exceptions import ArticleNotFoundError
+from src.core.exceptions import ArticleNotFoundError, DatabaseError
+
+
+# One clock read per module; relative dates are all the tests need
+_NOW = datetime.now()
+
+# Distinct ids and URLs from bound format methods: no os.urandom call per
+# uuid4() and no f-string evaluation per article
+_ids = map("{:032x}".format, itertools.count())
+_urls = map("https://example.com/{:032x}".format, itertools.count())
+
+# Fields every test article shares; _make_article fills in the rest per call
+_TEMPLATE = Article(
+    id="",
+    url="",
+    title="template",
+    compressed_content=b"compressed_content_bytes",
+    summary=None,
+    source="Test Source",
+    author="Test Author",
+    published_date=datetime.min,
+    fetched_date=datetime.min,
+    cluster_id=None,
+)
 
 
 def _make_article(title="Test Article", source="Test Source", days_ago=0, cluster_id=None):
     """Helper to create test articles"""
-    return Article(
-        id=str(uuid.uuid4()),
-        url=f"https://example.com/{uuid.uuid4()}",
+    return dataclasses.replace(
+        _TEMPLATE,
+        id=next(_ids),
+        url=next(_urls),
         title=title,
-        compressed_content=b"compressed_content_bytes",
         summary=f"Summary of {title}",
         source=source,
-        author="Test Author",
-        published_date=datetime.now() - timedelta(days=days_ago),
-        fetched_date=datetime.now(),
+        published_date=_NOW - timedelta(days=days_ago),
+        fetched_date=_NOW,
         cluster_id=cluster_id,
-        content_hash=str(uuid.uuid4()),
+        content_hash=next(_ids),
     )
 
 
-@pytest.fixture
-def store():
+@pytest.fixture(scope="module")
+def _shared_store():
     s = ArticleStore()
     s._use_db = False  # Force in-memory mode for testing
     return s
 
 
+@pytest.fixture
+def store(_shared_store):
+    _shared_store.clear_memory()
+    return _shared_store
+
+
+class _UniqueCollection:
+    """
+    Just enough of a Motor collection for the bulk save path, enforcing the
+    unique url, content_hash and id indexes like MongoDB does
+    """
+    UNIQUE = ("url", "content_hash", "id")
+
+    def __init__(self):
+        self.docs = []
+
+    def _conflicts(self, doc, ignore=None):
+        return any(
+            other is not ignore and other.get(key) == doc.get(key)
+            for other in self.docs for key in self.UNIQUE if key in doc
+        )
+
+    @staticmethod
+    def _raise(errors):
+        from pymongo.errors import BulkWriteError
+        if errors:
+            raise BulkWriteError({"writeErrors": [{"index": i, "code": 11000} for i in errors]})
+
+    async def insert_many(self, docs, ordered=True):
+        errors = []
+        for i, doc in enumerate(docs):
+            if self._conflicts(doc):
+                errors.append(i)
+            else:
+                self.docs.append(dict(doc))
+        self._raise(errors)
+
+    @staticmethod
+    def _matches(doc, query):
+        for key, condition in query.items():
+            value = doc.get(key)
+            if isinstance(condition, dict):
+                if "$in" in condition and value not in condition["$in"]:
+                    return False
+                if "$ne" in condition and value == condition["$ne"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    async def bulk_write(self, updates, ordered=True):
+        errors = []
+        for i, update in enumerate(updates):
+            existing = next((d for d in self.docs if self._matches(d, update._filter)), None)
+            if existing is not None:
+                merged = {**existing, **update._doc["$set"]}
+                if self._conflicts(merged, ignore=existing):
+                    errors.append(i)
+                else:
+                    existing.update(update._doc["$set"])
+            elif update._upsert:
+                doc = {**update._doc["$set"], **update._doc["$setOnInsert"]}
+                if self._conflicts(doc):
+                    errors.append(i)
+                else:
+                    self.docs.append(doc)
+        self._raise(errors)
+
+    async def find_one_and_update(self, query, update, upsert=False, **kwargs):
+        from pymongo import UpdateOne
+        from pymongo.errors import BulkWriteError, DuplicateKeyError
+        try:
+            await self.bulk_write([UpdateOne(query, update, upsert=upsert)])
+        except BulkWriteError:
+            raise DuplicateKeyError("duplicate key", 11000)
+        return await self.find_one(query)
+
+    async def find_one(self, query, projection=None):
+        return next((d for d in self.docs if self._matches(d, query)), None)
+
+    async def find(self, query, projection=None):
+        for doc in list(self.docs):
+            if self._matches(doc, query):
+                yield doc
+
+
 class TestArticleStore:
     """Unit tests for ArticleStore"""
 
-    @pytest.mark.asyncio
     async def test_save_and_retrieve(self, store):
         article = _make_article("Test Article 1")
         article_id = await store.save_article(article)
@@ -44,12 +153,10 @@ class TestArticleStore:
         retrieved = await store.get_article(article_id)
         assert retrieved.title == "Test Article 1"
 
-    @pytest.mark.asyncio
     async def test_get_nonexistent_article(self, store):
         with pytest.raises(ArticleNotFoundError):
             await store.get_article("nonexistent-id")
 
-    @pytest.mark.asyncio
     async def test_query_no_filters(self, store):
         for i in range(5):
             await store.save_article(_make_article(f"Article {i}"))
@@ -58,7 +165,6 @@ class TestArticleStore:
         assert total == 5
         assert len(articles) == 5
 
-    @pytest.mark.asyncio
     async def test_query_by_source(self, store):
         await store.save_article(_make_article("A1", source="BBC"))
         await store.save_article(_make_article("A2", source="CNN"))
@@ -67,7 +173,6 @@ class TestArticleStore:
         articles, total = await store.query_articles(QueryFilters(source="BBC"))
         assert total == 2
 
-    @pytest.mark.asyncio
     async def test_query_by_search_text(self, store):
         await store.save_article(_make_article("AI Technology Breakthrough"))
         await store.save_article(_make_article("Climate Change Report"))
@@ -78,7 +183,17 @@ class TestArticleStore:
         )
         assert total == 2
 
-    @pytest.mark.asyncio
+    async def test_search_text_matches_whole_words_in_title_and_summary(self, store):
+        await store.save_article(_make_article("MAIN street reopens"))
+        summarized = _make_article("Chip makers report earnings")
+        summarized.summary = "Demand for AI accelerators doubled."
+        await store.save_article(summarized)
+
+        articles, total = await store.query_articles(QueryFilters(search_text="ai"))
+        assert [a.id for a in articles] == [summarized.id]
+        _, total = await store.query_articles(QueryFilters(search_text="climate ai"))
+        assert total == 1
+
     async def test_query_by_cluster(self, store):
         await store.save_article(_make_article("A1", cluster_id=1))
         await store.save_article(_make_article("A2", cluster_id=2))
@@ -89,7 +204,40 @@ class TestArticleStore:
         )
         assert total == 2
 
-    @pytest.mark.asyncio
+    def test_embedding_field_roundtrip(self):
+        article = _make_article()
+        article.embedding = np.array([0.25, -1.5, 3.0])
+        raw = ArticleStore._embedding_field(article)
+        assert isinstance(raw, bytes) and len(raw) == 3 * 4
+        assert ArticleStore._embedding_from_field(raw).tolist() == [0.25, -1.5, 3.0]
+        # Documents written before the binary format still load
+        assert ArticleStore._embedding_from_field("[0.25, -1.5, 3.0]").tolist() == [0.25, -1.5, 3.0]
+        assert ArticleStore._embedding_from_field(None) is None
+
+    def test_dates_stored_as_datetimes(self):
+        store = ArticleStore()
+        article = _make_article()
+        article.published_date = "2024-03-01T12:00:00Z"
+        doc = store._to_document(article)
+        assert doc["published_date"] == datetime(2024, 3, 1, 12, 0)
+        doc["fetched_date"] = "2024-03-02T08:30:00"
+        restored = store._to_article(doc)
+        assert restored.published_date == datetime(2024, 3, 1, 12, 0)
+        assert restored.fetched_date == datetime(2024, 3, 2, 8, 30)
+
+    def test_build_query_is_flat(self):
+        date_from, date_to = datetime(2024, 1, 1), datetime(2024, 2, 1)
+        query = ArticleStore._build_query(QueryFilters(
+            source="BBC", date_from=date_from, date_to=date_to, cluster_id=0, search_text="AI"
+        ))
+        assert query == {
+            "source": "BBC",
+            "cluster_id": 0,
+            "published_date": {"$gte": date_from, "$lte": date_to},
+            "$text": {"$search": "AI"},
+        }
+        assert ArticleStore._build_query(QueryFilters()) == {}
+
     async def test_pagination(self, store):
         for i in range(25):
             await store.save_article(_make_article(f"Article {i}"))
@@ -101,7 +249,6 @@ class TestArticleStore:
         page3, _ = await store.query_articles(QueryFilters(), page=3, page_size=10)
         assert len(page3) == 5
 
-    @pytest.mark.asyncio
     async def test_archive_old_articles(self, store):
         await store.save_article(_make_article("Recent", days_ago=5))
         await store.save_article(_make_article("Old", days_ago=45))
@@ -113,13 +260,11 @@ class TestArticleStore:
         count = await store.count_articles()
         assert count == 1
 
-    @pytest.mark.asyncio
     async def test_count_articles(self, store):
         assert await store.count_articles() == 0
         await store.save_article(_make_article("A1"))
         assert await store.count_articles() == 1
 
-    @pytest.mark.asyncio
     async def test_get_articles_by_cluster(self, store):
         await store.save_article(_make_article("A1", cluster_id=5))
         await store.save_article(_make_article("A2", cluster_id=5))
@@ -127,3 +272,204 @@ class TestArticleStore:
 
         articles = await store.get_articles_by_cluster(5)
         assert len(articles) == 2
+
+    async def test_save_articles_batch(self, store):
+        articles = [_make_article(f"Batch {i}") for i in range(3)]
+        ids = await store.save_articles(articles)
+        assert ids == [a.id for a in articles]
+        assert await store.count_articles() == 3
+
+    async def test_save_cluster_assignments(self, store):
+        articles = [_make_article(f"Assigned {i}") for i in range(3)]
+        await store.save_articles(articles)
+        for article in articles:
+            article.cluster_id = 4
+        await store.save_cluster_assignments(articles)
+        assert len(await store.get_articles_by_cluster(4)) == 3
+
+    async def test_indexed_queries_match_full_scan(self, store):
+        sources, now = ["BBC", "CNN", "Wire"], _NOW
+        articles = [
+            _make_article(f"Story {i} {'AI' if i % 3 == 0 else 'news'}",
+                          source=sources[i % 3], days_ago=i % 7, cluster_id=i % 4 or None)
+            for i in range(40)
+        ]
+        await store.save_articles(articles)
+        # Reassigned and archived articles must leave their old index slots
+        articles[0].cluster_id = 2
+        await store.save_cluster_assignments([articles[0]])
+        await store.archive_old_articles(days=6)
+        live = await store.get_all_articles()
+        assert 0 < len(live) < len(articles)
+
+        cases = [
+            QueryFilters(),
+            QueryFilters(source="CNN"),
+            QueryFilters(cluster_id=2, source="BBC"),
+            QueryFilters(date_from=now - timedelta(days=4), date_to=now - timedelta(days=1)),
+            QueryFilters(source="Wire", search_text="ai", date_to=now - timedelta(days=2)),
+        ]
+        for filters in cases:
+            expected = sorted(
+                (a for a in live
+                 if (not filters.source or a.source == filters.source)
+                 and (filters.cluster_id is None or a.cluster_id == filters.cluster_id)
+                 and (not filters.date_from or a.published_date >= filters.date_from)
+                 and (not filters.date_to or a.published_date <= filters.date_to)
+                 and (not filters.search_text or filters.search_text in a.title.lower().split())),
+                key=lambda a: a.published_date, reverse=True,
+            )
+            page, total = await store.query_articles(filters, page=2, page_size=3)
+            assert total == len(expected)
+            assert [a.id for a in page] == [a.id for a in expected[3:6]]
+
+    async def test_query_article_rows_match_articles(self, store):
+        await store.save_articles([_make_article(f"Story {i}", days_ago=i) for i in range(5)])
+        fields = ("id", "title", "published_date")
+        rows, total = await store.query_article_rows(QueryFilters(), page=2, page_size=2, fields=fields)
+        articles, expected_total = await store.query_articles(QueryFilters(), page=2, page_size=2)
+        assert total == expected_total == 5
+        assert rows == [{f: getattr(a, f) for f in fields} for a in articles]
+
+    async def test_query_articles_page_reports_has_more(self, store):
+        await store.save_articles([_make_article(f"Story {i}", days_ago=i) for i in range(5)])
+        first, more = await store.query_articles_page(QueryFilters(), page=1, page_size=3)
+        last, no_more = await store.query_articles_page(QueryFilters(), page=2, page_size=3)
+        assert [a.title for a in first] == ["Story 0", "Story 1", "Story 2"]
+        assert more is True
+        assert [a.title for a in last] == ["Story 3", "Story 4"]
+        assert no_more is False
+
+    async def test_query_articles_page_keyset_cursor(self, store):
+        articles = [_make_article(f"Story {i}", days_ago=i // 2) for i in range(7)]
+        # Pairs share a published_date, so page boundaries fall on ties
+        for earlier, later in zip(articles[::2], articles[1::2]):
+            later.published_date = earlier.published_date
+        await store.save_articles(articles)
+        expected, _ = await store.query_articles(QueryFilters(), page=1, page_size=10)
+
+        seen, after, more = [], None, True
+        while more:
+            page, more = await store.query_articles_page(
+                QueryFilters(), page_size=2,
+                after_date=after and after.published_date, after_id=after and after.id,
+            )
+            seen.extend(page)
+            after = page[-1]
+        assert [a.id for a in seen] == [a.id for a in expected]
+
+    async def test_iter_all_articles_newest_first(self, store):
+        await store.save_articles([
+            _make_article("Old", source="BBC", days_ago=3),
+            _make_article("New", source="CNN", days_ago=0),
+            _make_article("Mid", source="BBC", days_ago=1),
+        ])
+        assert [a.title async for a in store.iter_all_articles()] == ["New", "Mid", "Old"]
+        assert [a.title for a in await store.get_all_articles(limit=2)] == ["New", "Mid"]
+        assert sorted(await store.get_sources()) == ["BBC", "CNN"]
+
+    async def test_bulk_resave_keeps_stored_ids(self):
+        pytest.importorskip("pymongo")
+        db_store = ArticleStore()
+        db_store._use_db = True
+        db_store._collection = collection = _UniqueCollection()
+
+        original = _make_article("Original")
+        await db_store.save_articles([original])
+        stored_id = original.id
+
+        updated = dataclasses.replace(original, id="", title="Updated")
+        republished = dataclasses.replace(original, id="", url="https://example.com/elsewhere")
+        fresh = _make_article("Fresh")
+        ids = await db_store.save_articles([updated, republished, fresh])
+
+        # The known URL is updated in place and the republished copy is dropped,
+        # both keeping the stored public id; nothing fell back to memory
+        assert ids == [stored_id, stored_id, fresh.id]
+        assert sorted(d["title"] for d in collection.docs) == ["Fresh", "Updated"]
+        assert all(d["id"] in (stored_id, fresh.id) for d in collection.docs)
+        assert not db_store._memory_articles
+
+    async def test_persist_articles_reports_memory_fallback(self):
+        pytest.importorskip("pymongo")
+        db_store = ArticleStore()
+        db_store._use_db = True
+        db_store._collection = collection = _UniqueCollection()
+        assert await db_store.persist_articles([_make_article("Stored")]) is True
+
+        async def outage(docs, ordered=True):
+            raise ConnectionError("primary unreachable")
+
+        collection.insert_many = outage
+        article = _make_article("Memory only")
+        assert await db_store.persist_articles([article]) is False
+        assert article.id in db_store._memory_articles
+
+    async def test_single_and_bulk_saves_share_upsert(self):
+        pytest.importorskip("pymongo")
+        db_store = ArticleStore()
+        db_store._use_db = True
+        db_store._collection = collection = _UniqueCollection()
+
+        original = _make_article("Original")
+        await db_store.save_articles([original])
+        assert await db_store.save_article(dataclasses.replace(original, id="", title="Updated")) == original.id
+        republished = dataclasses.replace(original, id="", url="https://example.com/elsewhere")
+        assert await db_store.save_article(republished) == original.id
+        assert [(d["id"], d["title"]) for d in collection.docs] == [(original.id, "Updated")]
+        assert not db_store._memory_articles
+
+    async def test_migrate_content_hashes_rehashes_legacy_rows(self):
+        pytest.importorskip("pymongo")
+        import hashlib
+        from src.models.article import CONTENT_HASH_ALGORITHM, content_digest
+        db_store = ArticleStore()
+        db_store._use_db = True
+        db_store._collection = collection = _UniqueCollection()
+
+        # A row written before the algorithm was recorded: raw body, SHA-256 hash
+        body = b"Republished story body"
+        legacy = db_store._to_document(_make_article("Legacy"))
+        legacy.update(_id=1, compressed_content=body, content_hash=hashlib.sha256(body).hexdigest())
+        del legacy["content_hash_algorithm"]
+        collection.docs.append(legacy)
+
+        assert await db_store.migrate_content_hashes(lambda compressed: compressed) == 1
+        assert legacy["content_hash"] == content_digest(body)
+        assert legacy["content_hash_algorithm"] == CONTENT_HASH_ALGORITHM
+        # Already migrated rows are not matched again
+        assert await db_store.migrate_content_hashes(lambda compressed: compressed) == 0
+
+    async def test_iter_all_articles_fails_loudly_after_partial_scan(self):
+        class _DroppedCursor:
+            """A cursor whose connection drops after the first document"""
+            def __init__(self, docs):
+                self._docs = docs
+
+            def sort(self, *args):
+                return self
+
+            def batch_size(self, n):
+                return self
+
+            async def __aiter__(self):
+                yield self._docs[0]
+                raise ConnectionError("cursor lost")
+
+        class _Collection:
+            def __init__(self, docs):
+                self._docs = docs
+
+            def find(self):
+                return _DroppedCursor(self._docs)
+
+        db_store = ArticleStore()
+        db_store._use_db = True
+        db_store._memory_put(_make_article("Memory only"))
+        db_store._collection = _Collection([db_store._to_document(_make_article("Stored"))])
+
+        seen = []
+        with pytest.raises(DatabaseError):
+            async for article in db_store.iter_all_articles():
+                seen.append(article.title)
+        assert seen == ["Stored"]
@@ -1,8 +1,13 @@
 """Tests for Summarizer"""
 import pytest
-from hypothesis import given, strategies as st, settings
 from src.services.summarizer import Summarizer
 
+# Adversarial inputs for the summarizer properties
+SHORT_ASCII = "Markets rallied on Friday."
+LONG_ASCII_REPEATED = "Officials said the talks would resume next week. " * 60
+# One endless "sentence" with irregular whitespace and no ". " breaks
+MIXED_WHITESPACE = "word\t" * 150 + "\n\n  more   words\r\nhere " * 40
+
 
 class TestSummarizer:
     """Unit tests for Summarizer"""
@@ -33,6 +38,60 @@ class TestSummarizer:
         summary = self.summarizer._extractive_summarize(content)
         assert len(summary) > 0
 
+    def test_model_summaries_are_cached(self, monkeypatch):
+        import src.services.summarizer as summarizer_module
+        monkeypatch.setattr(summarizer_module, "_model", object())
+        monkeypatch.setattr(summarizer_module, "_tokenizer", object())
+        self.summarizer._model_loaded = True
+        calls = []
+
+        def fake_batch(texts):
+            calls.append(len(texts))
+            return [f"summary {len(t)}" for t in texts]
+
+        monkeypatch.setattr(self.summarizer, "_ai_summarize_batch", fake_batch)
+        long_a, long_b = "alpha word " * 60, "beta word " * 70
+        first = self.summarizer.batch_summarize([long_a, long_b])
+        # Repeats are served from the cache, in batch and single calls alike
+        assert self.summarizer.batch_summarize([long_b, long_a]) == first[::-1]
+        assert self.summarizer.summarize(long_a) == first[0]
+        assert calls == [2]
+
+    def test_warm_up_drops_failing_compiled_forward(self, monkeypatch):
+        torch = pytest.importorskip("torch")
+        import src.services.summarizer as summarizer_module
+
+        class StubTokenizer:
+            def __call__(self, texts, **kwargs):
+                ids = torch.ones((len(texts), 4), dtype=torch.long)
+                return {"input_ids": ids, "attention_mask": torch.ones_like(ids)}
+
+        class StubModel:
+            def __init__(self):
+                self.generate_calls = 0
+
+            def forward(self, input_ids):
+                return input_ids
+
+            def generate(self, input_ids, **kwargs):
+                self.generate_calls += 1
+                return self.forward(input_ids)
+
+        def compiled_forward(input_ids):
+            raise RuntimeError("compile failed")
+
+        model = StubModel()
+        model.forward = compiled_forward
+        monkeypatch.setattr(summarizer_module, "_model", model)
+        monkeypatch.setattr(summarizer_module, "_tokenizer", StubTokenizer())
+        self.summarizer._model_loaded = True
+
+        self.summarizer.warm_up()
+        # Compiled forward failed, was dropped, and the eager retry ran
+        assert "forward" not in vars(model)
+        assert model.generate_calls == 2
+        assert not self.summarizer._summary_cache
+
     def test_batch_summarize(self):
         contents = [
             "Article one content with enough words to make it valid for testing summarization. " * 5,
@@ -42,6 +101,12 @@ class TestSummarizer:
         assert len(summaries) == 2
         assert all(len(s) > 0 for s in summaries)
 
+    async def test_async_summarize_matches_sync(self):
+        content = "Threaded summaries keep the event loop free for requests. " * 10
+        assert await self.summarizer.asummarize(content) == self.summarizer.summarize(content)
+        assert await self.summarizer.abatch_summarize([content, "Short."]) == \
+            self.summarizer.batch_summarize([content, "Short."])
+
 
 class TestSummarizerProperties:
     """Property-based tests for summarizer"""
@@ -49,19 +114,14 @@ class TestSummarizerProperties:
     def setup_method(self):
         self.summarizer = Summarizer(max_length=100)
 
-    @given(st.text(min_size=500, max_size=2000, alphabet=st.characters(whitelist_categories=('L', 'Z'))))
-    @settings(max_examples=20)
+    @pytest.mark.parametrize("content", [SHORT_ASCII, LONG_ASCII_REPEATED, MIXED_WHITESPACE])
     def test_summary_length_constraint(self, content):
         """Property: Summary word count should not exceed max_length"""
-        if content.strip():
-            summary = self.summarizer._extractive_summarize(content)
-            word_count = len(summary.split())
-            assert word_count <= 105  # max_length + small margin for sentence boundaries
+        summary = self.summarizer._extractive_summarize(content)
+        word_count = len(summary.split())
+        assert word_count <= 105  # max_length + small margin for sentence boundaries
 
-    @given(st.text(min_size=1, max_size=100, alphabet=st.characters(whitelist_categories=('L', 'Z'))))
-    @settings(max_examples=20)
+    @pytest.mark.parametrize("content", [SHORT_ASCII, "x", "  padded\tshort text \n"])
     def test_short_content_passthrough(self, content):
         """Property: Content shorter than max_length should pass through"""
-        if content.strip():
-            summary = self.summarizer.summarize(content)
-            assert len(summary) > 0
+        assert self.summarizer.summarize(content) == content